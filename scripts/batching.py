@@ -0,0 +1,97 @@
+"""
+섹션 일괄 요청
+==============
+한 섹션의 프롬프트 작업들을 Gemini 요청 하나로 묶습니다 (--batch).
+여러 프롬프트에 반복해서 들어가던 원본 요약은 "공통 데이터"로 한 번만 보내고,
+응답은 JSON 스키마(작업 ID → 행 배열)로 받아 기존 파일명별 CSV로 나눕니다.
+
+    {
+      "01_kpi_cards": [{"id": "1", "icon": "📊", ...}, ...],
+      "02_key_findings": [...]
+    }
+
+각 작업의 컬럼은 프롬프트 마지막 ```csv 출력 예시의 헤더를 그대로 씁니다.
+"""
+
+import json
+import re
+from pathlib import Path
+
+TASK_MARKER = "### 작업: "
+
+
+def task_id(job):
+    """작업 ID (출력 파일명에서 확장자를 뺀 것, 예: 01_kpi_cards)"""
+    return Path(job['output']).stem
+
+
+def example_columns(prompt):
+    """프롬프트의 마지막 ```csv 출력 예시 헤더"""
+    blocks = re.findall(r'```csv\s*(.*?)\s*```', prompt, re.DOTALL)
+    if not blocks:
+        return []
+    header = blocks[-1].strip().split('\n', 1)[0]
+    return [column.strip() for column in header.split(',') if column.strip()]
+
+
+def response_schema(jobs):
+    """작업 ID → 행 객체 배열 스키마 (모든 값은 문자열)"""
+    properties = {}
+    for job in jobs:
+        columns = example_columns(job['prompt'])
+        properties[task_id(job)] = {
+            'type': 'ARRAY',
+            'items': {
+                'type': 'OBJECT',
+                'properties': {column: {'type': 'STRING'} for column in columns},
+                'required': columns,
+            },
+        }
+    return {'type': 'OBJECT', 'properties': properties, 'required': list(properties)}
+
+
+def build_batch_prompt(section_name, jobs, digests):
+    """작업 여러 개 → 요청 하나
+
+    digests: 프롬프트들에 들어간 원본 요약 텍스트 (긴 것부터 공통 데이터로 빼냄)
+    """
+    shared = [text for text in sorted(set(digests), key=len, reverse=True)
+              if any(text in job['prompt'] for job in jobs)]
+    labels = {text: f"[공통 데이터 {i}]" for i, text in enumerate(shared, 1)}
+
+    parts = [
+        f"SNF 대시보드 '{section_name}' 섹션의 CSV {len(jobs)}개를 한 번에 만들어주세요.",
+        "결과는 JSON 객체 하나로만 출력하세요. 키는 작업 ID, 값은 행 객체 배열이며,",
+        "각 행의 키는 해당 작업의 CSV 예시 헤더와 똑같아야 합니다. 값은 모두 문자열로 적어주세요.",
+        "",
+        "# 공통 데이터",
+    ]
+    for text in shared:
+        parts.extend([f"## {labels[text]}", text, ""])
+    for job in jobs:
+        prompt = job['prompt']
+        for text in shared:
+            prompt = prompt.replace(text, f"{labels[text]} 참고")
+        parts.extend([f"{TASK_MARKER}{task_id(job)} ({job['output']})", prompt.strip(), ""])
+    return '\n'.join(parts)
+
+
+def split_batch_response(response_text, jobs):
+    """JSON 응답 → {출력 경로: 행 목록} (누락되거나 형식이 틀린 작업은 빠짐)"""
+    text = (response_text or '').strip()
+    fenced = re.search(r'```(?:json)?\s*(.*?)\s*```', text, re.DOTALL)
+    if fenced:
+        text = fenced.group(1)
+    try:
+        data = json.loads(text)
+    except ValueError:
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    results = {}
+    for job in jobs:
+        rows = data.get(task_id(job))
+        if isinstance(rows, list) and rows and all(isinstance(row, dict) for row in rows):
+            results[job['output']] = [{key: '' if value is None else str(value) for key, value in row.items()}
+                                      for row in rows]
+    return results
@@ -0,0 +1,15 @@
+"""
+SNF 파이프라인 벤치마크
+=======================
+합성 원본 데이터(50 ~ 1,000,000행)로 원본 로드, 통계 계산, 응답 파싱, CSV 저장의 시간과 메모리를 잽니다.
+결과는 커밋마다 benchmarks/results/<커밋>.json에 저장하고 직전 커밋 결과와 비교해 느려진 항목을 표시합니다.
+
+    synthetic.py   RAW_DATA_GUIDE.md 형식의 합성 노션 CSV 생성
+    suite.py       벤치마크 목록과 측정 (시간: 반복 중 최솟값, 메모리: tracemalloc 최대 할당량)
+    __main__.py    실행 / 저장 / 비교
+
+사용법 (scripts/ 에서):
+    python -m benchmarks                          # 기본 규모 50, 1000, 10000, 100000
+    python -m benchmarks --scales 50,1000000      # 100만 행까지
+    python -m benchmarks --only calculate_stats,parse_response --no-save
+"""
@@ -0,0 +1,140 @@
+"""
+벤치마크 실행 / 결과 저장 / 직전 결과와 비교
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from run_report import fit
+
+from benchmarks.suite import BENCHMARKS, run_scale
+from benchmarks.synthetic import write_raw_exports
+
+RESULTS_DIR = Path(__file__).parent / "results"
+DEFAULT_SCALES = (50, 1_000, 10_000, 100_000)
+MAX_SCALE = 1_000_000
+REGRESSION_RATIO = 1.25   # 직전 결과보다 이 배수 이상 느리거나 메모리를 더 쓰면 표시
+LARGE_SCALE = 100_000     # 이 이상은 1회만 측정
+NOISE_SECONDS = 0.005     # 이보다 짧은 측정은 흔들림이 커서 느려짐으로 표시하지 않음
+
+
+def git_commit():
+    """(짧은 커밋 해시, 커밋 안 된 변경 여부) — git이 없으면 ('unknown', False)"""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                cwd=Path(__file__).parent, check=True).stdout.strip()
+        status = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], capture_output=True,
+                                text=True, cwd=Path(__file__).parent, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown", False
+    return commit, bool(status)
+
+
+def previous_result(results_dir, commit):
+    """다른 커밋의 가장 최근 결과 (없으면 None)"""
+    results = []
+    for path in Path(results_dir).glob("*.json"):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                result = json.load(f)
+        except (OSError, ValueError):
+            continue
+        if result.get('commit') != commit:
+            results.append(result)
+    return max(results, key=lambda r: r['date'], default=None)
+
+
+def change(current, previous, floor=0.0):
+    if not previous:
+        return ""
+    ratio = current / previous
+    flag = " ⚠️" if ratio >= REGRESSION_RATIO and current >= floor else ""
+    return f"{ratio:>6.2f}x{flag}"
+
+
+def print_results(result, previous=None):
+    base = previous['scales'] if previous else {}
+    if previous:
+        print(f"\n📊 비교 기준: {previous['commit']} ({previous['date']})")
+    print("\n   " + fit('규모', 9) + "  " + fit('벤치마크', 28, right=False) + "".join(
+        fit(title, width) for title, width in (('시간(초)', 11), ('메모리(MB)', 12), ('시간 변화', 11), ('메모리 변화', 12))))
+    regressions = 0
+    for scale, benches in result['scales'].items():
+        for name, current in benches.items():
+            old = base.get(scale, {}).get(name, {})
+            time_change = change(current['seconds'], old.get('seconds'), NOISE_SECONDS)
+            memory_change = change(current['peak_mb'], old.get('peak_mb')) if 'peak_mb' in current else ""
+            regressions += "⚠️" in time_change + memory_change
+            peak = f"{current['peak_mb']:>12.2f}" if 'peak_mb' in current else f"{'-':>12}"
+            print(f"   {int(scale):>9,}  {name:<28}{current['seconds']:>11.4f}{peak}{time_change:>11}{memory_change:>12}")
+    if regressions:
+        print(f"\n   ⚠️ {regressions}개 항목이 직전 결과보다 {REGRESSION_RATIO}배 이상 나빠졌습니다.")
+    return regressions
+
+
+def parse_scales(text):
+    scales = [int(value.replace('_', '')) for value in text.split(',') if value.strip()]
+    for scale in scales:
+        if not 1 <= scale <= MAX_SCALE:
+            raise argparse.ArgumentTypeError(f"규모는 1 ~ {MAX_SCALE:,}행이어야 합니다: {scale}")
+    return scales
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="SNF 파이프라인 벤치마크")
+    parser.add_argument("--scales", type=parse_scales, default=list(DEFAULT_SCALES),
+                        help="쉼표로 구분한 행 수 (기본: 50,1000,10000,100000, 최대 1000000)")
+    parser.add_argument("--only", help="실행할 벤치마크 (쉼표 구분): " + ", ".join(BENCHMARKS))
+    parser.add_argument("--repeat", type=int, default=3, help=f"반복 측정 횟수 ({LARGE_SCALE:,}행 이상은 1회)")
+    parser.add_argument("--no-memory", action="store_true", help="tracemalloc 메모리 측정 생략")
+    parser.add_argument("--seed", type=int, default=0, help="합성 데이터 시드")
+    parser.add_argument("--results-dir", type=Path, default=RESULTS_DIR, help="결과 저장 위치")
+    parser.add_argument("--no-save", action="store_true", help="결과를 저장하지 않고 비교만")
+    args = parser.parse_args(argv)
+
+    names = [name.strip() for name in args.only.split(',')] if args.only else list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        print(f"❌ 없는 벤치마크: {', '.join(unknown)} (가능: {', '.join(BENCHMARKS)})")
+        return 1
+
+    commit, dirty = git_commit()
+    result = {
+        'commit': commit,
+        'dirty': dirty,
+        'date': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'seed': args.seed,
+        'scales': {},
+    }
+    print(f"⏱️ 벤치마크: 커밋 {commit}{' (수정됨)' if dirty else ''}, 규모 {', '.join(f'{s:,}' for s in args.scales)}")
+    for scale in args.scales:
+        with tempfile.TemporaryDirectory() as tmp:
+            raw_dir, work_dir = Path(tmp) / "raw", Path(tmp) / "work"
+            work_dir.mkdir()
+            started = time.perf_counter()
+            counts = write_raw_exports(raw_dir, scale, args.seed)
+            print(f"   🧪 {scale:,}행 합성 데이터 ({sum(counts.values()):,}행, {time.perf_counter() - started:.1f}초)")
+            repeat = 1 if scale >= LARGE_SCALE else args.repeat
+            result['scales'][str(scale)] = run_scale(raw_dir, work_dir, names, repeat, not args.no_memory)
+
+    previous = previous_result(args.results_dir, commit)
+    print_results(result, previous)
+    if not args.no_save:
+        args.results_dir.mkdir(parents=True, exist_ok=True)
+        path = args.results_dir / f"{commit}{'-dirty' if dirty else ''}.json"
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=1)
+        print(f"\n💾 결과 저장: {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,144 @@
+"""
+벤치마크 목록
+=============
+각 벤치마크는 (합성 원본 폴더, 작업 폴더, 공유 상태) → 시간을 잴 함수를 돌려줍니다.
+준비 작업(합성 데이터 로드 등)은 시간에 포함하지 않습니다.
+
+    load_all_raw_data            원본 CSV 8개 파싱 (스냅샷 없이)
+    load_all_raw_data_snapshot   같은 파일을 스냅샷(.pickle)에서 로드
+    calculate_stats              정규화 3종 + snf_stats.compute_stats (verify_and_generate.calculate_stats)
+    chart_rows                   차트 기록에서 계산하는 로컬 CSV 행 (03_charts 03/05~07/10)
+    rank_metrics                 차트 기록 → 게임 × 차트 × 날짜 순위 행렬 + 3종 차트 추세 지표 (rank_series)
+    resolve_names                URL 컬럼 4개 + 차트 게임명 컬럼을 게임 카탈로그로 일괄 변환 (조회 기록 없이 시작)
+    parse_response               rows행짜리 Gemini 응답 → csv_schema.parse_response
+    save_csv                     rows행 CSV 저장
+"""
+
+import contextlib
+import io
+import time
+import tracemalloc
+
+import snf_stats
+from csv_schema import SCHEMAS, parse_response
+from game_catalog import GameCatalog, load_catalog
+from rank_series import RankMatrix
+from generate_insights import (DEMO_CHART_COLUMNS, POPULAR_CHART_COLUMNS, TRENDING_CHART_COLUMNS,
+                               load_all_raw_data, save_csv)
+from snf_dataset import load_dataset
+
+PARSE_SCHEMA = '02_top_games/05_top50_table.csv'
+
+
+def quiet(func):
+    """진행 상황 print를 버리고 실행 (로드 함수가 파일마다 출력함)"""
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            return func()
+    return run
+
+
+def normalized(state):
+    tables = state['dataset']
+    return (snf_stats.normalize_top10_evaluation(tables['top10_evaluation']),
+            snf_stats.normalize_top50_games(tables['top50_games']),
+            snf_stats.normalize_chart_entries(tables['chart_integration']))
+
+
+def bench_load(raw_dir, work_dir, state):
+    return quiet(lambda: load_all_raw_data(None, dataset=load_dataset(raw_dir)))
+
+
+def bench_load_snapshot(raw_dir, work_dir, state):
+    snapshot = work_dir / "dataset.pickle"
+    load_dataset(raw_dir, snapshot)   # 스냅샷 생성 (시간 제외)
+    return quiet(lambda: load_all_raw_data(None, dataset=load_dataset(raw_dir, snapshot)))
+
+
+def bench_calculate_stats(raw_dir, work_dir, state):
+    return lambda: snf_stats.compute_stats(*normalized(state))
+
+
+def bench_chart_rows(raw_dir, work_dir, state):
+    chart_data = normalized(state)[2]
+
+    def run():
+        index = snf_stats.as_chart_index(chart_data)
+        rows = snf_stats.chart_data_rows(index) + snf_stats.daily_activity_rows(index)
+        for chart_type, columns in zip(snf_stats.CHART_TYPES,
+                                       (DEMO_CHART_COLUMNS, POPULAR_CHART_COLUMNS, TRENDING_CHART_COLUMNS)):
+            rows += snf_stats.chart_detail_rows(index, chart_type, columns)
+        return rows
+    return run
+
+
+def bench_rank_metrics(raw_dir, work_dir, state):
+    index = snf_stats.as_chart_index(normalized(state)[2])
+
+    def run():
+        matrix = RankMatrix(index.entries())
+        return [matrix.metrics(chart_type) for chart_type in snf_stats.CHART_TYPES]
+    return run
+
+
+def bench_resolve_names(raw_dir, work_dir, state):
+    tables = state['dataset']
+    columns = [tables[key]['url'] for key in ('top10_evaluation', 'top50_games', 'report_page', 'popular_demo')]
+    columns.append(tables['chart_integration']['game'])
+    games = list(load_catalog())
+
+    def run():
+        catalog = GameCatalog(games)
+        return [catalog.resolve_column(column) for column in columns]
+    return run
+
+
+def bench_parse_response(raw_dir, work_dir, state):
+    rows = snf_stats.top50_table_rows(normalized(state)[1], limit=None)
+    buffer = io.StringIO()
+    buffer.write(','.join(rows[0]) + '\n')
+    for row in rows:
+        buffer.write(','.join(f'"{value}"' if ',' in str(value) else str(value) for value in row.values()) + '\n')
+    text = f"다음은 요청하신 표입니다.\n```csv\n{buffer.getvalue()}```\n"
+    return lambda: parse_response(text, SCHEMAS[PARSE_SCHEMA])
+
+
+def bench_save_csv(raw_dir, work_dir, state):
+    rows = snf_stats.top50_table_rows(normalized(state)[1], limit=None)
+    return quiet(lambda: save_csv(rows, work_dir / "save_csv.csv"))
+
+
+BENCHMARKS = {
+    'load_all_raw_data': bench_load,
+    'load_all_raw_data_snapshot': bench_load_snapshot,
+    'calculate_stats': bench_calculate_stats,
+    'chart_rows': bench_chart_rows,
+    'rank_metrics': bench_rank_metrics,
+    'resolve_names': bench_resolve_names,
+    'parse_response': bench_parse_response,
+    'save_csv': bench_save_csv,
+}
+
+
+def measure(func, repeat=3, memory=True):
+    """repeat회 중 가장 빠른 시간(초) + tracemalloc으로 잰 최대 할당량(MB, 별도 1회)"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    result = {'seconds': round(min(times), 6)}
+    if memory:
+        tracemalloc.start()
+        try:
+            func()
+            result['peak_mb'] = round(tracemalloc.get_traced_memory()[1] / 2**20, 3)
+        finally:
+            tracemalloc.stop()
+    return result
+
+
+def run_scale(raw_dir, work_dir, names, repeat=3, memory=True):
+    """한 규모에서 벤치마크들 실행 → {이름: {seconds, peak_mb}}"""
+    state = {'dataset': load_dataset(raw_dir)}
+    return {name: measure(BENCHMARKS[name](raw_dir, work_dir, state), repeat, memory) for name in names}
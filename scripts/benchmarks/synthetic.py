@@ -0,0 +1,131 @@
+"""
+합성 원본 데이터
+================
+RAW_DATA_GUIDE.md의 노션 CSV 8개와 같은 헤더/값 형식으로 원하는 행 수의 원본 폴더를 만듭니다.
+TOP10 종합 평가, TOP50, 3종 차트 통합 기록은 rows행으로 늘리고,
+나머지 파일은 같은 게임을 가리키도록 그에 맞춰 만듭니다 (일자별 차트 3개 = 통합 기록을 차트별로 나눈 것).
+
+같은 (rows, seed)면 항상 같은 파일이 나옵니다.
+"""
+
+import csv
+import random
+from datetime import date, timedelta
+from pathlib import Path
+
+START_DATE = date(2025, 6, 10)
+CHART_TYPES = ['인기 체험판', '인기 출시 예정 게임', '떠오르는 출시 예정 게임']
+RANKS_PER_CHART = 10
+FIRST_APP_ID = 3_000_000
+
+REVIEWS = ['압도적 긍정', '매우 긍정적', '긍정적', '대체로 긍정적', '복합적', '확인불가']
+REVIEW_LANGS = ['간체, 영어, 한국어', '영어, 간체', '한국어, 영어', '번체, 간체, 영어, 일본어']
+GENRES = ['액션 RPG', '슈팅', '로그라이크', '공포', '시뮬레이션', '전략', '액션', '퍼즐']
+RELEASES = ['2025년', '출시예정', '2025.07.23', '2026년']
+LANGUAGES = ['영어', '한국어', '일본어', '중국어 간체', '중국어 번체', '러시아어', '프랑스어', '독일어']
+TAGS = ['Action', 'RPG', 'Indie', 'Multiplayer', 'Singleplayer', 'Horror', 'Roguelike', 'FPS',
+        'Co-op', 'Open World', 'Strategy', 'Survival']
+COMMUNITIES = ['Discord, YouTube, X', 'Discord', 'YouTube, X', '지원 안함']
+NAME_WORDS = ['스텔라', '블레이드', '와일드', '게이트', 'Moon', 'Ship', '레벨업', 'Empire', '던전', 'Night']
+
+FILE_NAMES = {
+    "top10_evaluation": "TOP10 게임 종합 평가 bench.csv",
+    "top10_chart_count": "TOP10 차트인 횟수 bench.csv",
+    "top50_games": "가장 많이 플레이한 TOP50 게임 bench.csv",
+    "report_page": "결산 페이지 bench.csv",
+    "trending_upcoming": "떠오르는 출시 예정 게임 bench.csv",
+    "popular_demo": "인기 체험판 bench.csv",
+    "popular_upcoming": "인기 출시 예정 게임 bench.csv",
+    "chart_integration": "전체 장르 - 각 게임별 SNF기간 3종 차트인 횟수 bench.csv",
+}
+DAILY_FILES = {"popular_demo": CHART_TYPES[0], "popular_upcoming": CHART_TYPES[1],
+               "trending_upcoming": CHART_TYPES[2]}
+
+
+def app_url(index):
+    return f"https://store.steampowered.com/app/{FIRST_APP_ID + index}"
+
+
+def korean_date(day):
+    return f"{day.year}년 {day.month}월 {day.day}일"
+
+
+def game_names(count, rng):
+    """차트 기록용 게임명 (고유)"""
+    return [f"{rng.choice(NAME_WORDS)} {rng.choice(NAME_WORDS)} {i}" for i in range(count)]
+
+
+def _write(path, header, rows, encoding='utf-8'):
+    with open(path, 'w', encoding=encoding, newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+def chart_log(rows, rng):
+    """3종 차트 통합 기록 rows행: 하루 차트마다 1~10위, 게임 수는 행 수에 비례 (최소 12개, 최대 5,000개)"""
+    names = game_names(min(max(12, rows // 100), 5000), rng)
+    per_day = len(CHART_TYPES) * RANKS_PER_CHART
+    log = []
+    for i in range(rows):
+        day = START_DATE + timedelta(days=i // per_day)
+        chart_type = CHART_TYPES[i // RANKS_PER_CHART % len(CHART_TYPES)]
+        log.append((rng.choice(names), day, i % RANKS_PER_CHART + 1, chart_type))
+    return names, log
+
+
+def write_raw_exports(raw_dir, rows, seed=0):
+    """raw_dir에 노션 CSV 8개 생성 → {RAW_FILES 키: 행 수}"""
+    raw_dir = Path(raw_dir)
+    raw_dir.mkdir(parents=True, exist_ok=True)
+    rng = random.Random(seed)
+    counts = {}
+
+    top10 = []
+    for rank in range(1, rows + 1):
+        before = rng.randint(10_000, 900_000)
+        top10.append([app_url(rank), rank, rng.choice(REVIEWS), f"{rng.randint(0, 20_000):,}",
+                      rng.choice(REVIEW_LANGS), rng.randint(1, 500), f"{before:,}",
+                      f"{before + rng.randint(0, 200_000):,}", f"{rng.randint(100, 100_000):,}"])
+    top10.append(["", "*참고", "", "", "", "", "", "", ""])
+    _write(raw_dir / FILE_NAMES["top10_evaluation"],
+           ["게임명", "랭킹", "리뷰 상황", "리뷰 수", "리뷰 언어 등록 유저 국적 (좌측부터 비중 높음)",
+            "찜 랭크(스팀DB)", "참여 전 찜 수(GDCo) ", "참여 후 찜 수(GDCo)", "팔로워"], top10)
+    counts["top10_evaluation"] = len(top10)
+
+    chart_counts = [[app_url(rank), rng.randint(0, 15)] for rank in range(1, rows + 1)]
+    _write(raw_dir / FILE_NAMES["top10_chart_count"], ["게임명", "차트인 횟수"], chart_counts)
+    counts["top10_chart_count"] = len(chart_counts)
+
+    top50 = [[app_url(rank), rng.choice(["가능", "불가능"]), rng.choice(["멀티플레이", "싱글 플레이"]), rank,
+              rng.choice(GENRES), rng.choice(RELEASES), rng.randint(0, 15), rng.choice(["", "오픈월드", "1인칭 슈팅"])]
+             for rank in range(1, rows + 1)]
+    _write(raw_dir / FILE_NAMES["top50_games"],
+           ["게임명", "DEMO페이지 접속(6/17기준)(", "멀티 플레이", "순위", "장르", "정식 출시일", "차트인 횟수", "참고사항"],
+           top50)
+    counts["top50_games"] = len(top50)
+
+    report = []
+    for rank in range(1, rows + 1):
+        interface = rng.sample(LANGUAGES, rng.randint(1, len(LANGUAGES)))
+        tags = rng.sample(TAGS, rng.randint(3, 8))
+        report.append([app_url(rank), "Dev", "Pub", ", ".join(interface[:2]), ", ".join(interface), len(interface),
+                       "지원 안함", ", ".join(tags), len(tags), rng.choice(COMMUNITIES)])
+    _write(raw_dir / FILE_NAMES["report_page"],
+           ["게임명", "개발자", "배급사", "음성", "인터페이스", "인터페이스 언어개수", "자막", "태그", "태그개수", "커뮤니티"],
+           report)
+    counts["report_page"] = len(report)
+
+    names, log = chart_log(rows, rng)
+    _write(raw_dir / FILE_NAMES["chart_integration"], ["게임명", "날짜", "랭킹", "장르 필터", "차트 구분"],
+           ([game, korean_date(day), rank, "전체장르", chart_type] for game, day, rank, chart_type in log),
+           encoding='utf-8-sig')
+    counts["chart_integration"] = len(log)
+
+    app_index = {name: i + 1 for i, name in enumerate(names)}
+    for key, chart_type in DAILY_FILES.items():
+        daily = [[app_url(app_index[game]), korean_date(day), rank, rng.randint(1, 13), "Action, RPG", 2]
+                 for game, day, rank, kind in log if kind == chart_type]
+        _write(raw_dir / FILE_NAMES[key], ["게임명", "날짜", "랭킹", "인터페이스 언어개수", "태그", "태그 개수"], daily)
+        counts[key] = len(daily)
+    return counts
@@ -0,0 +1,151 @@
+"""
+대시보드 데이터 번들 빌드
+=========================
+github_data/0*/ 아래 섹션 CSV를 JSON 하나로 묶어, 내용 해시가 들어간 파일명으로 저장합니다.
+dashboard.html은 이 번들 하나만 받아오므로 CSV 개수만큼의 요청과 브라우저의 CSV 파싱이 사라집니다.
+
+    github_data/bundle/snf-data.<해시12자리>.json.gz   (gzip, DecompressionStream 지원 브라우저용)
+    github_data/bundle/snf-data.<해시12자리>.json      (구형 브라우저용)
+
+{
+  "version": 1,
+  "hash": "<sha256>",
+  "built": "2025-06-17 18:02:11",
+  "files": {"01_executive/01_strategies.csv": [{"id": "1", ...}, ...], ...},
+  "series": {"wishlistTop10Chart": {"labels": [...], "datasets": [...]}, ...}   (chart_series.py)
+}
+
+빌드 후 dashboard.html의 DATA_BUNDLE 상수를 새 파일명으로 바꾸고, 이전 번들은 지웁니다.
+CSV 내용이 그대로면 해시(파일명)도 그대로입니다.
+
+사용법:
+    python build_bundle.py                  # generate_insights.py 실행 후
+    python build_bundle.py --no-dashboard   # dashboard.html은 건드리지 않음
+"""
+
+import argparse
+import csv
+import gzip
+import hashlib
+import json
+import os
+import re
+from datetime import datetime
+from pathlib import Path
+
+from chart_series import build_series
+
+SCRIPT_DIR = Path(__file__).parent
+BASE_DIR = SCRIPT_DIR.parent
+GITHUB_DATA_DIR = BASE_DIR / "github_data"
+BUNDLE_DIR = GITHUB_DATA_DIR / "bundle"
+DASHBOARD_PATH = BASE_DIR / "dashboard.html"
+
+BUNDLE_VERSION = 1
+BUNDLE_PREFIX = "snf-data"
+SECTION_GLOB = "0*/*.csv"
+
+# dashboard.html에서 갱신할 줄: const DATA_BUNDLE = 'bundle/snf-data.<해시>.json.gz';
+DASHBOARD_PATTERN = re.compile(r"(const DATA_BUNDLE = ')[^']*(';)")
+
+
+def read_rows(path):
+    """CSV → 행 목록 (PapaParse header:true, skipEmptyLines와 같은 결과)
+
+    값이 모자란 행은 키를 빼고, 넘치는 값은 PapaParse처럼 __parsed_extra에 담습니다.
+    """
+    rows = []
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        for row in csv.DictReader(f):
+            extra = row.pop(None, None)
+            row = {key: value for key, value in row.items() if value is not None}
+            if extra:
+                row['__parsed_extra'] = extra
+            rows.append(row)
+    return rows
+
+
+def collect_files(data_dir=GITHUB_DATA_DIR):
+    """{'01_executive/01_strategies.csv': 행 목록} (경로 순)"""
+    data_dir = Path(data_dir)
+    return {path.relative_to(data_dir).as_posix(): read_rows(path)
+            for path in sorted(data_dir.glob(SECTION_GLOB))}
+
+
+def bundle_hash(files, series):
+    """파일 내용과 그래프 시리즈만으로 계산한 해시 (빌드 시각과 무관)"""
+    canonical = json.dumps({'files': files, 'series': series}, ensure_ascii=False, sort_keys=True,
+                           separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def make_payload(files):
+    """번들 내용 (build_offline.py는 이 값을 HTML에 그대로 넣음)"""
+    series = build_series(files)
+    return {
+        'version': BUNDLE_VERSION,
+        'hash': bundle_hash(files, series),
+        'built': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'files': files,
+        'series': series,
+    }
+
+
+def write_bundle(files, bundle_dir=BUNDLE_DIR):
+    """번들 저장 후 .json.gz 경로 반환 (이전 번들은 삭제)"""
+    bundle_dir = Path(bundle_dir)
+    bundle_dir.mkdir(parents=True, exist_ok=True)
+    payload = make_payload(files)
+    name = f"{BUNDLE_PREFIX}.{payload['hash'][:12]}"
+    json_path = bundle_dir / f"{name}.json"
+    gz_path = bundle_dir / f"{name}.json.gz"
+    if not (json_path.exists() and gz_path.exists()):
+        data = json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        for path, content in ((json_path, data), (gz_path, gzip.compress(data, compresslevel=9, mtime=0))):
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_bytes(content)
+            os.replace(tmp_path, path)
+    for old in bundle_dir.glob(f"{BUNDLE_PREFIX}.*.json*"):
+        if not old.name.startswith(name + "."):
+            old.unlink()
+    return gz_path
+
+
+def update_dashboard(bundle_path, dashboard_path=DASHBOARD_PATH, data_dir=GITHUB_DATA_DIR):
+    """dashboard.html의 DATA_BUNDLE 상수를 새 번들 경로로 교체 (바뀌었으면 True)"""
+    dashboard_path = Path(dashboard_path)
+    relative = Path(bundle_path).relative_to(data_dir).as_posix()
+    html = dashboard_path.read_text(encoding='utf-8')
+    updated, count = DASHBOARD_PATTERN.subn(lambda m: f"{m.group(1)}{relative}{m.group(2)}", html)
+    if count == 0:
+        raise ValueError(f"{dashboard_path.name}에서 DATA_BUNDLE 상수를 찾지 못했습니다.")
+    if updated == html:
+        return False
+    dashboard_path.write_text(updated, encoding='utf-8')
+    return True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="SNF 대시보드 데이터 번들 빌드")
+    parser.add_argument("--data-dir", type=Path, default=GITHUB_DATA_DIR, help="섹션 CSV가 있는 폴더")
+    parser.add_argument("--dashboard", type=Path, default=DASHBOARD_PATH, help="DATA_BUNDLE을 갱신할 HTML")
+    parser.add_argument("--no-dashboard", action="store_true", help="dashboard.html은 수정하지 않음")
+    args = parser.parse_args(argv)
+
+    files = collect_files(args.data_dir)
+    if not files:
+        print(f"❌ {args.data_dir}에 섹션 CSV가 없습니다.")
+        return 1
+    bundle_path = write_bundle(files, args.data_dir / "bundle")
+    raw_size = sum((args.data_dir / name).stat().st_size for name in files)
+    print(f"📦 {len(files)}개 CSV → {bundle_path.relative_to(args.data_dir).as_posix()}")
+    print(f"   CSV 합계 {raw_size / 1024:.1f}KB → JSON {bundle_path.with_suffix('').stat().st_size / 1024:.1f}KB"
+          f" / gzip {bundle_path.stat().st_size / 1024:.1f}KB")
+    if not args.no_dashboard:
+        changed = update_dashboard(bundle_path, args.dashboard, args.data_dir)
+        print(f"   {'✅ dashboard.html DATA_BUNDLE 갱신' if changed else '♻️ dashboard.html 변경 없음 (같은 번들)'}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
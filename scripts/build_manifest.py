@@ -0,0 +1,103 @@
+"""
+증분 빌드 매니페스트
+====================
+생성된 CSV마다 어떤 원본 파일(RAW_FILES 키)로 만들었는지와
+그때의 파일 지문(SHA-256), 프롬프트 해시를 기록합니다.
+
+    github_data/.build_manifest.json
+    {
+      "03_charts/01_kpi_cards.csv": {
+        "inputs": {"chart_integration": {"file": "...csv", "sha256": "..."}},
+        "prompt": "<sha256>",
+        "built": "2025-06-17 18:02:11"
+      }
+    }
+
+--incremental 실행 시 입력 지문이나 프롬프트가 바뀐 출력만 다시 만듭니다 (make와 같은 방식).
+빌드한 컴퓨터의 기록이므로 .gitignore로 커밋에서 제외합니다 (출력 폴더가 github_data/여도 git add .에 포함되지 않음).
+"""
+
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+
+MANIFEST_NAME = ".build_manifest.json"
+
+
+def fingerprint_file(path):
+    """파일 내용의 SHA-256 (파일이 없으면 None)"""
+    if not path or not Path(path).exists():
+        return None
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def prompt_hash(job):
+    """프롬프트 해시 (로컬 계산 작업은 계산 결과 해시)"""
+    text = job['prompt'] if job['prompt'] is not None else json.dumps(job['rows'], ensure_ascii=False)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def input_state(inputs, raw_data):
+    """RAW_FILES 키 목록 → {키: {file, sha256}}"""
+    return {
+        key: {
+            'file': raw_data[key]['path'].name if raw_data[key]['path'] else None,
+            'sha256': raw_data[key].get('sha256'),
+        }
+        for key in inputs
+    }
+
+
+class BuildManifest:
+    """출력 CSV → 입력 지문 기록"""
+
+    def __init__(self, output_dir):
+        self.path = Path(output_dir) / MANIFEST_NAME
+        self.output_dir = Path(output_dir)
+        self.lock = threading.Lock()
+        self.entries = {}
+        if self.path.exists():
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+
+    def stale_reason(self, job):
+        """다시 만들어야 하는 이유 (최신이면 None)
+
+        job['fingerprints']는 input_state()로 미리 계산해 둡니다.
+        """
+        entry = self.entries.get(job['output'])
+        if not (self.output_dir / job['output']).exists():
+            return "출력 파일 없음"
+        if not entry:
+            return "빌드 기록 없음"
+        for key, state in job['fingerprints'].items():
+            if entry['inputs'].get(key, {}).get('sha256') != state['sha256']:
+                return f"입력 변경: {key}"
+        if entry.get('prompt') != prompt_hash(job):
+            return "프롬프트 변경"
+        return None
+
+    def record(self, job):
+        """job 출력이 현재 입력으로 만들어졌음을 기록"""
+        entry = {
+            'inputs': job['fingerprints'],
+            'prompt': prompt_hash(job),
+            'built': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        }
+        with self.lock:
+            self.entries[job['output']] = entry
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        with self.lock:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f, ensure_ascii=False, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
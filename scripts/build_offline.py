@@ -0,0 +1,165 @@
+"""
+오프라인 대시보드 빌드
+======================
+네트워크 없는 발표용 노트북에서 그대로 열 수 있는 HTML 파일 하나를 만듭니다.
+
+    dist/dashboard-offline.html
+      - Tailwind CDN(브라우저에서 매번 CSS 컴파일) → 페이지에 쓰인 클래스만 미리 컴파일한 <style>
+      - Chart.js / PapaParse CDN → <script> 안에 그대로 포함 (배포본이 이미 minify된 빌드, </script만 이스케이프)
+      - 데이터 번들(build_bundle.py) → EMBEDDED_BUNDLE 상수에 포함
+      - 표/카드/그래프 시리즈 → render_dashboard.py로 사전 렌더링
+
+CSS 컴파일에는 Tailwind standalone CLI(v3)가 필요합니다 (Node 설치 불필요, 실행 파일 하나).
+    https://github.com/tailwindlabs/tailwindcss/releases 에서 tailwindcss-<OS>-<arch> 를 받아
+    PATH에 tailwindcss 로 두거나 --tailwind 로 경로를 지정
+
+라이브러리는 scripts/.cache/vendor/ 에 한 번 받아 두고 다시 씁니다.
+인터넷이 없는 곳에서 빌드할 때는 미리 받은 파일이 있는 폴더를 --vendor-dir 로 지정하세요
+(파일명은 URL의 마지막 부분: chart.js, papaparse.min.js).
+
+사용법:
+    python build_offline.py                         # generate_insights.py 실행 후
+    python build_offline.py --vendor-dir ./vendor --output ../dist/snf.html
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import shutil
+import subprocess
+import tempfile
+import urllib.request
+from pathlib import Path
+
+from build_bundle import BASE_DIR, DASHBOARD_PATH, GITHUB_DATA_DIR, collect_files, make_payload
+from render_dashboard import render_dashboard
+
+SCRIPT_DIR = Path(__file__).parent
+VENDOR_CACHE_DIR = SCRIPT_DIR / ".cache" / "vendor"
+OUTPUT_PATH = BASE_DIR / "dist" / "dashboard-offline.html"
+
+TAILWIND_CDN = "https://cdn.tailwindcss.com"
+TAILWIND_INPUT = "@tailwind base;\n@tailwind components;\n@tailwind utilities;\n"
+DOWNLOAD_TIMEOUT = 30
+
+# <head>의 외부 스크립트: <script src="https://..."></script>
+EXTERNAL_SCRIPT_PATTERN = re.compile(r'<script src="(https?://[^"]+)"></script>')
+# 한 줄짜리 상수: const EMBEDDED_BUNDLE = null;
+EMBEDDED_PATTERN = re.compile(r"(const EMBEDDED_BUNDLE = ).*?(;)$", re.MULTILINE)
+# <script>/<style> 요소를 닫아 버리는 문자열
+CLOSING_TAG_PATTERN = re.compile(r"</(script|style)", re.IGNORECASE)
+# 빌드 후에도 남은 외부 리소스 확인용
+REMAINING_PATTERN = re.compile(r'<(?:script|link|img)\b[^>]*\b(?:src|href)="(https?://[^"]+)"')
+
+
+class OfflineBuildError(Exception):
+    """빌드에 필요한 도구/파일이 없을 때"""
+
+
+# ============================================
+# 자산 준비
+# ============================================
+def compile_tailwind(html_text, tailwind=None):
+    """페이지에 쓰인 Tailwind 클래스만 컴파일한 CSS (minify)"""
+    tailwind = tailwind or shutil.which("tailwindcss")
+    if not tailwind:
+        raise OfflineBuildError(
+            "Tailwind standalone CLI(tailwindcss)를 찾지 못했습니다.\n"
+            "   https://github.com/tailwindlabs/tailwindcss/releases 에서 v3 실행 파일을 받아\n"
+            "   PATH에 두거나 --tailwind 로 경로를 지정하세요.")
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        (tmp / "input.css").write_text(TAILWIND_INPUT, encoding='utf-8')
+        (tmp / "content.html").write_text(html_text, encoding='utf-8')
+        result = subprocess.run(
+            [str(tailwind), "-i", str(tmp / "input.css"), "-o", str(tmp / "output.css"),
+             "--content", str(tmp / "content.html"), "--minify"],
+            capture_output=True, text=True)
+        if result.returncode != 0 or not (tmp / "output.css").exists():
+            raise OfflineBuildError(f"Tailwind 컴파일 실패:\n{result.stderr.strip()}")
+        return (tmp / "output.css").read_text(encoding='utf-8')
+
+
+def fetch_vendor(url, vendor_dir=None, cache_dir=VENDOR_CACHE_DIR):
+    """외부 스크립트 내용 (--vendor-dir → 캐시 → 다운로드 순)"""
+    name = url.rstrip('/').rsplit('/', 1)[-1]
+    if vendor_dir:
+        path = Path(vendor_dir) / name
+        if path.exists():
+            return path.read_text(encoding='utf-8')
+    cache_path = Path(cache_dir) / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()[:16]}-{name}"
+    if cache_path.exists():
+        return cache_path.read_text(encoding='utf-8')
+    try:
+        with urllib.request.urlopen(url, timeout=DOWNLOAD_TIMEOUT) as response:
+            text = response.read().decode('utf-8')
+    except OSError as e:
+        raise OfflineBuildError(
+            f"{url} 다운로드 실패 ({e}).\n"
+            f"   오프라인이면 {name} 파일을 받아 둔 폴더를 --vendor-dir 로 지정하세요.") from e
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    cache_path.write_text(text, encoding='utf-8')
+    return text
+
+
+def script_safe(text):
+    """<script>/<style> 안에서 요소가 닫히지 않도록 </script, </style만 이스케이프 (나머지 내용은 그대로)"""
+    return CLOSING_TAG_PATTERN.sub(r"<\\/\1", text)
+
+
+# ============================================
+# 빌드
+# ============================================
+def build_offline(template, files, vendor_dir=None, tailwind=None):
+    """dashboard.html 원본 → 외부 요청 없는 단일 HTML"""
+    text, used = render_dashboard(template, files)
+
+    payload = json.dumps(make_payload(files), ensure_ascii=False, separators=(',', ':'))
+    text, count = EMBEDDED_PATTERN.subn(lambda m: f"{m.group(1)}{script_safe(payload)}{m.group(2)}", text, count=1)
+    if count == 0:
+        raise OfflineBuildError("dashboard.html에서 EMBEDDED_BUNDLE 상수를 찾지 못했습니다.")
+
+    # CSS는 번들이 들어간 최종 마크업 기준으로 컴파일
+
+    def inline(match):
+        url = match.group(1)
+        if url == TAILWIND_CDN:
+            return f"<style>{script_safe(compile_tailwind(text, tailwind))}</style>"
+        return f"<script>{script_safe(fetch_vendor(url, vendor_dir))}</script>"
+
+    text = EXTERNAL_SCRIPT_PATTERN.sub(inline, text)
+    return text, used
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="SNF 대시보드 오프라인 단일 파일 빌드")
+    parser.add_argument("--data-dir", type=Path, default=GITHUB_DATA_DIR, help="섹션 CSV가 있는 폴더")
+    parser.add_argument("--template", type=Path, default=DASHBOARD_PATH, help="원본 dashboard.html")
+    parser.add_argument("--output", type=Path, default=OUTPUT_PATH, help="저장 위치")
+    parser.add_argument("--vendor-dir", type=Path, help="Chart.js / PapaParse 파일을 미리 받아 둔 폴더")
+    parser.add_argument("--tailwind", help="Tailwind standalone CLI 경로 (기본: PATH의 tailwindcss)")
+    args = parser.parse_args(argv)
+
+    files = collect_files(args.data_dir)
+    if not files:
+        print(f"❌ {args.data_dir}에 섹션 CSV가 없습니다.")
+        return 1
+    try:
+        text, used = build_offline(args.template.read_text(encoding='utf-8'), files, args.vendor_dir, args.tailwind)
+    except OfflineBuildError as e:
+        print(f"❌ {e}")
+        return 1
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(text, encoding='utf-8')
+    print(f"📴 오프라인 대시보드 → {args.output} ({len(text.encode('utf-8')) / 1024:.1f}KB)")
+    print(f"   CSV {len(files)}개 포함, {len(used)}개로 사전 렌더링")
+    remaining = REMAINING_PATTERN.findall(text)
+    if remaining:
+        print(f"   ⚠️ 외부 리소스가 남아 있습니다: {', '.join(sorted(set(remaining)))}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
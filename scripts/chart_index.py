@@ -0,0 +1,128 @@
+"""
+3종 차트 기록 인덱스
+====================
+'전체 장르 - 3종 차트인' 기록(게임, 날짜, 순위, 차트 구분)을 한 번 순회하면서
+(게임, 차트) 단위로 등장 횟수 / 최고 순위 / 첫·마지막 날짜 / 1위 횟수를 모아 둡니다.
+게임마다 전체 기록을 다시 훑지 않으므로 여러 달치 일자별 스냅샷(수십만 행)도 한 번에 처리합니다.
+
+    index = ChartIndex(snf_stats.normalize_chart_entries(table))
+    index.game_counts.most_common(5)          # 전체 차트인 횟수 TOP 5
+    index.first_places('PIONER')              # {'인기 출시 예정 게임': 3}
+    index.summaries('인기 체험판')            # 상세 표용 게임별 요약
+    index.ranking('인기 체험판', date(2025, 6, 10))  # 그날의 (순위, 게임) 목록
+    index.rank_matrix()                       # 연속 일수 / 추세 계산용 순위 행렬 (rank_series)
+"""
+
+from collections import Counter, defaultdict
+
+from rank_series import RankMatrix
+
+# 상세 표 요약에 rank_series에서 가져와 붙이는 지표
+SERIES_METRICS = ('consecutive_days', 'current_streak', 'velocity', 'momentum', 'volatility', 'trend_direction')
+
+
+class GameChartStats:
+    """게임 하나 × 차트 하나의 누적 통계"""
+
+    __slots__ = ('game', 'chart_type', 'appearances', 'best_rank', 'first_places', 'days')
+
+    def __init__(self, game, chart_type):
+        self.game = game
+        self.chart_type = chart_type
+        self.appearances = 0
+        self.best_rank = None
+        self.first_places = 0
+        self.days = set()
+
+    def add(self, day, rank):
+        self.appearances += 1
+        if rank and rank > 0:
+            if self.best_rank is None or rank < self.best_rank:
+                self.best_rank = rank
+            if rank == 1:
+                self.first_places += 1
+        if day:
+            self.days.add(day)
+
+    def summary(self):
+        """chart_game_summaries() 행 형식"""
+        return {
+            'name': self.game,
+            'appearances': self.appearances,
+            'best_rank': self.best_rank if self.best_rank is not None else '',
+            'first_date': min(self.days).isoformat() if self.days else '',
+            'last_date': max(self.days).isoformat() if self.days else '',
+        }
+
+
+class ChartIndex:
+    """차트 기록을 (게임, 차트) / (차트, 날짜)로 묶은 인덱스"""
+
+    def __init__(self, entries=()):
+        self.total = 0
+        self.type_counts = Counter()
+        self.game_counts = Counter()
+        self.stats = {}                    # (게임, 차트) → GameChartStats
+        self.by_game = defaultdict(list)   # 게임 → [GameChartStats]
+        self.by_day = defaultdict(list)    # (차트, 날짜) → [(순위, 게임)]
+        self._matrix = None
+        for entry in entries:
+            self.add(entry)
+
+    def add(self, entry):
+        """normalize_chart_entries() 행 하나 추가"""
+        game, chart_type = entry['game'], entry['chart_type']
+        self.total += 1
+        self.type_counts[chart_type] += 1
+        self.game_counts[game] += 1
+        stats = self.stats.get((game, chart_type))
+        if stats is None:
+            stats = self.stats[(game, chart_type)] = GameChartStats(game, chart_type)
+            self.by_game[game].append(stats)
+        stats.add(entry['date'], entry['rank'])
+        if entry['date']:
+            self.by_day[(chart_type, entry['date'])].append((entry['rank'], game))
+        self._matrix = None
+
+    def __len__(self):
+        return self.total
+
+    def first_places(self, game, chart_types=None):
+        """차트별 1위 횟수 ({차트: 횟수}, 1위가 없는 차트는 제외)"""
+        counts = {s.chart_type: s.first_places for s in self.by_game.get(game, []) if s.first_places}
+        if chart_types is None:
+            return counts
+        return {ct: counts[ct] for ct in chart_types if ct in counts}
+
+    def entries(self):
+        """날짜가 있는 기록 (게임, 차트, 날짜, 순위)"""
+        for (chart_type, day), ranking in self.by_day.items():
+            for rank, game in ranking:
+                yield game, chart_type, day, rank
+
+    def rank_matrix(self):
+        """게임 × 차트 × 날짜 순위 행렬 (기록이 추가되면 다시 만듦)"""
+        if self._matrix is None:
+            self._matrix = RankMatrix(self.entries())
+        return self._matrix
+
+    def summaries(self, chart_type):
+        """차트 하나의 게임별 요약 + 연속 일수/추세 (등장 횟수 → 최고 순위 → 첫 등장 → 이름 순)"""
+        metrics = self.rank_matrix().metrics(chart_type)
+        summaries = []
+        for (game, ct), stats in self.stats.items():
+            if ct == chart_type:
+                summary = stats.summary()
+                series = metrics.get(game, {})
+                summary.update({key: series.get(key, '') for key in SERIES_METRICS})
+                summaries.append(summary)
+        summaries.sort(key=lambda s: (-s['appearances'], s['best_rank'] or 999, s['first_date'], s['name']))
+        return summaries
+
+    def dates(self, chart_type=None):
+        """기록이 있는 날짜 (정렬)"""
+        return sorted({day for ct, day in self.by_day if chart_type is None or ct == chart_type})
+
+    def ranking(self, chart_type, day):
+        """그날 차트의 (순위, 게임) 목록 (순위 순)"""
+        return sorted(self.by_day.get((chart_type, day), []))
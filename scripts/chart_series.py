@@ -0,0 +1,168 @@
+"""
+대시보드 그래프 데이터
+======================
+섹션 CSV에서 dashboard.html의 Chart.js 그래프 21개가 바로 쓰는 시리즈를 만듭니다.
+build_bundle.py가 번들의 "series"에, render_dashboard.py가 CHART_SERIES 상수에 넣습니다.
+
+    {"wishlistTop10Chart": {"labels": ["빈딕투스(1위)", ...],
+                            "datasets": [{"data": [151605, ...], "backgroundColor": ["#003380", ...]}]},
+     "dailyChartActivity": {"labels": ["6/10", ...],
+                            "datasets": [{"label": "인기 체험판", "data": [8, ...]}, ...]}, ...}
+
+- 값은 숫자로 변환해 둡니다 ("90%" → 90, "1,234" → 1234)
+- 조각이 많은 분포는 상위 MAX_SLICES-1개 + 기타로, 긴 일자별 시리즈는 MAX_POINTS개 구간 평균으로 줄입니다
+- 원본 CSV가 없는 그래프는 빠지며, 대시보드는 이 경우 HTML에 적힌 기본 값을 그대로 씁니다
+  (dailyChartActivity, voiceChart, subtitleChart는 예시 값뿐이라 대시보드가 숨김)
+"""
+
+import re
+
+from snf_stats import CHART_TYPES, OTHER_COLOR
+
+MAX_SLICES = 6    # 도넛 그래프 조각 수 (기타 포함)
+MAX_BARS = 20     # 막대 그래프 막대 수
+MAX_POINTS = 30   # 선 그래프 점 수
+
+# 커뮤니티 채널 브랜드 색상 (communityChart)
+PLATFORM_COLORS = {
+    'Discord': 'rgba(88, 101, 242, 0.8)',
+    'YouTube': 'rgba(255, 0, 0, 0.8)',
+    'X': 'rgba(29, 155, 240, 0.8)',
+    'X(Twitter)': 'rgba(29, 155, 240, 0.8)',
+    'bilibili': 'rgba(0, 161, 214, 0.8)',
+    'TikTok': 'rgba(0, 0, 0, 0.8)',
+    'Reddit': 'rgba(255, 69, 0, 0.8)',
+    'Instagram': 'rgba(228, 64, 95, 0.8)',
+    'Facebook': 'rgba(24, 119, 242, 0.8)',
+    'Twitch': 'rgba(145, 70, 255, 0.8)',
+}
+
+
+def to_number(value):
+    """CSV 값 → 숫자 ("90%", "+1,234", "7.8개" 모두 처리, 실패 시 None)"""
+    match = re.search(r'[-+]?\d[\d,]*(?:\.\d+)?', str(value or ''))
+    if not match:
+        return None
+    number = float(match.group(0).replace(',', ''))
+    return int(number) if number.is_integer() else number
+
+
+def _points(rows, label, value='value', color=None):
+    """행 목록 → [(라벨, 값, 색)] (값이 숫자가 아닌 행은 제외)"""
+    points = []
+    for row in rows:
+        number = to_number(row.get(value))
+        if number is not None:
+            points.append((row.get(label, ''), number, row.get(color) if color else None))
+    return points
+
+
+def top_slices(points, limit=MAX_SLICES, other='기타'):
+    """분포 조각을 limit개로 (값 큰 순 limit-1개 + 나머지 합 '기타')"""
+    if len(points) <= limit:
+        return points
+    ordered = sorted(points, key=lambda p: -p[1])
+    kept = [p for p in ordered if p[0] != other][:limit - 1]
+    rest = sum(p[1] for p in points) - sum(p[1] for p in kept)
+    return kept + [(other, rest, OTHER_COLOR)]
+
+
+def downsample(labels, series, limit=MAX_POINTS):
+    """일자별 시리즈를 limit개 구간 평균으로 (구간 라벨은 첫 날짜)
+
+    series: [[값, ...], ...] (모두 labels와 같은 길이)
+    """
+    if len(labels) <= limit:
+        return labels, series
+    size = len(labels) / limit
+    bounds = [(int(i * size), int((i + 1) * size)) for i in range(limit)]
+    labels = [labels[start] for start, _ in bounds]
+    series = [[round(sum(values[start:end]) / (end - start), 1) for start, end in bounds] for values in series]
+    return labels, series
+
+
+def _single(points, colors=True):
+    """[(라벨, 값, 색)] → 데이터셋 하나짜리 시리즈"""
+    dataset = {'data': [value for _, value, _ in points]}
+    if colors and all(color for _, _, color in points):
+        dataset['backgroundColor'] = [color for _, _, color in points]
+    return {'labels': [label for label, _, _ in points], 'datasets': [dataset]}
+
+
+def _of_type(rows, column, kind):
+    return [row for row in rows or [] if row.get(column) == kind]
+
+
+# ============================================
+# 그래프별 시리즈
+# ============================================
+def daily_activity_series(rows):
+    """10_daily_activity.csv → 차트 3종의 일자별 진입 게임 수"""
+    days = sorted({row['date'] for row in rows if row.get('date')})
+    counts = {(row.get('date'), row.get('chart_type')): to_number(row.get('games')) or 0 for row in rows}
+    labels = [f"{int(day[5:7])}/{int(day[8:10])}" if len(day) >= 10 else day for day in days]
+    labels, series = downsample(labels, [[counts.get((day, ct), 0) for day in days] for ct in CHART_TYPES])
+    return {'labels': labels,
+            'datasets': [{'label': ct.removesuffix(' 게임'), 'data': values} for ct, values in zip(CHART_TYPES, series)]}
+
+
+def category_points(tag_rows):
+    """상위 태그의 분류별 합계"""
+    totals = {}
+    for label, value, _ in _points(tag_rows, 'category', 'count'):
+        totals[label or '기타'] = totals.get(label or '기타', 0) + value
+    return [(label, value, None) for label, value in totals.items()]
+
+
+def build_series(files):
+    """{CSV 경로: 행 목록} → {canvas id: 시리즈}"""
+    get = files.get
+    top10 = get('02_top_games/04_top10_charts.csv')
+    top50 = get('02_top_games/06_top50_charts.csv')
+    chart_data = get('03_charts/03_chart_data.csv')
+    tags = _of_type(get('04_report/03_tags_analysis.csv'), 'analysis_type', 'top_tags')
+    interface = _of_type(get('04_report/04_language_support.csv'), 'support_type', 'interface')
+    languages = get('04_report/07_language_charts.csv')
+    community = _of_type(get('04_report/05_community.csv'), 'analysis_type', 'channel_usage')
+
+    def dist(rows, kind, limit=MAX_SLICES):
+        return top_slices(_points(_of_type(rows, 'chart_type', kind), 'label', color='color'), limit)
+
+    series = {}
+    if top10:
+        series['wishlistTop10Chart'] = _single(dist(top10, 'wishlist_top5', MAX_BARS))
+        series['reviewTop10Chart'] = _single(dist(top10, 'review_dist'))
+        series['reviewChart'] = series['reviewTop10Chart']
+        series['genreTop10Chart'] = _single(dist(top10, 'genre_dist'))
+    if top50:
+        series['genreTop50Chart'] = _single(dist(top50, 'genre_dist'))
+        series['genreDistribution'] = _single(dist(top50, 'genre_dist', MAX_BARS), colors=False)
+        series['multiplayerChart'] = _single(dist(top50, 'play_type'))
+        series['multiplayerDistribution'] = series['multiplayerChart']
+        series['demoAvailChart'] = _single(dist(top50, 'demo_avail'))
+    if get('02_top_games/03_top10_table.csv'):
+        series['wishlistChart'] = _single(_points(get('02_top_games/03_top10_table.csv'), 'name', 'wishlist_increase'))
+    if chart_data:
+        counts = [(label.removesuffix(' 게임'), value, None)
+                  for label, value, _ in _points(_of_type(chart_data, 'stat_type', 'count'), 'chart_type')]
+        series['chartTypeDistribution'] = _single(counts)
+        series['topChartGames'] = _single(_points(_of_type(chart_data, 'chart_type', 'top_games'), 'stat_type')[:MAX_BARS])
+    if get('03_charts/10_daily_activity.csv'):
+        series['dailyChartActivity'] = daily_activity_series(get('03_charts/10_daily_activity.csv'))
+    if tags:
+        series['tagsChart'] = _single(_points(tags, 'tag_name', 'count')[:MAX_BARS])
+        series['tagCategoryChart'] = _single(top_slices(category_points(tags)))
+    if interface:
+        series['interfaceChart'] = _single(_points(interface, 'language', 'game_count')[:MAX_BARS])
+        series['languageSupport'] = series['interfaceChart']
+    if languages:
+        series['voiceChart'] = _single(dist(languages, 'voice'))
+        series['subtitleChart'] = _single(_points(_of_type(languages, 'chart_type', 'subtitles'), 'label')[:MAX_BARS])
+    if community:
+        points = [(label, value, PLATFORM_COLORS.get(label, OTHER_COLOR))
+                  for label, value, _ in _points(community, 'platform', 'usage_rate')]
+        series['communityChart'] = _single(points[:MAX_BARS])
+        series['communityChart']['max'] = 100
+    # 데이터가 비어 있는 시리즈는 기본 값을 쓰도록 제외
+    return {key: value for key, value in series.items()
+            if value['labels'] and any(dataset['data'] for dataset in value['datasets'])}
@@ -0,0 +1,333 @@
+"""
+생성 CSV 수치 교차 검증
+=======================
+Gemini가 쓴 CSV의 숫자를 원본 데이터로 직접 계산한 값(snf_stats.compute_stats 등)과 비교해
+틀린 수치를 찾아냅니다. generate_insights.py가 생성 직후 자동으로 실행하며, 단독 실행도 됩니다.
+
+    ❌ 01_executive/02_kpi_cards.csv 2행 value '+70만 찜' → TOP 10 찜 증가 합계 512,345 (차이 +187,655)
+
+어떤 숫자가 어떤 지표인지는 다음 두 가지로 정합니다.
+- KPI형 행 (value + label): label/sublabel의 키워드 → VALUE_RULES
+- 서술 컬럼: 문장(마침표, |)마다 "TOP 10 중 5개", "TOP 10의 70%", "<게임명> ... 15회" 형태 → CLAUSE_RULES
+- 03_charts/03_chart_data.csv처럼 구조가 정해진 파일은 행에서 바로 지표를 읽음
+
+단위 해석: 만(×10,000), 천/K(×1,000), %, 회/개. 표기 자릿수만큼 반올림 오차를 허용합니다
+("+70만"은 ±5,000, "25.6%"는 ±1%p). 지표를 정하지 못한 숫자는 '검증 안 됨'으로만 셉니다.
+
+결과는 github_data/.cross_check.json 에 저장됩니다 (.gitignore로 커밋 제외).
+원본 파일이 없는 지표(일부 파일만 로드, 원본 없이 단독 실행)는 0과 비교하지 않고 검증 안 됨으로 셉니다.
+
+사용법:
+    python cross_check.py                        # github_data/raw 기준으로 github_data/ 검사
+    python cross_check.py --festival 2025-06 --data-dir ../tmp_out
+    python cross_check.py --strict               # 불일치가 있으면 종료 코드 1 (배포 전 점검용)
+"""
+
+import argparse
+import json
+import re
+from datetime import datetime
+from pathlib import Path
+
+import snf_stats
+from build_bundle import GITHUB_DATA_DIR, collect_files
+
+SCRIPT_DIR = Path(__file__).parent
+RAW_DIR = GITHUB_DATA_DIR / "raw"
+REPORT_NAME = ".cross_check.json"
+PERCENT_TOLERANCE = 1.0   # %p
+
+METRIC_LABELS = {
+    'top10_total_wishlist_increase': "TOP 10 찜 증가 합계",
+    'top10_avg_wishlist_increase': "TOP 10 평균 찜 증가",
+    'top1_wishlist_increase': "1위 게임 찜 증가",
+    'top1_wishlist_pct': "1위 게임 찜 증가율(%)",
+    'top10_multi': "TOP 10 멀티플레이 수", 'top10_multi_pct': "TOP 10 멀티플레이 비율(%)",
+    'top10_single': "TOP 10 싱글플레이 수", 'top10_single_pct': "TOP 10 싱글플레이 비율(%)",
+    'top10_demo': "TOP 10 체험판 수", 'top10_demo_pct': "TOP 10 체험판 비율(%)",
+    'top10_positive_review': "TOP 10 긍정 리뷰 수", 'top10_positive_review_pct': "TOP 10 긍정 리뷰 비율(%)",
+    'top10_chinese': "TOP 10 간체 중국어 리뷰 1위 수", 'top10_chinese_pct': "TOP 10 간체 중국어 리뷰 비율(%)",
+    'top10_avg_chart_count': "TOP 10 평균 차트인 횟수",
+    'top50_multi': "TOP 50 멀티플레이 수", 'top50_multi_pct': "TOP 50 멀티플레이 비율(%)",
+    'top50_demo': "TOP 50 체험판 수", 'top50_demo_pct': "TOP 50 체험판 비율(%)",
+    'chart_total_entries': "총 차트 노출 횟수",
+    'chart_unique_games': "차트 진입 고유 게임 수",
+    'top_game_chart_count': "최다 차트인 횟수",
+    'demo_chart_share_pct': "인기 체험판 차트 노출 비율(%)",
+    'interface_avg': "평균 인터페이스 언어 수",
+    'interface_chinese_pct': "중국어 간체 인터페이스 지원률(%)",
+}
+
+# 지표별 원본 파일 (원본이 없으면 0과 비교하지 않고 '검증 안 됨'으로 셈)
+METRIC_SOURCES = {
+    'top10_evaluation': ('top10_total_wishlist_increase', 'top10_avg_wishlist_increase', 'top1_wishlist_increase',
+                         'top1_wishlist_pct', 'top10_positive_review', 'top10_positive_review_pct',
+                         'top10_chinese', 'top10_chinese_pct'),
+    'top50_games': ('top10_multi', 'top10_multi_pct', 'top10_single', 'top10_single_pct', 'top10_demo',
+                    'top10_demo_pct', 'top10_avg_chart_count', 'top50_multi', 'top50_multi_pct', 'top50_demo',
+                    'top50_demo_pct'),
+    'chart_integration': ('chart_total_entries', 'chart_unique_games', 'top_game_chart_count',
+                          'demo_chart_share_pct'),
+    'report_page': ('interface_avg', 'interface_chinese_pct'),
+}
+
+# KPI형 행: label(+sublabel) 키워드 → 지표 (위에서부터 먼저 맞는 것)
+VALUE_RULES = [
+    (r'1위.*(성과|게임)', 'top1_wishlist_increase'),
+    (r'평균.*찜', 'top10_avg_wishlist_increase'),
+    (r'찜', 'top10_total_wishlist_increase'),
+    (r'체험판.*차트|차트.*체험판', 'demo_chart_share_pct'),
+    (r'최다 차트인|가장 많', 'top_game_chart_count'),
+    (r'평균 차트인', 'top10_avg_chart_count'),
+    (r'노출', 'chart_total_entries'),
+    (r'차트 진입|차트인 게임|진입 게임', 'chart_unique_games'),
+    (r'평균 언어|언어 수', 'interface_avg'),
+    (r'중국어', 'interface_chinese_pct'),
+    (r'멀티', 'top10_multi'),
+    (r'싱글', 'top10_single'),
+    (r'체험판|데모', 'top10_demo'),
+    (r'긍정', 'top10_positive_review'),
+]
+
+# 서술 문장: "TOP 10 중 5개가 체험판" / "TOP 10의 70%가 멀티플레이"
+SCOPE_PATTERN = re.compile(r'TOP\s*(10|50)\s*(?:중|의)\s*([\d.]+)\s*(개|%)')
+CLAUSE_RULES = [
+    (r'멀티|협동|Co-?op', 'multi'),
+    (r'싱글', 'single'),
+    (r'체험판|데모', 'demo'),
+    (r'긍정', 'positive_review'),
+    (r'간체|중국어', 'chinese'),
+]
+NUMBER_PATTERN = re.compile(r'([-+]?\d[\d,]*(?:\.\d+)?)\s*(만|천|K|k|%|회|개)?')
+CLAUSE_SPLIT = re.compile(r'\.\s+|\.$|\||\n')
+FREE_TEXT_COLUMNS = ('title', 'description', 'details', 'detail_items', 'sublabel', 'highlight', 'notes', 'note')
+
+
+# ============================================
+# 정답 계산
+# ============================================
+def ground_truth(tables):
+    """원본 Table들({'top10_evaluation': Table, ...}) → ({지표: 값}, {'game': {게임명: 차트인 횟수}, 'chart_type': {...}})
+
+    원본 파일이 없는(None) 지표는 결과에서 빠집니다 (0으로 계산된 값과 비교하지 않도록).
+    """
+    top10_eval = snf_stats.normalize_top10_evaluation(tables.get('top10_evaluation'))
+    top50_games = snf_stats.normalize_top50_games(tables.get('top50_games'))
+    index = snf_stats.as_chart_index(snf_stats.normalize_chart_entries(tables.get('chart_integration')))
+    stats = snf_stats.compute_stats(top10_eval, top50_games, index)
+
+    truth = {key: stats[key] for key in ('top10_total_wishlist_increase', 'top10_avg_wishlist_increase',
+                                         'top10_multi', 'top10_single', 'top10_demo', 'top10_positive_review',
+                                         'top10_chinese', 'top10_avg_chart_count', 'top50_multi', 'top50_demo',
+                                         'chart_total_entries')}
+    for key in ('multi', 'single', 'demo', 'positive_review', 'chinese'):
+        truth[f'top10_{key}_pct'] = stats[f'top10_{key}'] * 10   # TOP 10 = 10개 기준 (verify_and_generate.py와 같음)
+    for key in ('multi', 'demo'):
+        if stats['top50_total']:
+            truth[f'top50_{key}_pct'] = stats[f'top50_{key}'] / stats['top50_total'] * 100
+    truth['chart_unique_games'] = len(index.game_counts)
+    if stats['top_chart_games']:
+        truth['top_game_chart_count'] = stats['top_chart_games'][0][1]
+    if stats['chart_total_entries']:
+        truth['demo_chart_share_pct'] = (stats['chart_types'].get(snf_stats.CHART_TYPES[0], 0)
+                                         / stats['chart_total_entries'] * 100)
+    if top10_eval:
+        first = max(top10_eval, key=lambda g: g['wishlist_increase'])
+        truth['top1_wishlist_increase'] = first['wishlist_increase']
+        truth['top1_wishlist_pct'] = first['wishlist_pct']
+    for row in snf_stats.language_support_rows(tables.get('report_page')):
+        if row['support_type'] == 'interface' and ('간체' in row['language'] or row['language'] == '중국어'):
+            truth['interface_chinese_pct'] = to_percent(row['percentage'])
+        elif row['rank'] == 'interface_avg':
+            truth['interface_avg'] = float(str(row['percentage']).rstrip('개') or 0)
+    for key, metrics in METRIC_SOURCES.items():
+        if tables.get(key) is None:
+            for metric in metrics:
+                truth.pop(metric, None)
+    if tables.get('chart_integration') is None:
+        return truth, {'game': {}, 'chart_type': {}}
+    return truth, {'game': dict(index.game_counts), 'chart_type': dict(index.type_counts)}
+
+
+def to_percent(text):
+    return float(str(text).rstrip('%') or 0)
+
+
+# ============================================
+# 숫자 추출
+# ============================================
+def parse_quantity(match):
+    """NUMBER_PATTERN 매치 → (값, 단위, 허용 오차)"""
+    digits, unit = match.group(1).replace(',', ''), match.group(2) or ''
+    value = float(digits)
+    decimals = len(digits.split('.', 1)[1]) if '.' in digits else 0
+    scale = {'만': 10000, '천': 1000, 'K': 1000, 'k': 1000}.get(unit, 1)
+    tolerance = (0.5 * 10 ** -decimals) * scale if scale > 1 or decimals else 0
+    if unit == '%':
+        tolerance = max(tolerance, PERCENT_TOLERANCE)
+    return value * scale, unit, tolerance
+
+
+def first_quantity(text):
+    match = NUMBER_PATTERN.search(str(text or ''))
+    return parse_quantity(match) if match else None
+
+
+def resolve_metric(base, unit, context):
+    """규칙의 기본 지표 + 단위/문맥 → 실제 지표 이름 (% 이면 _pct, TOP 50 언급이면 top50_)"""
+    if base.startswith('top10_') and re.search(r'TOP\s*50', context):
+        base = 'top50_' + base[len('top10_'):]
+    if unit == '%' and not base.endswith('_pct') and f'{base}_pct' in METRIC_LABELS:
+        return f'{base}_pct'
+    if unit != '%' and base.endswith('_pct') and base[:-4] in METRIC_LABELS:
+        return base[:-4]
+    return base
+
+
+def value_claims(row):
+    """KPI형 행 → [(컬럼, 원문, 지표, (값, 단위, 오차))] (id가 있는 카드 행만, 분포 행은 제외)"""
+    if 'id' not in row or 'chart_type' in row:
+        return []
+    label = ' '.join(str(row.get(column) or '') for column in ('label', 'title'))
+    context = ' '.join(str(row.get(column) or '') for column in ('label', 'sublabel', 'description'))
+    quantity = first_quantity(row.get('value'))
+    if not quantity:
+        return []
+    for pattern, base in VALUE_RULES:
+        if re.search(pattern, label):
+            return [('value', row['value'], resolve_metric(base, quantity[1], context), quantity)]
+    return []
+
+
+def clause_claims(column, text, game_counts):
+    """서술 컬럼 → [(컬럼, 문장, 지표 또는 ('game', 게임명), (값, 단위, 오차))]"""
+    claims = []
+    for clause in CLAUSE_SPLIT.split(str(text or '')):
+        clause = clause.strip()
+        if not clause:
+            continue
+        for match in SCOPE_PATTERN.finditer(clause):
+            keys = [key for pattern, key in CLAUSE_RULES if re.search(pattern, clause)]
+            if len(keys) != 1:
+                continue   # 지표를 하나로 정할 수 없는 문장
+            value = float(match.group(2))
+            unit = match.group(3)
+            metric = f"top{match.group(1)}_{keys[0]}" + ('_pct' if unit == '%' else '')
+            claims.append((column, clause, metric, (value, unit, PERCENT_TOLERANCE if unit == '%' else 0)))
+        games = [game for game in game_counts if game and game in clause]
+        counts = [m for m in NUMBER_PATTERN.finditer(clause) if m.group(2) == '회']
+        if len(games) == 1 and len(counts) == 1:
+            claims.append((column, clause, ('game', games[0]), parse_quantity(counts[0])))
+    return claims
+
+
+def structured_claims(name, row):
+    """구조가 정해진 파일의 행 → [(컬럼, 원문, 지표, (값, 단위, 오차))]"""
+    if name == '03_charts/03_chart_data.csv':
+        quantity = first_quantity(row.get('value'))
+        if not quantity:
+            return []
+        if row.get('chart_type') == 'top_games':
+            return [('value', row['value'], ('game', row.get('stat_type')), quantity)]
+        if row.get('stat_type') == 'count':
+            return [('value', row['value'], ('chart_type', row.get('chart_type')), quantity)]
+    return []
+
+
+# ============================================
+# 비교
+# ============================================
+def cross_check(files, truth, counts):
+    """{CSV 경로: 행 목록} → 보고서 dict (truth, counts는 ground_truth() 결과)"""
+    findings = []
+    unverified = 0
+    for name, rows in sorted(files.items()):
+        for line, row in enumerate(rows, 2):
+            claims = structured_claims(name, row)
+            if not claims:
+                claims = value_claims(row)
+                for column in FREE_TEXT_COLUMNS:
+                    if row.get(column):
+                        claims.extend(clause_claims(column, row[column], counts['game']))
+            for column, text, metric, (value, unit, tolerance) in claims:
+                if isinstance(metric, tuple):
+                    kind, key = metric
+                    actual = counts[kind].get(key)
+                    label = f"{key} 차트인 횟수" if kind == 'game' else f"{key} 노출 횟수"
+                    metric = f"{kind}:{key}"
+                else:
+                    actual = truth.get(metric)
+                    label = METRIC_LABELS.get(metric, metric)
+                if actual is None:
+                    unverified += 1
+                    continue
+                findings.append({
+                    'file': name, 'row': line, 'column': column, 'text': text, 'metric': metric, 'label': label,
+                    'claimed': value, 'actual': actual, 'unit': unit,
+                    'status': 'ok' if abs(value - actual) <= tolerance else 'mismatch',
+                })
+    mismatches = [f for f in findings if f['status'] == 'mismatch']
+    return {
+        'checked_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'files': len(files),
+        'checked': len(findings),
+        'mismatches': len(mismatches),
+        'unverified': unverified,
+        'findings': findings,
+    }
+
+
+def check_dataset(data_dir, tables):
+    """data_dir의 섹션 CSV 전체를 검사하고 보고서를 data_dir/.cross_check.json 에 저장"""
+    data_dir = Path(data_dir)
+    truth, counts = ground_truth(tables)
+    report = cross_check(collect_files(data_dir), truth, counts)
+    report['truth'] = truth
+    report['missing_sources'] = [key for key in METRIC_SOURCES if tables.get(key) is None]
+    (data_dir / REPORT_NAME).write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding='utf-8')
+    return report
+
+
+def _format(value):
+    return f"{value:,.0f}" if float(value).is_integer() or abs(value) >= 1000 else f"{value:,.1f}"
+
+
+def print_report(report, limit=20):
+    print(f"\n🔎 수치 교차 검증: {report['files']}개 CSV, 숫자 {report['checked']}개 비교, "
+          f"불일치 {report['mismatches']}개 (검증 안 됨 {report['unverified']}개)")
+    if report.get('missing_sources'):
+        print(f"   ⚠️ 원본 없음: {', '.join(report['missing_sources'])} → 이 파일로 계산하는 수치는 검증 안 됨으로 셉니다")
+    mismatches = [f for f in report['findings'] if f['status'] == 'mismatch']
+    for f in mismatches[:limit]:
+        diff = f['claimed'] - f['actual']
+        print(f"   ❌ {f['file']} {f['row']}행 {f['column']} '{f['text'][:40]}' → "
+              f"{f['label']} {_format(f['actual'])} (차이 {'+' if diff > 0 else ''}{_format(diff)})")
+    if len(mismatches) > limit:
+        print(f"   ... 외 {len(mismatches) - limit}개 ({REPORT_NAME} 참고)")
+    if not mismatches and report['checked']:
+        print("   ✅ 모든 수치가 원본 계산과 일치합니다")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="생성된 CSV 수치를 원본 계산값과 교차 검증")
+    parser.add_argument("--data-dir", type=Path, default=GITHUB_DATA_DIR, help="검사할 섹션 CSV 폴더")
+    parser.add_argument("--raw-dir", type=Path, default=RAW_DIR, help="노션 원본 CSV 폴더")
+    parser.add_argument("--festival", help="원본 대신 축제 기록 저장소의 데이터 사용")
+    parser.add_argument("--store", type=Path, help="축제 기록 저장소 위치")
+    parser.add_argument("--strict", action="store_true", help="불일치가 있으면 종료 코드 1")
+    args = parser.parse_args(argv)
+
+    if args.festival:
+        from festival_store import FestivalStore, DEFAULT_STORE
+        with FestivalStore(args.store or DEFAULT_STORE) as store:
+            tables = store.load_dataset(args.festival)
+    else:
+        from snf_dataset import load_dataset
+        tables = load_dataset(args.raw_dir)
+    report = check_dataset(args.data_dir, tables)
+    print_report(report)
+    return 1 if args.strict and report['mismatches'] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
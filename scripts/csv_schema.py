@@ -0,0 +1,275 @@
+"""
+출력 CSV 스키마와 응답 파싱
+===========================
+Gemini 응답을 csv 모듈로 파싱하고, 출력 파일별 스키마로 컬럼/값을 검사합니다.
+따옴표 안의 쉼표, "" 이스케이프, 값 안의 줄바꿈을 처리하며, 고칠 수 있는 행은 고치고
+나머지는 버린 뒤 파일별 통계를 남깁니다. 통계가 나쁘면(ok=False) 기존 CSV를 덮어쓰지 않습니다.
+
+    rows, stats = parse_response(response_text, SCHEMAS['01_executive/01_strategies.csv'])
+    stats.summary()  →  "3행 (복구 1, 거부 0)"
+
+스키마 항목:
+    columns   출력 컬럼 (대시보드 update* / render_* 함수가 읽는 이름, 이 순서로 저장)
+    types     컬럼별 값 형식 (TYPE_PATTERNS, 빈 값은 검사하지 않음)
+    required  비어 있으면 안 되는 컬럼
+    text      값 개수가 넘칠 때 넘친 값을 쉼표로 다시 합칠 자유 서술 컬럼 (따옴표 누락 복구)
+    min_rows  프롬프트가 요구한 최소 행 수 (모자라면 불량)
+
+복구하는 경우: 헤더 공백/대소문자/따옴표, 헤더 누락, 끝의 빈 값 누락/초과, 색상의 # 누락
+불량 응답은 stats.problems()를 repair_prompt()로 원래 프롬프트에 붙여 다시 요청합니다 (generate_insights.py).
+"""
+
+import csv
+import io
+import re
+
+MAX_REJECT_RATIO = 0.5   # 이보다 많이 버려지면 응답 전체를 불량으로 처리
+
+TYPE_PATTERNS = {
+    'int': re.compile(r'[-+]?\d[\d,]*'),
+    'number': re.compile(r'[-+]?\d[\d,]*(?:\.\d+)?'),
+    'percent': re.compile(r'[-+]?\d+(?:\.\d+)?%'),
+    'color': re.compile(r'#(?:[0-9A-Fa-f]{3}|[0-9A-Fa-f]{6})'),
+    'date': re.compile(r'\d{4}-\d{2}-\d{2}'),
+}
+
+CARD_COLUMNS = ['id', 'icon', 'title', 'description']
+
+
+def _cards(extra, min_rows, text='description', **types):
+    return {'columns': CARD_COLUMNS + [extra], 'types': {'id': 'int', **types},
+            'required': ['title'], 'text': text, 'min_rows': min_rows}
+
+
+def _kpi(columns, min_rows, **types):
+    return {'columns': ['id', 'icon', 'value', 'label'] + columns, 'types': {'id': 'int', **types},
+            'required': ['value', 'label'], 'text': None, 'min_rows': min_rows}
+
+
+def _table(columns, required=('name',), **types):
+    return {'columns': columns, 'types': types, 'required': list(required), 'text': None, 'min_rows': 1}
+
+
+CHART_ROW_COLUMNS = ['chart_type', 'label', 'value', 'color']
+
+SCHEMAS = {
+    # 01_executive
+    '01_executive/01_strategies.csv': _cards('details', 3),
+    '01_executive/02_kpi_cards.csv': _kpi(['sublabel', 'color'], 4, color='color'),
+    '01_executive/03_insights.csv': _cards('border_color', 4, border_color='color'),
+    '01_executive/04_top5_games.csv': _table(['rank', 'name', 'genre', 'wishlist_increase', 'wishlist_percent',
+                                              'review_status'], rank='int', wishlist_increase='int'),
+    '01_executive/05_chart_summary.csv': _kpi(['description'], 3),
+    '01_executive/06_genre_distribution.csv': _table(['id', 'icon', 'genre', 'percentage', 'color'], ('genre',),
+                                                     id='int', percentage='percent', color='color'),
+    '01_executive/07_snf_guide.csv': _cards('status', 4),
+    # 02_top_games
+    '02_top_games/01_kpi_cards.csv': _kpi(['sublabel', 'highlight'], 2),
+    '02_top_games/02_key_findings.csv': _cards('border_color', 4, border_color='color'),
+    '02_top_games/03_top10_table.csv': _table(['rank', 'name', 'genre', 'review_status', 'review_count',
+                                               'wishlist_before', 'wishlist_after', 'wishlist_increase',
+                                               'wishlist_percent', 'top_language'], rank='int'),
+    '02_top_games/04_top10_charts.csv': _table(CHART_ROW_COLUMNS, ('chart_type', 'label'), color='color'),
+    '02_top_games/05_top50_table.csv': _table(['rank', 'name', 'genre', 'play_type', 'demo_available',
+                                               'release_date', 'chart_count', 'notes'], rank='int'),
+    '02_top_games/06_top50_charts.csv': _table(CHART_ROW_COLUMNS + ['percentage'], ('chart_type', 'label'),
+                                               color='color'),
+    # 03_charts
+    '03_charts/01_kpi_cards.csv': _kpi(['description', 'color'], 3, color='color'),
+    '03_charts/02_key_findings.csv': _cards('color', 4, color='color'),
+    '03_charts/03_chart_data.csv': _table(['chart_type', 'stat_type', 'label', 'value', 'percentage'],
+                                          ('chart_type', 'stat_type')),
+    '03_charts/04_strategy_cards.csv': _cards('details', 3),
+    '03_charts/05_demo_chart.csv': _table(['rank', 'name', 'appearances', 'best_rank', 'first_date', 'last_date',
+                                           'consecutive_days'], rank='int', appearances='int', best_rank='int'),
+    '03_charts/06_popular_upcoming.csv': _table(['rank', 'name', 'appearances', 'best_rank', 'first_date',
+                                                 'last_date'], rank='int', appearances='int', best_rank='int'),
+    '03_charts/07_trending_upcoming.csv': _table(['rank', 'name', 'appearances', 'best_rank', 'trend_direction',
+                                                  'notes'], rank='int', appearances='int', best_rank='int'),
+    '03_charts/10_daily_activity.csv': _table(['date', 'chart_type', 'games'], ('date', 'chart_type'),
+                                              date='date', games='int'),
+    # 04_report
+    '04_report/01_checklist.csv': _cards('detail_items', 4),
+    '04_report/02_kpi_cards.csv': _kpi(['sublabel', 'highlight'], 4),
+    '04_report/03_tags_analysis.csv': _table(['analysis_type', 'rank', 'tag_name', 'count', 'percentage',
+                                              'category'], ('analysis_type', 'rank')),
+    '04_report/04_language_support.csv': _table(['support_type', 'rank', 'language', 'game_count', 'percentage',
+                                                 'priority', 'note'], ('support_type', 'language')),
+    '04_report/05_community.csv': _table(['analysis_type', 'platform', 'usage_rate', 'priority', 'region_target'],
+                                         ('analysis_type', 'platform')),
+    '04_report/07_language_charts.csv': _table(CHART_ROW_COLUMNS, ('chart_type', 'label'), color='color'),
+}
+
+
+class ParseStats:
+    """파일 하나의 파싱 결과 통계"""
+
+    def __init__(self, schema=None):
+        self.min_rows = schema['min_rows'] if schema else 1
+        self.rows = 0              # 저장할 행
+        self.repaired = 0          # 고쳐서 살린 행
+        self.rejected = 0          # 버린 행
+        self.missing_columns = []  # 응답에 없는 스키마 컬럼
+        self.extra_columns = []    # 스키마에 없어 버린 컬럼
+        self.errors = []           # 버린 행 사유 (앞쪽 몇 개만)
+
+    @property
+    def ok(self):
+        """저장해도 되는 응답인지 (컬럼이 맞고, 행 수가 충분하고, 대부분 살아남음)"""
+        return not self.problems()
+
+    def problems(self):
+        """스키마 검사에 걸린 이유 목록 (재요청 프롬프트에 그대로 붙임)"""
+        problems = []
+        if self.missing_columns:
+            problems.append(f"헤더에 {', '.join(self.missing_columns)} 컬럼이 없습니다")
+        if self.rows < self.min_rows:
+            problems.append(f"유효한 행이 {self.rows}개입니다 (최소 {self.min_rows}개 필요)")
+        if self.rejected > (self.rows + self.rejected) * MAX_REJECT_RATIO:
+            problems.append(f"{self.rows + self.rejected}행 중 {self.rejected}행의 형식이 틀렸습니다")
+        if problems:
+            problems.extend(self.errors)   # 버린 행 사유도 함께
+        return problems
+
+    def reject(self, line, reason):
+        self.rejected += 1
+        if len(self.errors) < 5:
+            self.errors.append(f"{line}행: {reason}")
+
+    def summary(self):
+        text = f"{self.rows}행 (복구 {self.repaired}, 거부 {self.rejected})"
+        if self.missing_columns:
+            text += f", 누락 컬럼: {', '.join(self.missing_columns)}"
+        if self.extra_columns:
+            text += f", 무시한 컬럼: {', '.join(self.extra_columns)}"
+        return text
+
+
+def extract_csv_block(response_text):
+    """응답에서 CSV 부분만 (```csv 블록 → 아무 ``` 블록 → 전체)"""
+    text = (response_text or '').strip()
+    match = re.search(r'```csv\s*(.*?)\s*```', text, re.DOTALL) or re.search(r'```\w*\s*(.*?)\s*```', text, re.DOTALL)
+    return match.group(1).strip() if match else text.strip('`').strip()
+
+
+def _normalize_header(name):
+    return name.replace('\ufeff', '').strip().strip('"').strip().lower()
+
+
+def _fix_width(values, columns, schema):
+    """값 개수를 컬럼 수에 맞춤 (못 맞추면 None)"""
+    width = len(columns)
+    if len(values) > width:
+        overflow = values[width:]
+        if not any(value.strip() for value in overflow):
+            return values[:width]          # 끝에 붙은 빈 값 (쉼표 초과)
+        text = schema.get('text') if schema else None
+        if text not in columns:
+            return None
+        # 따옴표 없이 쉼표가 들어간 서술 컬럼 → 넘친 만큼 다시 합침
+        i, extra = columns.index(text), len(values) - width
+        return values[:i] + [', '.join(values[i:i + extra + 1])] + values[i + extra + 1:]
+    if len(values) < width:
+        missing = columns[len(values):]
+        if schema and any(column in schema['required'] for column in missing):
+            return None
+        return values + [''] * (width - len(values))
+    return values
+
+
+def _check_row(row, schema):
+    """형식 검사 → (행, 고쳤는지) 또는 (None, 사유)"""
+    repaired = False
+    for column in schema['required']:
+        if not row.get(column):
+            return None, f"{column} 비어 있음"
+    for column, kind in schema['types'].items():
+        value = row.get(column, '')
+        if not value or TYPE_PATTERNS[kind].fullmatch(value):
+            continue
+        if kind == 'color' and TYPE_PATTERNS[kind].fullmatch('#' + value):
+            row[column] = '#' + value
+            repaired = True
+            continue
+        return None, f"{column}={value!r} ({kind} 형식 아님)"
+    return row, repaired
+
+
+def validate_rows(rows, schema):
+    """이미 dict인 행 목록(--batch JSON 응답)을 스키마로 검사"""
+    stats = ParseStats(schema)
+    if not schema:
+        stats.rows = len(rows)
+        return rows, stats
+    columns = schema['columns']
+    present = {key for row in rows for key in row}
+    stats.missing_columns = [column for column in columns if column not in present]
+    stats.extra_columns = sorted(present - set(columns))
+    result = []
+    for line, row in enumerate(rows, 1):
+        row = {column: str(row.get(column) or '').strip() for column in columns}
+        row, note = _check_row(row, schema)
+        if row is None:
+            stats.reject(line, note)
+            continue
+        stats.repaired += bool(note)
+        result.append(row)
+    stats.rows = len(result)
+    return result, stats
+
+
+def parse_csv_text(csv_text, schema=None):
+    """CSV 텍스트 → (행 목록, ParseStats)"""
+    stats = ParseStats(schema)
+    records = [record for record in csv.reader(io.StringIO(csv_text), skipinitialspace=True)
+               if any(value.strip() for value in record)]
+    if not records:
+        return [], stats
+    header = [_normalize_header(name) for name in records[0]]
+    body = records[1:]
+    if schema:
+        columns = schema['columns']
+        if not set(columns) & set(header) and len(records[0]) == len(columns):
+            # 헤더 없이 데이터부터 시작한 응답
+            header, body = columns, records
+            stats.repaired += 1
+        stats.missing_columns = [column for column in columns if column not in header]
+        stats.extra_columns = [name for name in header if name and name not in columns]
+    else:
+        columns = header
+    # 헤더 이름 기준으로 값을 모은 뒤 스키마 순서로 재배치
+    result = []
+    for line, values in enumerate(body, 2):
+        values = [value.strip() for value in values]
+        fixed = _fix_width(values, header, schema)
+        if fixed is None:
+            stats.reject(line, f"값 {len(values)}개 (컬럼 {len(header)}개)")
+            continue
+        repaired = fixed is not values
+        row = dict(zip(header, fixed))
+        row = {column: row.get(column, '') for column in columns}
+        if schema:
+            row, note = _check_row(row, schema)
+            if row is None:
+                stats.reject(line, note)
+                continue
+            repaired = repaired or note
+        stats.repaired += bool(repaired)
+        result.append(row)
+    stats.rows = len(result)
+    return result, stats
+
+
+def parse_response(response_text, schema=None):
+    """Gemini 응답 → (행 목록, ParseStats)"""
+    return parse_csv_text(extract_csv_block(response_text), schema)
+
+
+def repair_prompt(prompt, problems, schema=None):
+    """원래 프롬프트 + 이전 응답의 문제 → 재요청 프롬프트"""
+    lines = [prompt.rstrip(), "", "## 이전 응답의 문제 (반드시 고쳐서 다시 출력)"]
+    lines.extend(f"- {problem}" for problem in problems)
+    if schema:
+        lines.append(f"- 헤더는 정확히 {','.join(schema['columns'])} 이어야 하고, 최소 {schema['min_rows']}행이 필요합니다")
+    lines.append("- 쉼표가 들어간 값은 큰따옴표로 감싸세요. 다른 설명 없이 ```csv 블록 하나만 출력하세요.")
+    return '\n'.join(lines) + '\n'
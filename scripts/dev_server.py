@@ -0,0 +1,251 @@
+"""
+로컬 미리보기 서버
+==================
+github_data/를 로컬에서 바로 서빙하고, CSV가 바뀌면 열려 있는 대시보드의 해당 섹션만 다시 그립니다.
+generate_insights.py 결과를 GitHub에 올리지 않고 몇 초 만에 확인할 수 있습니다.
+
+    http://localhost:8000/                 dashboard.html (아래 상수를 바꿔서 전달, 파일은 그대로)
+        GITHUB_BASE_URL → /github_data/     PRERENDERED_AT, DATA_BUNDLE → ''    DEV_EVENTS → /__events
+    /github_data/<경로>                    ETag 포함, If-None-Match가 같으면 304
+    /__events                              Server-Sent Events: 바뀐 CSV 목록 + 새 그래프 시리즈
+
+감시는 POLL_INTERVAL초마다 0*/*.csv의 수정 시각/크기를 비교하는 방식이며 (추가 패키지 불필요),
+쓰기가 DEBOUNCE초 동안 멈춘 뒤에 한 번만 알립니다.
+
+사용법:
+    python dev_server.py                 # 다른 터미널에서 generate_insights.py 실행
+    python dev_server.py --port 8080 --data-dir ../tmp/github_data
+"""
+
+import argparse
+import hashlib
+import json
+import queue
+import re
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+from build_bundle import DASHBOARD_PATH, GITHUB_DATA_DIR, SECTION_GLOB, collect_files
+from chart_series import build_series
+
+DEFAULT_PORT = 8000
+POLL_INTERVAL = 0.5      # 초
+DEBOUNCE = 0.3           # 초 (마지막 쓰기 후 이만큼 조용하면 알림)
+KEEPALIVE = 15           # 초 (SSE 연결 유지용 주석 전송 간격)
+EVENTS_PATH = "/__events"
+DATA_PREFIX = "/github_data/"
+
+CONTENT_TYPES = {
+    ".html": "text/html; charset=utf-8",
+    ".csv": "text/csv; charset=utf-8",
+    ".json": "application/json; charset=utf-8",
+    ".gz": "application/gzip",
+}
+
+# 미리보기용으로 바꿔 넣는 dashboard.html 상수
+DEV_CONSTANTS = {
+    "GITHUB_BASE_URL": DATA_PREFIX,
+    "PRERENDERED_AT": "",
+    "DATA_BUNDLE": "",
+    "DEV_EVENTS": EVENTS_PATH,
+}
+
+
+def dev_dashboard(text):
+    """dashboard.html → 로컬 서버용 (const 이름 = '...'; 값만 교체)"""
+    for name, value in DEV_CONSTANTS.items():
+        text, count = re.subn(rf"(const {name} = ')[^']*(';)", lambda m: f"{m.group(1)}{value}{m.group(2)}", text)
+        if count == 0:
+            raise ValueError(f"dashboard.html에서 {name} 상수를 찾지 못했습니다.")
+    return text
+
+
+def etag_for(content):
+    return '"' + hashlib.sha256(content).hexdigest()[:16] + '"'
+
+
+# ============================================
+# 파일 감시 / 알림
+# ============================================
+class ChangeHub:
+    """SSE 구독자 목록 (구독자마다 큐 하나)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._queues = set()
+
+    def subscribe(self):
+        q = queue.Queue()
+        with self._lock:
+            self._queues.add(q)
+        return q
+
+    def unsubscribe(self, q):
+        with self._lock:
+            self._queues.discard(q)
+
+    def publish(self, message):
+        with self._lock:
+            queues = list(self._queues)
+        for q in queues:
+            q.put(message)
+        return len(queues)
+
+
+def snapshot(data_dir):
+    """{'01_executive/01_strategies.csv': (수정 시각, 크기)}"""
+    result = {}
+    for path in data_dir.glob(SECTION_GLOB):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:   # 스캔 도중 교체된 파일
+            continue
+        result[path.relative_to(data_dir).as_posix()] = (stat.st_mtime_ns, stat.st_size)
+    return result
+
+
+def watch(data_dir, hub, stop):
+    """stop이 설정될 때까지 data_dir을 감시하고 바뀐 CSV를 hub로 알림"""
+    previous = snapshot(data_dir)
+    pending, last_change = set(), 0.0
+    while not stop.wait(POLL_INTERVAL):
+        current = snapshot(data_dir)
+        changed = {name for name in previous.keys() | current.keys() if previous.get(name) != current.get(name)}
+        previous = current
+        if changed:
+            pending |= changed
+            last_change = time.monotonic()
+            continue
+        if pending and time.monotonic() - last_change >= DEBOUNCE:
+            files = sorted(pending)
+            pending = set()
+            try:
+                series = build_series(collect_files(data_dir))
+            except (OSError, ValueError) as e:
+                print(f"   ⚠️ 그래프 시리즈 계산 실패: {e}")
+                series = None
+            listeners = hub.publish({'files': files, 'series': series})
+            print(f"🔁 {len(files)}개 CSV 변경 → 대시보드 {listeners}개에 알림: {', '.join(files)}")
+
+
+# ============================================
+# HTTP
+# ============================================
+class DevRequestHandler(BaseHTTPRequestHandler):
+    server_version = "SNFDevServer/1.0"
+    data_dir = GITHUB_DATA_DIR
+    dashboard_path = DASHBOARD_PATH
+    hub = None
+
+    def do_GET(self):
+        path = unquote(urlsplit(self.path).path)
+        if path in ("/", "/dashboard.html"):
+            try:
+                text = dev_dashboard(self.dashboard_path.read_text(encoding='utf-8'))
+            except ValueError as e:
+                self.send_error(HTTPStatus.INTERNAL_SERVER_ERROR, str(e))
+                return
+            self.send_content(text.encode('utf-8'), CONTENT_TYPES[".html"])
+        elif path == EVENTS_PATH:
+            self.stream_events()
+        elif path.startswith(DATA_PREFIX):
+            self.send_data_file(path[len(DATA_PREFIX):])
+        else:
+            self.send_error(HTTPStatus.NOT_FOUND)
+
+    def send_data_file(self, relative):
+        root = self.data_dir.resolve()
+        target = (root / relative).resolve()
+        if not target.is_relative_to(root) or not target.is_file():
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+        self.send_content(target.read_bytes(), CONTENT_TYPES.get(target.suffix, "application/octet-stream"))
+
+    def send_content(self, content, content_type):
+        """ETag를 붙여 전송 (브라우저가 보낸 If-None-Match와 같으면 304)"""
+        etag = etag_for(content)
+        matches = {tag.strip() for tag in self.headers.get("If-None-Match", "").split(",")}
+        if etag in matches or "*" in matches:
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+            self.end_headers()
+            return
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(content)))
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "no-cache")   # 매번 재검증 → 바뀌지 않았으면 304
+        self.end_headers()
+        self.wfile.write(content)
+
+    def stream_events(self):
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "text/event-stream; charset=utf-8")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        q = self.hub.subscribe()
+        try:
+            self.wfile.write(b"retry: 2000\n\n")
+            self.wfile.flush()
+            while True:
+                try:
+                    message = q.get(timeout=KEEPALIVE)
+                except queue.Empty:
+                    self.wfile.write(b": keepalive\n\n")
+                else:
+                    data = json.dumps(message, ensure_ascii=False, separators=(',', ':'))
+                    self.wfile.write(f"event: change\ndata: {data}\n\n".encode('utf-8'))
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            self.hub.unsubscribe(q)
+
+    def log_request(self, code='-', size='-'):
+        # 200/304는 너무 잦아서 오류 응답만 출력
+        if isinstance(code, int) and code >= 400:
+            super().log_request(code, size)
+
+
+def serve(data_dir=GITHUB_DATA_DIR, dashboard_path=DASHBOARD_PATH, host="127.0.0.1", port=DEFAULT_PORT):
+    """서버 + 감시 스레드 시작 (Ctrl+C로 종료)"""
+    hub = ChangeHub()
+    handler = type("Handler", (DevRequestHandler,),
+                   {'data_dir': Path(data_dir), 'dashboard_path': Path(dashboard_path), 'hub': hub})
+    stop = threading.Event()
+    watcher = threading.Thread(target=watch, args=(Path(data_dir), hub, stop), daemon=True)
+    with ThreadingHTTPServer((host, port), handler) as httpd:
+        httpd.daemon_threads = True
+        watcher.start()
+        print(f"🌐 http://{host}:{port}/  (github_data: {data_dir})")
+        print("   CSV가 바뀌면 열린 대시보드의 해당 섹션만 다시 그립니다. 종료: Ctrl+C")
+        try:
+            httpd.serve_forever()
+        except KeyboardInterrupt:
+            print("\n👋 서버 종료")
+        finally:
+            stop.set()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="SNF 대시보드 로컬 미리보기 서버")
+    parser.add_argument("--data-dir", type=Path, default=GITHUB_DATA_DIR, help="서빙/감시할 github_data 폴더")
+    parser.add_argument("--dashboard", type=Path, default=DASHBOARD_PATH, help="dashboard.html 경로")
+    parser.add_argument("--host", default="127.0.0.1", help="바인드 주소 (기본: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"포트 (기본: {DEFAULT_PORT})")
+    args = parser.parse_args(argv)
+
+    if not args.data_dir.is_dir():
+        print(f"❌ {args.data_dir} 폴더가 없습니다.")
+        return 1
+    serve(args.data_dir, args.dashboard, args.host, args.port)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,104 @@
+"""
+로컬 가짜 Gemini 클라이언트
+===========================
+API 키 없이 스케줄러와 재시도 로직을 시험하기 위한 클라이언트입니다.
+google.genai.Client와 같은 모양(client.models.generate_content)을 가지며,
+프롬프트 마지막의 ```csv 출력 형식 예시를 그대로 돌려줍니다.
+
+    python generate_insights.py --fake --output-dir /tmp/snf_out
+
+error_rate 비율만큼 429 RESOURCE_EXHAUSTED 오류를 흉내 냅니다.
+invalid_rate 비율만큼 헤더만 있는 CSV(행 0개)를 돌려줘 스키마 검사/재요청을 시험합니다.
+config에 response_schema가 있으면 (--batch) 작업별 ```csv 예시를 JSON 객체로 묶어 돌려줍니다.
+responder(model, contents, config)를 주면 예시 대신 그 반환값을 돌려줍니다 (llm_backends.ReplayBackend).
+"""
+
+import csv
+import io
+import json
+import random
+import re
+import threading
+import time
+from types import SimpleNamespace
+
+
+class FakeClientError(Exception):
+    """google.genai.errors.ClientError 흉내 (메시지에 상태 코드 포함)"""
+
+
+class FakeModels:
+    def __init__(self, owner):
+        self.owner = owner
+
+    def generate_content(self, model, contents, config=None):
+        return self.owner._generate(model, contents, config)
+
+
+class FakeGeminiClient:
+    """지연 시간과 429 비율을 조절할 수 있는 가짜 클라이언트"""
+
+    def __init__(self, latency=0.2, error_rate=0.0, seed=None, invalid_rate=0.0, responder=None):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.invalid_rate = invalid_rate
+        self.responder = responder
+        self.random = random.Random(seed)
+        self.models = FakeModels(self)
+        self.lock = threading.Lock()
+        self.calls = []          # (시작 시각, 모델명) 기록
+        self.errors = 0
+        self.invalid = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def _generate(self, model, contents, config=None):
+        with self.lock:
+            self.calls.append((time.monotonic(), model))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            fail = self.random.random() < self.error_rate
+            invalid = self.random.random() < self.invalid_rate
+            if invalid:
+                self.invalid += 1
+        try:
+            time.sleep(self.latency)
+            if fail:
+                with self.lock:
+                    self.errors += 1
+                raise FakeClientError(
+                    "429 RESOURCE_EXHAUSTED. {'error': {'code': 429, 'status': 'RESOURCE_EXHAUSTED'}}"
+                )
+            if self.responder:
+                text = self.responder(model, contents, config)
+                return SimpleNamespace(text=self._truncate(text) if invalid else text)
+            if config and config.get('response_schema'):
+                return SimpleNamespace(text=json.dumps(self._batch_response(contents, config), ensure_ascii=False))
+            example = self._example_csv(contents)
+            if invalid:
+                example = example.split('\n', 1)[0]
+            return SimpleNamespace(text=f"```csv\n{example}\n```")
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+    @staticmethod
+    def _truncate(text):
+        """응답의 ```csv 블록을 헤더 줄만 남김 (블록이 없으면 빈 응답)"""
+        match = re.search(r'```csv\s*([^\n]*)', text)
+        return f"```csv\n{match.group(1)}\n```" if match else ""
+
+    @staticmethod
+    def _example_csv(text):
+        # 마지막 ```csv 블록이 출력 형식 예시
+        blocks = re.findall(r'```csv\s*(.*?)\s*```', text, re.DOTALL)
+        return blocks[-1] if blocks else "id,value\n1,fake"
+
+    def _batch_response(self, contents, config):
+        """'### 작업: <ID>' 구역마다 예시 CSV → {ID: 행 배열}"""
+        sections = dict(re.findall(r'### 작업: (\S+)[^\n]*\n(.*?)(?=\n### 작업: |\Z)', contents, re.DOTALL))
+        result = {}
+        for task in config['response_schema'].get('properties', {}):
+            example = self._example_csv(sections.get(task, ''))
+            result[task] = list(csv.DictReader(io.StringIO(example)))
+        return result
@@ -0,0 +1,228 @@
+"""
+SNF 축제별 기록 저장소
+======================
+넥스트 페스트마다 내보낸 노션 CSV를 SQLite 파일 하나에 축제 단위로 쌓아 둡니다.
+한 번 넣어 둔 축제는 원본 CSV를 다시 읽지 않고 통계/CSV 생성이나 축제 간 비교에 사용합니다.
+
+    github_data/history.sqlite
+      festivals   축제 목록 (이름, 기간, 원본 폴더, 저장 시각)
+      raw_files   축제 × RAW_FILES 키별 원본 파일명, SHA-256, 행 수, 프롬프트용 앞부분
+      <RAW_FILES 키>  snf_dataset.SCHEMAS 컬럼 + festival (+ 차트 파일은 date로 색인)
+
+사용법:
+    python festival_store.py ingest 2025-06 --raw-dir ../github_data/raw
+    python festival_store.py list
+    python generate_insights.py --festival 2025-06
+    python ../verify_and_generate.py --festival 2025-06 --festival 2025-10
+"""
+
+import argparse
+import sqlite3
+from datetime import date, datetime
+from pathlib import Path
+
+from build_manifest import fingerprint_file
+from game_catalog import load_catalog
+from snf_dataset import RAW_FILES, SCHEMAS, Preview, RowStream, Table, find_csv_file
+
+BASE_DIR = Path(__file__).parent.parent
+DEFAULT_STORE = BASE_DIR / "github_data" / "history.sqlite"
+
+SQL_TYPES = {"str": "TEXT", "int": "INTEGER", "date": "TEXT", "app_id": "TEXT"}
+
+
+def _columns(key):
+    """저장할 컬럼 목록 [(이름, 타입)] (스키마 밖 헤더는 저장하지 않음)"""
+    return [(name, kind) for name, _, kind in SCHEMAS[key]]
+
+
+def _to_sql(value):
+    return value.isoformat() if isinstance(value, date) else value
+
+
+def _from_sql(kind, value):
+    if kind == "date" and value:
+        return date.fromisoformat(value)
+    if kind == "str" and value is None:
+        return ''
+    return value
+
+
+class FestivalStore:
+    """축제/날짜로 나뉜 원본 데이터 저장소"""
+
+    def __init__(self, path=DEFAULT_STORE):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.path)
+        self._create_tables()
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _create_tables(self):
+        with self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS festivals (
+                    festival TEXT PRIMARY KEY,
+                    start_date TEXT,
+                    end_date TEXT,
+                    raw_dir TEXT,
+                    ingested_at TEXT
+                )""")
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS raw_files (
+                    festival TEXT,
+                    key TEXT,
+                    file TEXT,
+                    sha256 TEXT,
+                    rows INTEGER,
+                    preview TEXT,
+                    PRIMARY KEY (festival, key)
+                )""")
+            for key in RAW_FILES:
+                columns = ", ".join(f'"{name}" {SQL_TYPES[kind]}' for name, kind in _columns(key))
+                self.conn.execute(f'CREATE TABLE IF NOT EXISTS "{key}" (festival TEXT, row_no INTEGER, {columns})')
+                self.conn.execute(f'CREATE INDEX IF NOT EXISTS "{key}_festival" ON "{key}" (festival, row_no)')
+                if "date" in dict(_columns(key)):
+                    self.conn.execute(f'CREATE INDEX IF NOT EXISTS "{key}_date" ON "{key}" (festival, date)')
+
+    # ----------------------------------------
+    # 저장
+    # ----------------------------------------
+    def ingest(self, festival, raw_dir):
+        """raw_dir의 RAW_FILES를 축제 이름으로 저장 (같은 축제가 있으면 파일 단위로 교체)
+
+        파일을 한 행씩 읽어 바로 INSERT하므로 수백 MB짜리 로그도 메모리에 올리지 않습니다.
+        SHA-256이 같은 파일은 건너뛰며, 새로 저장한 {키: 행 수}를 반환합니다.
+        """
+        known = {key: sha for key, sha in self.conn.execute(
+            "SELECT key, sha256 FROM raw_files WHERE festival = ?", (festival,))}
+        changed = {}
+        with self.conn:
+            for key, pattern in RAW_FILES.items():
+                path = find_csv_file(raw_dir, pattern)
+                if not path or known.get(key) == fingerprint_file(path):
+                    continue
+                stream = RowStream(key, path)
+                preview = Preview(stream)
+                names = [name for name, _ in _columns(key)]
+                placeholders = ", ".join("?" for _ in range(len(names) + 2))
+                quoted = ", ".join(f'"{name}"' for name in names)
+                self.conn.execute(f'DELETE FROM "{key}" WHERE festival = ?', (festival,))
+                self.conn.executemany(
+                    f'INSERT INTO "{key}" (festival, row_no, {quoted}) VALUES ({placeholders})',
+                    ((festival, i, *(_to_sql(row.get(name)) for name in names))
+                     for i, row in enumerate(preview.rows())))
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO raw_files VALUES (?, ?, ?, ?, ?, ?)",
+                    (festival, key, path.name, stream.sha256, stream.rows, preview.render()))
+                changed[key] = stream.rows
+            start, end = self.conn.execute(
+                'SELECT MIN(date), MAX(date) FROM "chart_integration" WHERE festival = ?', (festival,)).fetchone()
+            self.conn.execute(
+                "INSERT OR REPLACE INTO festivals VALUES (?, ?, ?, ?, ?)",
+                (festival, start, end, str(raw_dir), datetime.now().strftime('%Y-%m-%d %H:%M:%S')))
+        return changed
+
+    # ----------------------------------------
+    # 조회
+    # ----------------------------------------
+    def festivals(self):
+        """저장된 축제 목록 (시작일 순)"""
+        cursor = self.conn.execute(
+            "SELECT festival, start_date, end_date, raw_dir, ingested_at FROM festivals "
+            "ORDER BY start_date, festival")
+        names = [c[0] for c in cursor.description]
+        return [dict(zip(names, row)) for row in cursor]
+
+    def load_table(self, festival, key):
+        """축제 하나의 RAW_FILES 키 → Table (없으면 None)"""
+        meta = self.conn.execute(
+            "SELECT file, sha256, preview FROM raw_files WHERE festival = ? AND key = ?", (festival, key)).fetchone()
+        if not meta:
+            return None
+        columns = _columns(key)
+        quoted = ", ".join(f'"{name}"' for name, _ in columns)
+        rows = self.conn.execute(
+            f'SELECT {quoted} FROM "{key}" WHERE festival = ? ORDER BY row_no', (festival,)).fetchall()
+        data = {name: [_from_sql(kind, row[i]) for row in rows] for i, (name, kind) in enumerate(columns)}
+        file, sha256, preview = meta
+        return Table(key, data, path=Path(file) if file else None, sha256=sha256, preview=preview)
+
+    def load_dataset(self, festival):
+        """snf_dataset.load_dataset()과 같은 모양 ({키: Table 또는 None})"""
+        if not self.conn.execute("SELECT 1 FROM festivals WHERE festival = ?", (festival,)).fetchone():
+            raise KeyError(f"저장소에 없는 축제: {festival}")
+        return {key: self.load_table(festival, key) for key in RAW_FILES}
+
+    def chart_entries(self, festivals=None, start=None, end=None, catalog=None):
+        """여러 축제의 3종 차트 기록 (normalize_chart_entries() 형식 + festival)
+
+        start/end(date)로 기간을 자를 수 있습니다. 게임명은 축제가 달라도 카탈로그 표시명으로 통일합니다.
+        """
+        query = 'SELECT festival, game, date, rank, chart_type FROM "chart_integration" WHERE 1 = 1'
+        params = []
+        if festivals:
+            query += f" AND festival IN ({', '.join('?' for _ in festivals)})"
+            params.extend(festivals)
+        if start:
+            query += " AND date >= ?"
+            params.append(start.isoformat())
+        if end:
+            query += " AND date <= ?"
+            params.append(end.isoformat())
+        query += " ORDER BY festival, row_no"
+        rows = self.conn.execute(query, params).fetchall()
+        catalog = catalog or load_catalog()
+        games = [row[1] for row in rows]
+        return [
+            {'festival': festival, 'game': game, 'app_id': app_id, 'date': _from_sql("date", day),
+             'rank': rank or 0, 'chart_type': chart_type}
+            for (festival, _, day, rank, chart_type), game, app_id
+            in zip(rows, catalog.resolve_column(games), catalog.app_id_column(games))
+        ]
+
+
+# ============================================
+# 명령행
+# ============================================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="SNF 축제별 기록 저장소")
+    parser.add_argument("--store", type=Path, default=DEFAULT_STORE, help="SQLite 파일 위치")
+    commands = parser.add_subparsers(dest="command", required=True)
+    ingest = commands.add_parser("ingest", help="원본 CSV 폴더를 축제 이름으로 저장")
+    ingest.add_argument("festival", help="축제 이름 (예: 2025-06)")
+    ingest.add_argument("--raw-dir", type=Path, default=BASE_DIR / "github_data" / "raw",
+                        help="노션 CSV 폴더")
+    commands.add_parser("list", help="저장된 축제 목록")
+    args = parser.parse_args(argv)
+
+    with FestivalStore(args.store) as store:
+        if args.command == "ingest":
+            loaded = sum(1 for pattern in RAW_FILES.values() if find_csv_file(args.raw_dir, pattern))
+            if not loaded:
+                print(f"❌ {args.raw_dir} 폴더에 노션 CSV 파일이 없습니다.")
+                return 1
+            changed = store.ingest(args.festival, args.raw_dir)
+            print(f"✅ {args.festival}: {loaded}/{len(RAW_FILES)} 파일, {len(changed)}개 새로 저장 → {args.store}")
+            for key, rows in changed.items():
+                print(f"   - {key} ({rows:,}행)")
+        else:
+            festivals = store.festivals()
+            if not festivals:
+                print("저장된 축제가 없습니다.")
+            for f in festivals:
+                print(f"{f['festival']:<12} {f['start_date'] or '?'} ~ {f['end_date'] or '?'}  "
+                      f"(저장: {f['ingested_at']})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,283 @@
+"""
+게임 카탈로그
+=============
+Steam app ID 하나를 게임 하나(표시명, 영문명, 별칭)로 보고, 원본 CSV 8개에 나오는
+Steam URL / app ID / 한글명 / 영문명 / 별칭을 모두 같은 게임으로 연결합니다.
+TOP10/TOP50/결산 파일은 URL로, 3종 차트 기록은 자유 입력 게임명으로 게임을 가리키는데
+노션에서 이름이 조금씩 다르게 들어가므로('나 혼자만 레벨업:어라이즈 오버드라이브' / '나 혼자만 레벨업: 어라이즈')
+이름을 정규화한 색인으로 한 번에 찾습니다.
+
+    github_data/game_catalog.json
+      {"games": [{"app_id": "2373990", "name": "나 혼자만 레벨업: 어라이즈",
+                  "name_en": "Solo Leveling: ARISE", "aliases": ["나 혼자만 레벨업:어라이즈 오버드라이브"]}, ...]}
+
+- 정규화: NFKC → 소문자 → ™/®, 공백, 문장부호 제거 ('스텔라 블레이드™' = '스텔라블레이드')
+- 조회 결과는 값마다 한 번만 계산해 기억하고, resolve_column()은 컬럼의 고유값만 조회합니다
+- 카탈로그에 없는 URL은 'Game_<app ID>', 없는 이름은 같은 컬럼에서 처음 나온 표기로 통일합니다
+
+사용법:
+    python game_catalog.py list
+    python game_catalog.py add 3489700 "스텔라 블레이드" --en "Stellar Blade" --alias "스텔라 블레이드 체험판"
+    python game_catalog.py alias 2373990 "나 혼자만 레벨업 어라이즈"
+    python game_catalog.py check --raw-dir ../github_data/raw    # 카탈로그에 없는 게임 / 합쳐진 표기 확인
+"""
+
+import argparse
+import json
+import os
+import re
+import unicodedata
+from collections import defaultdict
+from functools import lru_cache
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent.parent
+DEFAULT_CATALOG = BASE_DIR / "github_data" / "game_catalog.json"
+DEFAULT_RAW_DIR = BASE_DIR / "github_data" / "raw"
+
+_APP_ID = re.compile(r'app/(\d+)')
+_DROP = re.compile(r'[\W_]+')   # 글자/숫자가 아닌 모든 문자 (한글은 글자로 남음)
+
+
+def normalize_name(text):
+    """색인용 게임명 키 ('Solo Leveling: ARISE™' → 'sololevelingarise')"""
+    text = str(text or '').replace('™', '').replace('®', '')   # NFKC가 ™를 'TM'으로 바꾸기 전에 제거
+    return _DROP.sub('', unicodedata.normalize('NFKC', text).casefold())
+
+
+def parse_app_id(value):
+    """Steam URL 또는 숫자 → app ID 문자열 (게임명이면 None)"""
+    text = str(value or '').strip()
+    if text.isdigit():
+        return text
+    match = _APP_ID.search(text)
+    return match.group(1) if match else None
+
+
+class GameCatalog:
+    """app ID → 게임, 정규화 이름 → app ID 색인"""
+
+    def __init__(self, games=(), path=None):
+        self.path = Path(path) if path else None
+        self.games = {}    # app ID → {'app_id', 'name', 'name_en', 'aliases'}
+        self.index = {}    # 정규화 이름 → app ID
+        self._memo = {}    # 조회한 원본 값 → app ID 또는 None
+        for game in games:
+            self.add(game['app_id'], game['name'], game.get('name_en', ''), game.get('aliases', ()))
+
+    @classmethod
+    def load(cls, path=DEFAULT_CATALOG):
+        """카탈로그 파일 로드 (파일이 없으면 빈 카탈로그)"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                games = json.load(f).get('games', [])
+        except FileNotFoundError:
+            games = []
+        return cls(games, path)
+
+    def save(self, path=None):
+        path = Path(path or self.path or DEFAULT_CATALOG)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        games = sorted(self.games.values(), key=lambda g: int(g['app_id']))
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'games': games}, f, ensure_ascii=False, indent=1)
+            f.write('\n')
+        os.replace(tmp_path, path)
+        self.path = path
+
+    def __len__(self):
+        return len(self.games)
+
+    def __iter__(self):
+        return iter(self.games.values())
+
+    def __contains__(self, app_id):
+        return str(app_id) in self.games
+
+    # ----------------------------------------
+    # 등록
+    # ----------------------------------------
+    def add(self, app_id, name, name_en='', aliases=()):
+        """게임 등록 (이미 있으면 이름을 바꾸고 별칭을 추가) → 게임 dict
+
+        다른 게임이 이미 쓰는 이름/별칭이면 아무것도 바꾸지 않고 ValueError.
+        """
+        app_id = str(app_id).strip()
+        if not app_id.isdigit():
+            raise ValueError(f"app ID는 숫자여야 합니다: {app_id!r}")
+        name, name_en = name.strip(), (name_en or '').strip()
+        game = self.games.get(app_id) or {'app_id': app_id, 'name': '', 'name_en': '', 'aliases': []}
+        name_en = name_en or game['name_en']
+        # 바뀐 표시명/영문명은 별칭으로 남겨 이전 표기도 계속 찾음
+        texts = [name, name_en, game['name'], game['name_en'], *game['aliases'], *aliases]
+        texts = [text.strip() for text in dict.fromkeys(texts) if text and text.strip()]
+        for text in texts:
+            owner = self.index.get(normalize_name(text), app_id)
+            if owner != app_id:
+                raise ValueError(f"'{text}'은(는) 이미 {owner} ({self.games[owner]['name']})의 이름입니다")
+
+        game.update(name=name, name_en=name_en,
+                    aliases=[text for text in dict.fromkeys(texts) if text not in (name, name_en)])
+        self.games[app_id] = game
+        for text in texts:
+            if normalize_name(text):
+                self.index[normalize_name(text)] = app_id
+        self._memo.clear()
+        return game
+
+    def add_alias(self, app_id, alias):
+        app_id = str(app_id)
+        if app_id not in self.games:
+            raise KeyError(f"카탈로그에 없는 app ID: {app_id}")
+        game = self.games[app_id]
+        return self.add(app_id, game['name'], game['name_en'], [alias])
+
+    # ----------------------------------------
+    # 조회
+    # ----------------------------------------
+    def app_id(self, value):
+        """URL / app ID / 이름 / 별칭 → app ID (카탈로그에 없는 이름이면 None)
+
+        URL과 숫자는 카탈로그에 없어도 그 app ID를 돌려줍니다.
+        """
+        try:
+            return self._memo[value]
+        except KeyError:
+            pass
+        app_id = parse_app_id(value)
+        if app_id is None:
+            app_id = self.index.get(normalize_name(value))
+        self._memo[value] = app_id
+        return app_id
+
+    def get(self, value):
+        """URL / app ID / 이름 → 게임 dict (없으면 None)"""
+        return self.games.get(self.app_id(value))
+
+    def display_name(self, value):
+        """표시명 (카탈로그에 없는 URL은 'Game_<app ID>', 없는 이름은 그대로)"""
+        app_id = self.app_id(value)
+        if app_id is None:
+            return str(value or '').strip()
+        game = self.games.get(app_id)
+        return game['name'] if game else f"Game_{app_id}"
+
+    def resolve_column(self, values):
+        """컬럼 전체 → 표시명 목록 (고유값만 조회, 카탈로그에 없는 이름은 처음 나온 표기로 통일)"""
+        names = {}
+        first_spelling = {}
+        for value in dict.fromkeys(values):
+            name = self.display_name(value)
+            if self.app_id(value) is None:
+                key = normalize_name(name)
+                name = first_spelling.setdefault(key, name) if key else name
+            names[value] = name
+        return [names[value] for value in values]
+
+    def app_id_column(self, values):
+        """컬럼 전체 → app ID 목록 (카탈로그에 없는 이름은 None)"""
+        ids = {value: self.app_id(value) for value in dict.fromkeys(values)}
+        return [ids[value] for value in values]
+
+
+@lru_cache(maxsize=None)
+def load_catalog(path=DEFAULT_CATALOG):
+    """프로세스 안에서 한 번만 읽는 카탈로그 (snf_stats 기본값)"""
+    return GameCatalog.load(path)
+
+
+# ============================================
+# 점검 (check)
+# ============================================
+URL_TABLES = ('top10_evaluation', 'top10_chart_count', 'top50_games', 'report_page',
+              'popular_demo', 'popular_upcoming', 'trending_upcoming')
+
+
+def check_raw(catalog, tables):
+    """원본 Table들 → (카탈로그에 없는 app ID {app ID: 파일 수}, 연결 안 된 차트 게임명 {이름: 기록 수},
+    정규화로 합쳐진 표기 {표시명: [원래 표기]})"""
+    missing_ids = defaultdict(set)
+    for key in URL_TABLES:
+        table = tables.get(key)
+        if table and 'url' in table:
+            for app_id in set(catalog.app_id_column(table['url'])):
+                if app_id and app_id not in catalog:
+                    missing_ids[app_id].add(key)
+
+    unlinked = defaultdict(int)
+    merged = defaultdict(set)
+    table = tables.get('chart_integration')
+    if table and 'game' in table:
+        games = table['game']
+        for raw, name, app_id in zip(games, catalog.resolve_column(games), catalog.app_id_column(games)):
+            if app_id is None and raw:
+                unlinked[name] += 1
+            if raw.strip() != name:
+                merged[name].add(raw)
+    return ({app_id: len(keys) for app_id, keys in missing_ids.items()}, dict(unlinked),
+            {name: sorted(raws) for name, raws in merged.items()})
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="SNF 게임 카탈로그")
+    parser.add_argument("--catalog", type=Path, default=DEFAULT_CATALOG, help="카탈로그 파일")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="등록된 게임 목록")
+    add = commands.add_parser("add", help="게임 등록 / 이름 변경")
+    add.add_argument("app_id")
+    add.add_argument("name", help="표시명 (한글 우선)")
+    add.add_argument("--en", default='', help="영문명")
+    add.add_argument("--alias", action="append", default=[], help="별칭 (여러 번 지정 가능)")
+    alias = commands.add_parser("alias", help="별칭 추가")
+    alias.add_argument("app_id")
+    alias.add_argument("alias")
+    check = commands.add_parser("check", help="원본 CSV에서 카탈로그에 없는 게임 찾기")
+    check.add_argument("--raw-dir", type=Path, default=DEFAULT_RAW_DIR)
+    args = parser.parse_args(argv)
+
+    catalog = GameCatalog.load(args.catalog)
+    if args.command == "list":
+        print(f"📇 {args.catalog} ({len(catalog)}개 게임)")
+        for game in sorted(catalog, key=lambda g: int(g['app_id'])):
+            aliases = f"  별칭: {', '.join(game['aliases'])}" if game['aliases'] else ""
+            english = f" / {game['name_en']}" if game['name_en'] else ""
+            print(f"   {game['app_id']:>8}  {game['name']}{english}{aliases}")
+        return 0
+
+    if args.command in ("add", "alias"):
+        try:
+            if args.command == "add":
+                game = catalog.add(args.app_id, args.name, args.en, args.alias)
+            else:
+                game = catalog.add_alias(args.app_id, args.alias)
+        except (ValueError, KeyError) as e:
+            print(f"❌ {e.args[0]}")
+            return 1
+        catalog.save()
+        print(f"✅ {game['app_id']} {game['name']} 저장 ({args.catalog})")
+        return 0
+
+    from snf_dataset import load_dataset
+    tables = load_dataset(args.raw_dir)
+    missing_ids, unlinked, merged = check_raw(catalog, tables)
+    print(f"📇 카탈로그 {len(catalog)}개 게임, 원본 {args.raw_dir}")
+    if missing_ids:
+        print(f"\n⚠️ 카탈로그에 없는 app ID {len(missing_ids)}개 ('Game_<ID>'로 표시됨):")
+        for app_id, files in sorted(missing_ids.items(), key=lambda item: (-item[1], item[0])):
+            print(f"   {app_id:>8}  파일 {files}개")
+    if unlinked:
+        print(f"\n⚠️ app ID와 연결되지 않은 차트 게임명 {len(unlinked)}개 (별칭으로 추가하면 URL 파일과 연결됨):")
+        for name, count in sorted(unlinked.items(), key=lambda item: (-item[1], item[0])):
+            print(f"   {name} ({count}회)")
+    if merged:
+        print("\n🔗 같은 게임으로 합친 표기:")
+        for name, raws in sorted(merged.items()):
+            print(f"   {name} ← {', '.join(raws)}")
+    if not (missing_ids or unlinked):
+        print("✅ 모든 게임이 카탈로그와 연결됩니다")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
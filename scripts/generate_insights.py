@@ -9,21 +9,49 @@ SNF Dashboard AI Insights Generator (v2.0)
 - 03_charts/: 7개 파일 (KPI, 발견점, 통계, 전략, 체험판/출시예정/떠오르는 상세)
 - 04_report/: 5개 파일 (체크리스트, KPI, 태그분석, 언어지원, 커뮤니티)
 
+숫자만으로 이루어진 9개 파일은 snf_stats.py로 로컬 계산합니다 (Gemini 호출 16회).
+
 사용법:
-    python generate_insights.py
+    python generate_insights.py                  # 동시 호출 (RPM/TPM 한도 내)
+    python generate_insights.py --sequential     # 기존 순차 호출
+    python generate_insights.py --rpm 30 --workers 8
+    python generate_insights.py --fake --output-dir /tmp/snf_out  # API 없이 시험
+    python generate_insights.py --backend replay   # 캐시에 기록된 응답으로 재생성 (llm_backends.py)
+    python generate_insights.py --record-session ../sessions/run.json.gz   # 주고받은 응답 기록
+    python generate_insights.py --replay-session ../sessions/run.json.gz   # 기록으로 API 호출 없이 재생성
+    python generate_insights.py --resume         # 중간에 멈춘 실행을 실패한 프롬프트부터 이어서 (run_journal.py)
+    python generate_insights.py --refresh charts    # 해당 섹션만 캐시 무시
+    python generate_insights.py --no-cache          # 응답 캐시 사용 안 함
+    python generate_insights.py --incremental       # 원본이 바뀐 CSV만 다시 생성
+    python generate_insights.py --festival 2025-06 --output-dir ../tmp_out  # 저장소의 지난 축제로 생성
 
 API 키 설정 (택 1):
     1. scripts/.env 파일에 GEMINI_API_KEY=your-key 저장 (추천)
     2. 환경변수: $env:GEMINI_API_KEY = "your-key"
 """
 
-import os
 import csv
 import time
+import argparse
 from pathlib import Path
 from datetime import datetime
-import glob
-import re
+import threading
+
+from scheduler import RateLimiter, run_concurrent, estimate_tokens, DEFAULT_RPM, DEFAULT_TPM, DEFAULT_WORKERS
+from response_cache import ResponseCache, cache_key, prompt_key, DEFAULT_MAX_AGE_DAYS, DEFAULT_MAX_MB
+from run_journal import RunJournal
+from llm_backends import (BACKENDS, BackendUnavailable, FakeBackend, GeminiBackend, LocalBackend,
+                          ReplayBackend, GEMINI_MODEL, LOCAL_URL)
+from build_manifest import BuildManifest, input_state
+from session_archive import SessionArchive
+from snf_dataset import RAW_FILES, load_dataset
+from festival_store import FestivalStore, DEFAULT_STORE
+from prompt_context import PromptContext, DEFAULT_BUDGET
+from batching import build_batch_prompt, response_schema, split_batch_response
+from csv_schema import SCHEMAS, parse_response, repair_prompt, validate_rows
+from cross_check import check_dataset, print_report
+from run_report import Tracer, print_summary, write_report
+import snf_stats
 
 # .env 파일 자동 로드
 try:
@@ -35,15 +63,6 @@ try:
 except ImportError:
     pass  # python-dotenv 없으면 환경변수만 사용
 
-# Gemini API
-try:
-    from google import genai
-    from google.genai.errors import ClientError
-except ImportError:
-    print("❌ google-genai 패키지가 설치되지 않았습니다.")
-    print("   실행: pip install google-genai")
-    exit(1)
-
 # ============================================
 # 설정
 # ============================================
@@ -52,94 +71,95 @@ BASE_DIR = SCRIPT_DIR.parent
 GITHUB_DATA_DIR = BASE_DIR / "github_data"
 RAW_DIR = GITHUB_DATA_DIR / "raw"
 PROMPTS_DIR = GITHUB_DATA_DIR / "prompts"
+CACHE_DIR = SCRIPT_DIR / ".cache" / "responses"
+SNAPSHOT_PATH = SCRIPT_DIR / ".cache" / "dataset.pickle"
 
-MODEL_NAME = "gemini-2.0-flash"
+MODEL_NAME = GEMINI_MODEL
 MAX_RETRIES = 3
 RETRY_DELAY = 60
-API_DELAY = 15  # API 호출 간 대기 시간
-
-# 게임명 매핑 (Steam URL → 한글명)
-GAME_NAME_MAP = {
-    "3576170": "빈딕투스: 디파잉 페이트",
-    "3504780": "와일드 게이트",
-    "2841820": "Jump Ship",
-    "2827200": "MIMESIS",
-    "3763830": "Zoochosis",
-    "2373990": "나 혼자만 레벨업: 어라이즈",
-    "3105890": "PIONER",
-    "3640000": "Holstin",
-    "3023930": "UFL",
-    "3201010": "Starlight ReVolver",
-}
+REPAIR_ATTEMPTS = 2  # 스키마 검사 실패 시 프롬프트 하나당 재요청 횟수
+REPAIR_BUDGET = 10   # 실행 전체 재요청 한도
+SESSION_OPTIONS = ("batch", "context_budget", "raw_context")  # 프롬프트 모양을 바꾸는 옵션 (세션 기록에 저장)
+API_DELAY = 15  # API 호출 간 대기 시간 (--sequential 모드)
+SECTION_DELAY = 30  # 섹션 간 대기 시간 (--sequential 모드)
+
+# 03_charts 상세 표 컬럼
+DEMO_CHART_COLUMNS = ["rank", "name", "appearances", "best_rank", "first_date", "last_date", "consecutive_days"]
+POPULAR_CHART_COLUMNS = ["rank", "name", "appearances", "best_rank", "first_date", "last_date"]
+TRENDING_CHART_COLUMNS = ["rank", "name", "appearances", "best_rank", "trend_direction", "notes"]
+
+def setup_backend(args, session=None):
+    """--backend 설정으로 LLM 백엔드 생성 (만들 수 없으면 None)
+
+    session이 주어지면 (--replay-session) 그 기록을 지연/오류 없이 재생합니다.
+    """
+    if session is not None:
+        print(f"📼 세션 기록 재생: {len(session)}개 응답 ({session.model}, {session.created}), API 호출 없음")
+        return ReplayBackend(session, session.model)
+    simulation = {'latency': args.fake_latency, 'error_rate': args.fake_error_rate,
+                  'invalid_rate': args.fake_invalid_rate}
+    try:
+        if args.backend == "fake":
+            backend = FakeBackend(**simulation)
+            print("🧪 가짜 Gemini 클라이언트 사용 (API 호출 없음)")
+            return backend
+        if args.backend == "replay":
+            backend = ReplayBackend.from_cache_dir(args.cache_dir, args.model or MODEL_NAME, **simulation)
+            print(f"📼 기록된 응답 재생: {args.cache_dir} ({len(backend.records)}개, API 호출 없음)")
+            return backend
+        if args.backend == "local":
+            backend = LocalBackend(args.model, args.local_url)
+        else:
+            backend = GeminiBackend(args.model or MODEL_NAME)
+    except BackendUnavailable as e:
+        print(f"❌ {e}")
+        return None
+    print(f"✅ LLM 연결 완료: {backend.describe()}")
+    return backend
 
-# 원본 CSV 파일 패턴
-RAW_FILES = {
-    "top10_evaluation": "TOP10 게임 종합 평가*.csv",
-    "top10_chart_count": "TOP10 차트인 횟수*.csv",
-    "top50_games": "가장 많이 플레이한 TOP50 게임*.csv",
-    "report_page": "결산 페이지*.csv",
-    "trending_upcoming": "떠오르는 출시 예정 게임*.csv",
-    "popular_demo": "인기 체험판*.csv",
-    "popular_upcoming": "인기 출시 예정 게임*.csv",
-    "chart_integration": "전체 장르 - 각 게임별 SNF기간 3종 차트인 횟수*.csv",
-}
 
+def is_rate_limited(error):
+    """429 / RESOURCE_EXHAUSTED 오류인지 확인"""
+    return "429" in str(error) or "RESOURCE_EXHAUSTED" in str(error)
 
-def setup_gemini():
-    """Gemini API 설정"""
-    api_key = os.environ.get("GEMINI_API_KEY")
-    if not api_key:
-        print("❌ GEMINI_API_KEY 환경변수가 설정되지 않았습니다.")
-        print('   Windows: $env:GEMINI_API_KEY = "your-api-key"')
-        return None
-    client = genai.Client(api_key=api_key)
-    print(f"✅ Gemini API 연결 완료 (모델: {MODEL_NAME})")
-    return client
 
+def call_model(backend, prompt, limiter=None, retry_delay=RETRY_DELAY, config=None, tracer=None):
+    """LLM 호출 (재시도 로직 포함)
 
-def call_gemini(client, prompt):
-    """API 호출 (재시도 로직 포함)"""
+    limiter가 주어지면 호출 전에 RPM/TPM 한도를 확보하고,
+    429 응답 시 리미터를 멈춰 다른 워커들도 함께 대기하게 합니다.
+    config는 generate_content 설정 (예: --batch의 JSON 응답 스키마).
+    tracer가 주어지면 시도마다 대기(rate_wait, 429 이후는 backoff)와 호출(call, 토큰 수 포함)을 기록합니다.
+    """
+    tracer = tracer or Tracer(enabled=False)
     for attempt in range(MAX_RETRIES):
-        try:
-            response = client.models.generate_content(model=MODEL_NAME, contents=prompt)
-            return response.text if response else None
-        except ClientError as e:
-            if "429" in str(e) or "RESOURCE_EXHAUSTED" in str(e):
-                if attempt < MAX_RETRIES - 1:
-                    wait_time = RETRY_DELAY * (attempt + 1)
-                    print(f"   ⏳ API 제한. {wait_time}초 후 재시도... ({attempt + 1}/{MAX_RETRIES})")
-                    time.sleep(wait_time)
-                else:
+        if limiter:
+            with tracer.span('backoff' if attempt else 'rate_wait', attempt=attempt):
+                limiter.acquire(estimate_tokens(prompt))
+        with tracer.span('call', attempt=attempt, model=backend.model) as span:
+            try:
+                completion = backend.generate(prompt, config)
+            except Exception as e:
+                span['status'] = '429' if is_rate_limited(e) else type(e).__name__
+                if not is_rate_limited(e) or attempt >= MAX_RETRIES - 1:
                     raise
             else:
-                raise
+                span['status'] = 'ok'
+                span['estimated'] = completion.input_tokens is None
+                span['input_tokens'] = completion.input_tokens or estimate_tokens(prompt)
+                span['output_tokens'] = (completion.output_tokens if completion.output_tokens is not None
+                                         else estimate_tokens(completion.text))
+                return completion.text
+        wait_time = retry_delay * (attempt + 1)
+        print(f"   ⏳ API 제한. {wait_time}초 후 재시도... ({attempt + 1}/{MAX_RETRIES})")
+        if limiter:
+            limiter.pause(wait_time)
+        else:
+            with tracer.span('backoff', attempt=attempt):
+                time.sleep(wait_time)
     return None
 
 
-def find_csv_file(pattern):
-    """패턴에 맞는 CSV 파일 찾기"""
-    search_path = str(RAW_DIR / pattern)
-    files = glob.glob(search_path)
-    return Path(max(files, key=os.path.getmtime)) if files else None
-
-
-def read_csv_content(file_path, max_lines=100):
-    """CSV 파일 내용 읽기"""
-    if not file_path or not file_path.exists():
-        return "데이터 없음"
-    with open(file_path, 'r', encoding='utf-8') as f:
-        lines = [line.rstrip() for i, line in enumerate(f) if i < max_lines]
-    return '\n'.join(lines)
-
-
-def read_csv_as_dicts(file_path):
-    """CSV를 딕셔너리 리스트로 읽기"""
-    if not file_path or not file_path.exists():
-        return []
-    with open(file_path, 'r', encoding='utf-8') as f:
-        return list(csv.DictReader(f))
-
-
 def save_csv(rows, output_path):
     """CSV 저장 (UTF-8 BOM)"""
     if not rows:
@@ -153,102 +173,365 @@ def save_csv(rows, output_path):
     return True
 
 
-def parse_csv_response(response_text):
-    """AI 응답에서 CSV 파싱"""
-    if not response_text:
-        return []
-    
-    # CSV 블록 찾기
-    csv_match = re.search(r'```csv\s*(.*?)\s*```', response_text, re.DOTALL)
-    if csv_match:
-        csv_text = csv_match.group(1).strip()
-    else:
-        # 코드블록 없이 바로 CSV인 경우
-        csv_text = response_text.strip()
-        if csv_text.startswith('```'):
-            csv_text = csv_text.split('```')[1] if '```' in csv_text else csv_text
-    
-    lines = [line.strip() for line in csv_text.split('\n') if line.strip()]
-    if len(lines) < 2:
-        return []
-    
-    # 헤더와 데이터 파싱
-    headers = [h.strip() for h in lines[0].split(',')]
-    rows = []
-    for line in lines[1:]:
-        # CSV 파싱 (쉼표가 포함된 값 처리)
-        values = []
-        in_quote = False
-        current = ""
-        for char in line:
-            if char == '"':
-                in_quote = not in_quote
-            elif char == ',' and not in_quote:
-                values.append(current.strip().strip('"'))
-                current = ""
-            else:
-                current += char
-        values.append(current.strip().strip('"'))
-        
-        if len(values) >= len(headers):
-            rows.append(dict(zip(headers, values[:len(headers)])))
-    
-    return rows
+def make_job(folder, filename, label, prompt, inputs=(), rows=None, merge_keys=(), extra_rows=None):
+    """프롬프트 작업
+
+    output은 GITHUB_DATA_DIR 기준 상대 경로, inputs는 프롬프트가 사용하는 RAW_FILES 키 목록.
+    rows가 주어지면 로컬 계산 행에 Gemini가 쓴 서술 컬럼만 merge_keys 기준으로 합칩니다.
+    계산 행에 없는 Gemini 행은 extra_rows({컬럼: 허용 값 목록})에 맞는 서술 행만 남깁니다.
+    """
+    return {
+        'section': folder,
+        'output': f"{folder}/{filename}",
+        'label': label,
+        'prompt': prompt,
+        'inputs': list(inputs),
+        'rows': rows,
+        'merge_keys': list(merge_keys),
+        'extra_rows': extra_rows,
+    }
 
 
-def extract_game_name(url_or_name):
-    """Steam URL에서 게임명 추출"""
-    if not url_or_name:
-        return ""
-    # app/숫자 패턴 찾기
-    match = re.search(r'app/(\d+)', str(url_or_name))
-    if match:
-        app_id = match.group(1)
-        return GAME_NAME_MAP.get(app_id, f"Game_{app_id}")
-    return str(url_or_name)
+def make_local_job(folder, filename, label, rows, inputs=()):
+    """Gemini 없이 snf_stats로 계산한 행을 그대로 저장하는 작업"""
+    return make_job(folder, filename, label, None, inputs=inputs, rows=rows)
 
 
-def load_all_raw_data():
-    """모든 원본 데이터 로드"""
+def format_rows_csv(rows):
+    """행 목록 → 프롬프트에 넣을 CSV 텍스트"""
+    if not rows:
+        return "데이터 없음"
+    lines = [','.join(rows[0].keys())]
+    lines.extend(','.join(str(value) for value in row.values()) for row in rows)
+    return '\n'.join(lines)
+
+
+def make_context(backend, output_dir=GITHUB_DATA_DIR, limiter=None, retry_delay=RETRY_DELAY,
+                 cache=None, refresh=(), manifest=None, incremental=False,
+                 context_budget=DEFAULT_BUDGET, raw_context=False, batch=False,
+                 repair_attempts=REPAIR_ATTEMPTS, repair_budget=REPAIR_BUDGET, session=None, tracer=None,
+                 journal=None):
+    """실행 설정
+
+    refresh: 캐시를 무시하고 다시 호출할 섹션 폴더들
+    incremental: manifest 기준으로 입력이 바뀐 출력만 생성
+    context_budget: 프롬프트에 넣는 원본 요약 하나의 토큰 한도 (raw_context면 원문 그대로)
+    batch: 섹션마다 프롬프트 작업을 요청 하나로 묶음
+    repair_attempts / repair_budget: 스키마 검사 실패 시 프롬프트당 / 실행 전체 재요청 한도
+    session: 주고받은 (프롬프트, 응답)을 모두 기록할 SessionArchive (--record-session)
+    tracer: 단계별 시간/토큰을 기록할 run_report.Tracer (없으면 기록 안 함)
+    journal: 끝난 작업과 응답을 바로 기록할 RunJournal (--resume이면 이전 기록으로 건너뜀)
+    """
+    return {
+        'backend': backend,
+        'output_dir': output_dir,
+        'limiter': limiter,
+        'retry_delay': retry_delay,
+        'cache': cache,
+        'refresh': set(refresh),
+        'manifest': manifest,
+        'incremental': incremental,
+        'context_budget': context_budget,
+        'raw_context': raw_context,
+        'batch': batch,
+        'repair_attempts': repair_attempts,
+        'repair_budget': repair_budget,
+        'repair_lock': threading.Lock(),
+        'session': session,
+        'tracer': tracer or Tracer(enabled=False),
+        'journal': journal,
+    }
+
+
+def collect_jobs(ctx, raw_data, keys):
+    """섹션 작업 목록을 만들고, 증분 모드면 최신 상태인 작업은 제외
+
+    ctx['batch']면 남은 프롬프트 작업을 섹션별 일괄 요청으로 묶어 반환합니다.
+    """
+    jobs = []
+    for key in keys:
+        context = PromptContext(raw_data, budget=ctx['context_budget'], verbatim=ctx['raw_context'])
+        with ctx['tracer'].span('prompts', section=key):
+            for job in SECTIONS[key]['build'](raw_data, context):
+                job['fingerprints'] = input_state(job['inputs'], raw_data)
+                if job['prompt'] is not None:
+                    job['digests'] = [text for text in context.digests if text in job['prompt']]
+                jobs.append(job)
+        raw_tokens, digest_tokens = context.savings()
+        if raw_tokens and not ctx['raw_context']:
+            print(f"   📉 {SECTIONS[key]['name']}: 원본 컨텍스트 {raw_tokens:,} → {digest_tokens:,} 토큰 "
+                  f"({(raw_tokens - digest_tokens) / raw_tokens:.0%} 절감)")
+    if ctx['incremental'] and ctx['manifest']:
+        stale = []
+        for job in jobs:
+            reason = "--refresh" if job['section'] in ctx['refresh'] else ctx['manifest'].stale_reason(job)
+            if reason:
+                print(f"   🔧 {job['output']}: {reason}")
+                stale.append(job)
+        print(f"   ⏭️ 최신 상태 {len(jobs) - len(stale)}개 건너뜀, 다시 생성 {len(stale)}개")
+        jobs = stale
+    return make_batch_jobs(jobs) if ctx['batch'] else jobs
+
+
+def cache_prompt(job, prompt=None):
+    """캐시 키로 쓰는 프롬프트 (응답 스키마가 다르면 다른 응답이므로 포함)"""
+    return prompt_key(prompt or job['prompt'], job.get('config'))
+
+
+def fetch_response(ctx, job, prompt=None):
+    """캐시를 먼저 확인하고, 없을 때만 call_model 호출 (prompt: 재요청 프롬프트)"""
+    cache = ctx['cache']
+    config = job.get('config')
+    key_prompt = cache_prompt(job, prompt)
+    job['cached'] = False
+    response = None
+    if ctx['journal'] is not None:
+        # 이전 실행에서 끝낸 작업의 응답 (출력 파일만 지워진 경우)
+        response = ctx['journal'].response(cache_key(ctx['backend'].model, key_prompt))
+        job['cached'] = response is not None
+    if response is None and cache is not None and job['section'] not in ctx['refresh']:
+        response = cache.get(ctx['backend'].model, key_prompt)
+        job['cached'] = response is not None
+    if response is None:
+        response = call_model(ctx['backend'], prompt or job['prompt'], limiter=ctx['limiter'],
+                              retry_delay=ctx['retry_delay'], config=config, tracer=ctx['tracer'])
+        if response and cache is not None:
+            cache.put(ctx['backend'].model, key_prompt, response)
+    if response is not None and ctx['session'] is not None:
+        ctx['session'].record(ctx['backend'].model, key_prompt, response, job['output'])
+    return response
+
+
+def take_repair(ctx):
+    """실행 전체 재요청 한도에서 하나 사용 (남은 한도가 없으면 False)"""
+    with ctx['repair_lock']:
+        if ctx['repair_budget'] <= 0:
+            return False
+        ctx['repair_budget'] -= 1
+        return True
+
+
+def check_parse(job, stats):
+    """파싱 통계 출력, 불량 응답이면 False (기존 CSV를 덮어쓰지 않음)"""
+    job['parse'] = stats
+    print(f"   🧾 {job['output']}: {stats.summary()}")
+    for error in stats.errors:
+        print(f"      - {error}")
+    if not stats.ok:
+        kept = "계산된 숫자 행만 저장" if job['rows'] is not None else f"기존 {Path(job['output']).name} 유지"
+        print(f"   ⚠️ 응답 불량, {kept}")
+    return stats.ok
+
+
+def finish_job(ctx, job, rows, stats=None):
+    """파싱된 행을 (로컬 계산과 병합해) 저장하고 빌드 기록"""
+    if stats is not None and not check_parse(job, stats):
+        rows = []
+    if job['prompt'] is not None and job['rows'] is not None:
+        # 응답이 없어도 로컬 계산한 숫자 행은 저장
+        rows = snf_stats.merge_rows(job['rows'], rows, job['merge_keys'], job['extra_rows'])
+    with ctx['tracer'].span('save', output=job['output'], rows=len(rows)):
+        saved = save_csv(rows, ctx['output_dir'] / job['output'])
+    if saved and ctx['manifest'] and 'fingerprints' in job:
+        ctx['manifest'].record(job)
+    return saved
+
+
+def run_job(ctx, job, problems=None):
+    """작업 하나 실행: 호출(또는 캐시) → 파싱/스키마 검사 → (로컬 계산과 병합) → 저장
+
+    검사에 실패하면 문제 목록을 붙인 프롬프트로 그 작업만 다시 요청합니다
+    (프롬프트당 ctx['repair_attempts']회, 실행 전체 ctx['repair_budget']회까지).
+    problems가 주어지면 (--batch 응답 불량) 처음부터 문제를 붙여 요청합니다.
+    ctx['journal']이 있으면 끝난 프롬프트 작업을 기록하고, 이전 실행에서 끝낸 작업은 건너뜁니다.
+    """
+    journal = ctx['journal']
+    key = journal_key(ctx, job) if journal is not None and job['prompt'] is not None else None
+    if key and journal.is_done(job['output'], key) and outputs_exist(ctx, job):
+        print(f"   ⏭️ 이어하기: {job['output']} (이전 실행에서 완료)")
+        job['cached'] = job['resumed'] = True
+        return True
+    with ctx['tracer'].span('job', output=job['output']) as span:
+        try:
+            saved = execute_job(ctx, job, problems)
+        except Exception as e:
+            if key:
+                journal.record_failed(job['output'], key, e)
+            raise
+        span.update(cached=job.get('cached', False), repairs=job.get('repairs', 0), saved=bool(saved))
+    if key:
+        # 응답 불량으로 숫자 행만 저장한 경우도 다음 --resume에서 다시 요청
+        if saved and ('parse' not in job or job['parse'].ok):
+            journal.record_done(job['output'], key, job.get('response'))
+        else:
+            journal.record_failed(job['output'], key, "저장 안 됨" if not saved else "응답 불량")
+    return saved
+
+
+def journal_key(ctx, job):
+    """실행 일지에서 작업을 찾는 키 (모델 + 원래 프롬프트, 재요청 프롬프트가 아님)"""
+    return cache_key(ctx['backend'].model, cache_prompt(job))
+
+
+def outputs_exist(ctx, job):
+    return all((ctx['output_dir'] / member['output']).exists() for member in job.get('batch', [job]))
+
+
+def execute_job(ctx, job, problems=None):
+    """run_job 본체 (job 구간 안에서 실행)"""
+    if 'batch' in job:
+        return run_batch(ctx, job)
+    if job['prompt'] is None:
+        job['cached'] = False
+        return finish_job(ctx, job, job['rows'])
+    schema = SCHEMAS.get(job['output'])
+    prompt = repair_prompt(job['prompt'], problems, schema) if problems else job['prompt']
+    job['repairs'] = 0
+    while True:
+        response = fetch_response(ctx, job, prompt)
+        with ctx['tracer'].span('parse', output=job['output']):
+            rows, stats = parse_response(response, schema)
+        if stats.ok:
+            break
+        if ctx['cache'] is not None:
+            ctx['cache'].discard(ctx['backend'].model, cache_prompt(job, prompt))
+        if job['repairs'] >= ctx['repair_attempts'] or not take_repair(ctx):
+            break
+        job['repairs'] += 1
+        print(f"   🔁 {job['output']}: {stats.problems()[0]} → 오류를 붙여 다시 요청 "
+              f"({job['repairs']}/{ctx['repair_attempts']})")
+        prompt = repair_prompt(job['prompt'], stats.problems(), schema)
+    job['response'] = response
+    return finish_job(ctx, job, rows, stats)
+
+
+# ============================================
+# 섹션 일괄 요청 (--batch)
+# ============================================
+def make_batch_jobs(jobs):
+    """섹션별 프롬프트 작업을 요청 하나로 묶음 (로컬 작업과 프롬프트가 하나뿐인 섹션은 그대로)"""
+    names = {s['folder']: s['name'] for s in SECTIONS.values()}
+    grouped = {}
+    for job in jobs:
+        if job['prompt'] is not None:
+            grouped.setdefault(job['section'], []).append(job)
+    result = [job for job in jobs if job['prompt'] is None or len(grouped[job['section']]) == 1]
+    for folder, members in grouped.items():
+        if len(members) < 2:
+            continue
+        digests = [text for job in members for text in job.get('digests', [])]
+        result.append({
+            'section': folder,
+            'output': f"{folder}/(일괄 {len(members)}개)",
+            'label': f"{names.get(folder, folder)} 일괄 요청 ({len(members)}개 CSV)",
+            'prompt': build_batch_prompt(names.get(folder, folder), members, digests),
+            'config': {'response_mime_type': 'application/json', 'response_schema': response_schema(members)},
+            'batch': members,
+        })
+    return result
+
+
+def run_batch(ctx, batch):
+    """일괄 요청 실행 → 파일별로 나눠 저장 (응답에 빠졌거나 스키마 검사에 실패한 파일은 개별 요청으로 다시 시도)"""
+    response = fetch_response(ctx, batch)
+    batch['response'] = response
+    with ctx['tracer'].span('parse', output=batch['output']):
+        results = split_batch_response(response, batch['batch'])
+    saved = True
+    for job in batch['batch']:
+        job['cached'] = batch['cached']
+        with ctx['tracer'].span('parse', output=job['output']):
+            rows, stats = validate_rows(results.get(job['output'], []), SCHEMAS.get(job['output']))
+        if stats.ok:
+            saved = finish_job(ctx, job, rows, stats) and saved
+        else:
+            missing = job['output'] not in results
+            print(f"   ↩️ 일괄 응답 {'에 없음' if missing else f'불량 ({stats.summary()})'}, 개별 요청: {job['output']}")
+            saved = run_job(ctx, job, None if missing else stats.problems()) and saved
+    return saved
+
+
+def load_all_raw_data(snapshot_path=SNAPSHOT_PATH, dataset=None):
+    """모든 원본 데이터 로드 (파일마다 한 번만 읽음)
+
+    content는 프롬프트에 넣을 원문(긴 파일은 앞부분 + 전체 통계 요약), table은 집계용 컬럼 데이터입니다.
+    dataset을 주면 (예: FestivalStore.load_dataset()) RAW_DIR를 읽지 않습니다.
+    """
     print("\n📂 원본 데이터 로드 중...")
+    if dataset is None:
+        dataset = load_dataset(RAW_DIR, snapshot_path)
     raw_data = {}
-    for key, pattern in RAW_FILES.items():
-        file_path = find_csv_file(pattern)
-        if file_path:
-            raw_data[key] = {
-                'path': file_path,
-                'content': read_csv_content(file_path),
-                'data': read_csv_as_dicts(file_path)
-            }
-            print(f"   ✅ {key}: {file_path.name}")
+    for key, table in dataset.items():
+        if table is not None:
+            raw_data[key] = {'path': table.path, 'sha256': table.sha256, 'content': table.preview, 'table': table}
+            print(f"   ✅ {key}: {table.path.name} ({len(table)}행)")
         else:
-            raw_data[key] = {'path': None, 'content': '데이터 없음', 'data': []}
+            raw_data[key] = {'path': None, 'sha256': None, 'content': '데이터 없음', 'table': None}
             print(f"   ⚠️ {key}: 파일 없음")
     return raw_data
 
 
+# ============================================
+# 프롬프트용 원본 요약 (prompt_context)
+# ============================================
+def top10_digest(context, share=1.0):
+    """TOP10 종합 평가: 찜 증가량을 미리 계산해 넣은 요약"""
+    return context.table(
+        'top10_evaluation',
+        ['url', 'rank', 'review_status', 'review_count', 'review_lang', 'wishlist_before', 'wishlist_after'],
+        sort_by='rank', summary=['wishlist_before', 'wishlist_after'], lists=['review_lang'],
+        derived={'찜 증가': lambda r: (r['wishlist_after'] or 0) - (r['wishlist_before'] or 0)},
+        share=share)
+
+
+def top50_digest(context, share=1.0):
+    """TOP50 게임: 장르/체험판/멀티플레이 분포 + 상위 20개"""
+    return context.table(
+        'top50_games', ['url', 'rank', 'genre', 'demo', 'multiplayer', 'chart_count'],
+        sort_by='rank', limit=20, lists=['genre', 'demo', 'multiplayer'], summary=['chart_count'], share=share)
+
+
+def chart_digest(context, chart_index, share=1.0):
+    """3종 차트: 차트별 집계 + 게임별 노출 요약"""
+    return context.rows('chart_integration', snf_stats.chart_digest_rows(chart_index),
+                        notes=snf_stats.chart_digest_notes(chart_index), share=share)
+
+
+def chart_timeline_digest(context, chart_index, chart_type, games, share=1.0):
+    """차트 하나에서 주어진 게임들의 일자별 순위"""
+    return context.rows('chart_integration', snf_stats.chart_timeline_rows(chart_index, chart_type, games),
+                        share=share)
+
+
+def report_digest(context, lists, share=1.0):
+    """결산 페이지: 목록 컬럼(태그/언어/커뮤니티) 빈도 + 게임별 개수"""
+    return context.table(
+        'report_page', ['url', 'interface_count', 'tag_count'], lists=lists,
+        summary=['interface_count', 'tag_count'], limit=10,
+        derived={'커뮤니티 수': lambda r: len(snf_stats.split_list(r['community']))}, share=share)
+
+
 # ============================================
 # 1. Executive Summary 생성
 # ============================================
-def generate_executive(client, raw_data):
-    """Executive Summary 섹션의 모든 CSV 생성"""
-    print("\n" + "="*50)
-    print("🎯 1/4 Executive Summary 생성")
-    print("="*50)
-    
-    output_dir = GITHUB_DATA_DIR / "01_executive"
+def build_executive_jobs(raw_data, context):
+    """Executive Summary 섹션의 프롬프트 작업 목록"""
+    folder = "01_executive"
+    jobs = []
+    top10_eval = snf_stats.normalize_top10_evaluation(raw_data['top10_evaluation']['table'])
+    top50_games = snf_stats.normalize_top50_games(raw_data['top50_games']['table'])
+    chart_index = snf_stats.as_chart_index(snf_stats.normalize_chart_entries(raw_data['chart_integration']['table']))
     
     # --- 01_strategies.csv ---
-    print("\n   📝 전략 카드 생성...")
     prompt = f"""
 당신은 Steam Next Fest 전략 컨설턴트입니다.
 아래 데이터를 분석하여 다음 SNF 성공 전략 3개를 도출해주세요.
 
 ## TOP10 게임 종합 평가
-{raw_data['top10_evaluation']['content']}
+{top10_digest(context, share=0.5)}
 
 ## TOP50 게임 (장르, 체험판, 멀티플레이 정보)
-{raw_data['top50_games']['content']}
+{top50_digest(context, share=0.5)}
 
 정확히 아래 CSV 형식으로만 출력하세요. 다른 설명 없이 CSV만:
 
@@ -261,23 +544,17 @@ id,icon,title,description,details
 
 데이터에서 발견한 실제 수치와 트렌드를 반영해주세요.
 """
-    response = call_gemini(client, prompt)
-    if response:
-        rows = parse_csv_response(response)
-        save_csv(rows, output_dir / "01_strategies.csv")
-    
-    time.sleep(API_DELAY)
+    jobs.append(make_job(folder, "01_strategies.csv", "전략 카드 생성", prompt, inputs=["top10_evaluation", "top50_games"]))
     
     # --- 02_kpi_cards.csv ---
-    print("   📝 KPI 카드 생성...")
     prompt = f"""
 TOP10/TOP50 게임 데이터에서 핵심 KPI 4개를 추출해주세요.
 
 ## TOP10 게임 종합 평가 (찜 수 정보 포함)
-{raw_data['top10_evaluation']['content']}
+{top10_digest(context, share=0.5)}
 
 ## TOP50 게임 목록
-{raw_data['top50_games']['content']}
+{top50_digest(context, share=0.5)}
 
 정확히 아래 CSV 형식으로만 출력 (설명 없이 CSV만):
 
@@ -293,23 +570,17 @@ id,icon,value,label,sublabel,color
 - 찜 증가량 = 참여 후 찜 수 - 참여 전 찜 수
 - 멀티플레이 비율 = 멀티플레이 게임 수 / 전체 수
 """
-    response = call_gemini(client, prompt)
-    if response:
-        rows = parse_csv_response(response)
-        save_csv(rows, output_dir / "02_kpi_cards.csv")
-    
-    time.sleep(API_DELAY)
+    jobs.append(make_job(folder, "02_kpi_cards.csv", "KPI 카드 생성", prompt, inputs=["top10_evaluation", "top50_games"]))
     
     # --- 03_insights.csv ---
-    print("   📝 인사이트 생성...")
     prompt = f"""
 데이터를 분석하여 개발사가 알아야 할 주요 발견점 4개를 도출해주세요.
 
 ## TOP10 게임 종합 평가
-{raw_data['top10_evaluation']['content']}
+{top10_digest(context, share=0.5)}
 
 ## TOP50 게임 (장르, 체험판, 멀티플레이)
-{raw_data['top50_games']['content']}
+{top50_digest(context, share=0.5)}
 
 정확히 아래 CSV 형식으로만 출력:
 
@@ -326,61 +597,19 @@ id,icon,title,description,border_color
 - 50자 이상의 상세 설명
 - 개발사 액션 포인트 암시
 """
-    response = call_gemini(client, prompt)
-    if response:
-        rows = parse_csv_response(response)
-        save_csv(rows, output_dir / "03_insights.csv")
-    
-    time.sleep(API_DELAY)
-    
-    # --- 04_top5_games.csv ---
-    print("   📝 TOP 5 게임 추출...")
-    prompt = f"""
-TOP10 게임 종합 평가 데이터에서 상위 5개 게임 정보를 추출해주세요.
-
-## 데이터
-{raw_data['top10_evaluation']['content']}
-
-## TOP50 데이터 (장르 참조)
-{raw_data['top50_games']['content']}
-
-정확히 아래 CSV 형식으로만 출력:
-
-```csv
-rank,name,genre,wishlist_increase,wishlist_percent,review_status
-1,빈딕투스: 디파잉 페이트,액션 RPG,151605,+25.6%,복합적
-2,와일드 게이트,슈팅,59726,+20.1%,확인불가
-3,Jump Ship,슈팅,89715,+10.1%,매우 긍정적
-4,MIMESIS,공포,53825,+43.2%,확인불가
-5,Zoochosis,액션,71933,+26.3%,압도적 긍정
-```
-
-게임명 매핑:
-- app/3576170 → 빈딕투스: 디파잉 페이트
-- app/3504780 → 와일드 게이트
-- app/2841820 → Jump Ship
-- app/2827200 → MIMESIS
-- app/3763830 → Zoochosis
-- app/2373990 → 나 혼자만 레벨업: 어라이즈
-- app/3105890 → PIONER
-- app/3640000 → Holstin
-
-계산: wishlist_increase = 참여 후 찜 수 - 참여 전 찜 수
-"""
-    response = call_gemini(client, prompt)
-    if response:
-        rows = parse_csv_response(response)
-        save_csv(rows, output_dir / "04_top5_games.csv")
+    jobs.append(make_job(folder, "03_insights.csv", "인사이트 생성", prompt, inputs=["top10_evaluation", "top50_games"]))
     
-    time.sleep(API_DELAY)
+    # --- 04_top5_games.csv (로컬 계산) ---
+    jobs.append(make_local_job(folder, "04_top5_games.csv", "TOP 5 게임 추출",
+                               snf_stats.top5_games_rows(top10_eval, top50_games),
+                               inputs=["top10_evaluation", "top50_games"]))
     
     # --- 05_chart_summary.csv ---
-    print("   📝 차트 성과 요약 생성...")
     prompt = f"""
 3종 차트인 횟수 데이터를 분석하여 차트 성과 요약 3개를 도출해주세요.
 
 ## 차트인 데이터
-{raw_data['chart_integration']['content']}
+{chart_digest(context, chart_index)}
 
 정확히 아래 CSV 형식으로만 출력:
 
@@ -396,53 +625,18 @@ id,icon,value,label,description
 - 최다 차트인 게임과 횟수
 - 인기 체험판 차트 비율
 """
-    response = call_gemini(client, prompt)
-    if response:
-        rows = parse_csv_response(response)
-        save_csv(rows, output_dir / "05_chart_summary.csv")
+    jobs.append(make_job(folder, "05_chart_summary.csv", "차트 성과 요약 생성", prompt, inputs=["chart_integration"]))
     
-    time.sleep(API_DELAY)
-    
-    # --- 06_genre_distribution.csv ---
-    print("   📝 장르 분포 생성...")
-    prompt = f"""
-TOP50 게임 데이터에서 장르별 분포를 계산해주세요.
-
-## TOP50 게임 데이터
-{raw_data['top50_games']['content']}
-
-정확히 아래 CSV 형식으로만 출력:
-
-```csv
-id,icon,genre,percentage,color
-1,⚔️,액션 RPG,28%,#0047AB
-2,🔫,슈팅,22%,#3B82F6
-3,🎲,로그라이크,18%,#8B5CF6
-4,👻,공포,15%,#F59E0B
-5,📦,기타,17%,#64748B
-```
-
-장르 분류:
-- 액션 RPG: 액션 RPG, MMORPG, RPG 포함
-- 슈팅: 슈팅, FPS, 1인칭 슈팅 포함
-- 로그라이크: 로그라이크, 로그라이트 포함
-- 공포: 공포, 호러 포함
-- 기타: 나머지 모든 장르
-"""
-    response = call_gemini(client, prompt)
-    if response:
-        rows = parse_csv_response(response)
-        save_csv(rows, output_dir / "06_genre_distribution.csv")
-    
-    time.sleep(API_DELAY)
+    # --- 06_genre_distribution.csv (로컬 계산) ---
+    jobs.append(make_local_job(folder, "06_genre_distribution.csv", "장르 분포 생성",
+                               snf_stats.genre_distribution_rows(top50_games), inputs=["top50_games"]))
     
     # --- 07_snf_guide.csv ---
-    print("   📝 SNF 가이드 생성...")
     prompt = f"""
 전체 데이터를 종합하여 SNF 참가 준비 체크리스트 4개를 만들어주세요.
 
 ## TOP50 게임 (체험판, 멀티플레이 현황)
-{raw_data['top50_games']['content']}
+{top50_digest(context)}
 
 정확히 아래 CSV 형식으로만 출력:
 
@@ -456,32 +650,27 @@ id,icon,title,description,status
 
 데이터 기반으로 구체적인 수치를 반영해주세요.
 """
-    response = call_gemini(client, prompt)
-    if response:
-        rows = parse_csv_response(response)
-        save_csv(rows, output_dir / "07_snf_guide.csv")
+    jobs.append(make_job(folder, "07_snf_guide.csv", "SNF 가이드 생성", prompt, inputs=["top50_games"]))
     
-    print("   ✅ Executive Summary 완료!")
+    return jobs
 
 
 # ============================================
 # 2. TOP Games 생성
 # ============================================
-def generate_top_games(client, raw_data):
-    """TOP Games 섹션의 모든 CSV 생성"""
-    print("\n" + "="*50)
-    print("🏆 2/4 TOP Games 생성")
-    print("="*50)
-    
-    output_dir = GITHUB_DATA_DIR / "02_top_games"
+def build_top_games_jobs(raw_data, context):
+    """TOP Games 섹션의 프롬프트 작업 목록"""
+    folder = "02_top_games"
+    jobs = []
+    top10_eval = snf_stats.normalize_top10_evaluation(raw_data['top10_evaluation']['table'])
+    top50_games = snf_stats.normalize_top50_games(raw_data['top50_games']['table'])
     
     # --- 01_kpi_cards.csv ---
-    print("\n   📝 KPI 카드 생성...")
     prompt = f"""
 TOP10 게임 종합 평가 데이터에서 핵심 KPI 2개를 추출해주세요.
 
 ## 데이터
-{raw_data['top10_evaluation']['content']}
+{top10_digest(context)}
 
 정확히 아래 CSV 형식으로만 출력:
 
@@ -495,23 +684,17 @@ id,icon,value,label,sublabel,highlight
 - TOP 10 총 찜 증가량 합계
 - 1위 게임의 찜 증가량과 증가율
 """
-    response = call_gemini(client, prompt)
-    if response:
-        rows = parse_csv_response(response)
-        save_csv(rows, output_dir / "01_kpi_cards.csv")
-    
-    time.sleep(API_DELAY)
+    jobs.append(make_job(folder, "01_kpi_cards.csv", "KPI 카드 생성", prompt, inputs=["top10_evaluation"]))
     
     # --- 02_key_findings.csv ---
-    print("   📝 핵심 성과 요약 생성...")
     prompt = f"""
 TOP 10/50 게임 데이터를 분석하여 핵심 성과 요약 4개를 도출해주세요.
 
 ## TOP10 종합 평가
-{raw_data['top10_evaluation']['content']}
+{top10_digest(context, share=0.5)}
 
 ## TOP50 게임
-{raw_data['top50_games']['content']}
+{top50_digest(context, share=0.5)}
 
 정확히 아래 CSV 형식으로만 출력:
 
@@ -525,165 +708,45 @@ id,icon,title,description,border_color
 
 데이터 기반 수치를 정확히 반영해주세요.
 """
-    response = call_gemini(client, prompt)
-    if response:
-        rows = parse_csv_response(response)
-        save_csv(rows, output_dir / "02_key_findings.csv")
-    
-    time.sleep(API_DELAY)
-    
-    # --- 03_top10_table.csv ---
-    print("   📝 TOP 10 테이블 생성...")
-    prompt = f"""
-TOP10 게임 종합 평가 데이터를 테이블 형식으로 정제해주세요.
-
-## 데이터
-{raw_data['top10_evaluation']['content']}
-
-## 장르 참조 (TOP50)
-{raw_data['top50_games']['content']}
-
-정확히 아래 CSV 형식으로만 출력:
-
-```csv
-rank,name,genre,review_status,review_count,wishlist_before,wishlist_after,wishlist_increase,wishlist_percent,top_language
-1,빈딕투스: 디파잉 페이트,액션 RPG,복합적,5200,592569,744174,151605,+25.6%,간체 중국어
-2,와일드 게이트,슈팅,확인불가,1811,296446,356172,59726,+20.1%,간체 중국어
-3,Jump Ship,슈팅,매우 긍정적,3297,891839,981554,89715,+10.1%,간체 중국어
-4,MIMESIS,공포,확인불가,0,124569,178394,53825,+43.2%,
-5,Zoochosis,액션,압도적 긍정,2207,273244,345177,71933,+26.3%,러시아어
-6,나 혼자만 레벨업: 어라이즈,액션 RPG,확인불가,0,516086,589015,72929,+14.1%,
-7,PIONER,MMORPG,확인불가,336,283902,366792,82890,+29.2%,러시아어
-8,Holstin,공포,압도적 긍정,1197,412647,502928,90281,+21.9%,간체 중국어
-9,UFL,스포츠,확인불가,0,234225,254707,20482,+8.7%,
-10,Starlight ReVolver,로그라이크,확인불가,0,94879,108088,13209,+13.9%,
-```
-
-게임명 매핑 적용하고, 찜 증가량과 증가율 계산해주세요.
-"""
-    response = call_gemini(client, prompt)
-    if response:
-        rows = parse_csv_response(response)
-        save_csv(rows, output_dir / "03_top10_table.csv")
-    
-    time.sleep(API_DELAY)
-    
-    # --- 04_top10_charts.csv ---
-    print("   📝 TOP 10 차트 데이터 생성...")
-    prompt = f"""
-TOP 10 게임의 시각화용 차트 데이터를 생성해주세요.
-
-## TOP10 종합 평가
-{raw_data['top10_evaluation']['content']}
-
-정확히 아래 CSV 형식으로만 출력:
-
-```csv
-chart_type,label,value,color
-wishlist_top5,빈딕투스,151605,#0047AB
-wishlist_top5,Jump Ship,89715,#3B82F6
-wishlist_top5,Zoochosis,90281,#0047AB
-wishlist_top5,PIONER,82890,#8B5CF6
-wishlist_top5,나혼자레벨업,72929,#0047AB
-review_dist,압도적 긍정,2,#003380
-review_dist,매우 긍정적,1,#0047AB
-review_dist,복합적,1,#60A5FA
-review_dist,확인불가,6,#94A3B8
-genre_dist,액션 RPG,2,#003380
-genre_dist,슈팅,2,#0047AB
-genre_dist,공포,2,#3B82F6
-genre_dist,기타,4,#94A3B8
-```
-
-데이터에서 실제 수치를 계산해주세요.
-"""
-    response = call_gemini(client, prompt)
-    if response:
-        rows = parse_csv_response(response)
-        save_csv(rows, output_dir / "04_top10_charts.csv")
+    jobs.append(make_job(folder, "02_key_findings.csv", "핵심 성과 요약 생성", prompt, inputs=["top10_evaluation", "top50_games"]))
     
-    time.sleep(API_DELAY)
+    # --- 03_top10_table.csv (로컬 계산) ---
+    jobs.append(make_local_job(folder, "03_top10_table.csv", "TOP 10 테이블 생성",
+                               snf_stats.top10_table_rows(top10_eval, top50_games),
+                               inputs=["top10_evaluation", "top50_games"]))
     
-    # --- 05_top50_table.csv ---
-    print("   📝 TOP 50 테이블 생성...")
-    prompt = f"""
-TOP50 게임 데이터를 정제해주세요.
-
-## 데이터
-{raw_data['top50_games']['content']}
-
-정확히 아래 CSV 형식으로만 출력 (처음 15개만):
-
-```csv
-rank,name,genre,play_type,demo_available,release_date,chart_count,notes
-1,빈딕투스: 디파잉 페이트,액션 RPG,멀티,가능,출시예정,14,NEXON
-2,와일드 게이트,슈팅,멀티,불가능,2025.07.23,9,1인칭 슈팅
-3,Jump Ship,슈팅,멀티,가능,2025년,15,1인칭 슈팅
-4,MIMESIS,공포,멀티,불가능,2025년 3분기,6,
-5,Zoochosis,액션,싱글,가능,출시예정,9,
-```
-
-알려진 게임명은 한글로 매핑해주세요.
-"""
-    response = call_gemini(client, prompt)
-    if response:
-        rows = parse_csv_response(response)
-        save_csv(rows, output_dir / "05_top50_table.csv")
+    # --- 04_top10_charts.csv (로컬 계산) ---
+    jobs.append(make_local_job(folder, "04_top10_charts.csv", "TOP 10 차트 데이터 생성",
+                               snf_stats.top10_chart_rows(top10_eval, top50_games),
+                               inputs=["top10_evaluation", "top50_games"]))
     
-    time.sleep(API_DELAY)
+    # --- 05_top50_table.csv (로컬 계산) ---
+    jobs.append(make_local_job(folder, "05_top50_table.csv", "TOP 50 테이블 생성",
+                               snf_stats.top50_table_rows(top50_games), inputs=["top50_games"]))
     
-    # --- 06_top50_charts.csv ---
-    print("   📝 TOP 50 차트 데이터 생성...")
-    prompt = f"""
-TOP 50 게임의 통계 데이터를 생성해주세요.
-
-## 데이터
-{raw_data['top50_games']['content']}
-
-정확히 아래 CSV 형식으로만 출력:
-
-```csv
-chart_type,label,value,color,percentage
-genre_dist,로그라이크,14,#003380,28%
-genre_dist,슈팅,8,#0047AB,16%
-genre_dist,액션,6,#3B82F6,12%
-genre_dist,시뮬레이션,6,#60A5FA,12%
-genre_dist,공포,5,#93C5FD,10%
-genre_dist,기타,11,#94A3B8,22%
-play_type,멀티플레이,27,#0047AB,54%
-play_type,싱글플레이,23,#60A5FA,46%
-demo_avail,체험판 제공,29,#0047AB,58%
-demo_avail,체험판 없음,21,#94A3B8,42%
-```
-
-실제 데이터 수치를 계산하여 반영해주세요.
-"""
-    response = call_gemini(client, prompt)
-    if response:
-        rows = parse_csv_response(response)
-        save_csv(rows, output_dir / "06_top50_charts.csv")
+    # --- 06_top50_charts.csv (로컬 계산) ---
+    jobs.append(make_local_job(folder, "06_top50_charts.csv", "TOP 50 차트 데이터 생성",
+                               snf_stats.top50_chart_rows(top50_games), inputs=["top50_games"]))
     
-    print("   ✅ TOP Games 완료!")
+    return jobs
 
 
 # ============================================
 # 3. Charts 생성
 # ============================================
-def generate_charts(client, raw_data):
-    """Charts 섹션의 모든 CSV 생성"""
-    print("\n" + "="*50)
-    print("📊 3/4 Charts 생성")
-    print("="*50)
-    
-    output_dir = GITHUB_DATA_DIR / "03_charts"
+def build_charts_jobs(raw_data, context):
+    """Charts 섹션의 프롬프트 작업 목록"""
+    folder = "03_charts"
+    jobs = []
+    # 차트 기록을 한 번만 순회해 (게임, 차트)별로 묶어 둠
+    chart_index = snf_stats.as_chart_index(snf_stats.normalize_chart_entries(raw_data['chart_integration']['table']))
     
     # --- 01_kpi_cards.csv ---
-    print("\n   📝 KPI 카드 생성...")
     prompt = f"""
 3종 차트인 횟수 데이터를 분석하여 핵심 KPI 3개를 추출해주세요.
 
 ## 차트 데이터
-{raw_data['chart_integration']['content']}
+{chart_digest(context, chart_index)}
 
 정확히 아래 CSV 형식으로만 출력:
 
@@ -696,20 +759,14 @@ id,icon,value,label,description,color
 
 데이터에서 실제 수치를 계산해주세요.
 """
-    response = call_gemini(client, prompt)
-    if response:
-        rows = parse_csv_response(response)
-        save_csv(rows, output_dir / "01_kpi_cards.csv")
-    
-    time.sleep(API_DELAY)
+    jobs.append(make_job(folder, "01_kpi_cards.csv", "KPI 카드 생성", prompt, inputs=["chart_integration"]))
     
     # --- 02_key_findings.csv ---
-    print("   📝 핵심 발견점 생성...")
     prompt = f"""
 차트 데이터를 분석하여 핵심 발견점 4개를 도출해주세요.
 
 ## 차트 데이터
-{raw_data['chart_integration']['content']}
+{chart_digest(context, chart_index)}
 
 정확히 아래 CSV 형식으로만 출력:
 
@@ -721,51 +778,18 @@ id,icon,title,description,color
 4,🚀,3종 차트 동시 공략이 핵심,세 종류의 차트에 모두 진입한 게임들이 평균 12회 이상 노출되며 높은 성과를 기록했습니다.,#3B82F6
 ```
 """
-    response = call_gemini(client, prompt)
-    if response:
-        rows = parse_csv_response(response)
-        save_csv(rows, output_dir / "02_key_findings.csv")
-    
-    time.sleep(API_DELAY)
-    
-    # --- 03_chart_data.csv ---
-    print("   📝 차트별 통계 생성...")
-    prompt = f"""
-3종 차트의 통계 데이터를 생성해주세요.
-
-## 차트 데이터
-{raw_data['chart_integration']['content']}
-
-정확히 아래 CSV 형식으로만 출력:
-
-```csv
-chart_type,stat_type,label,value,percentage
-인기 체험판,count,총 노출 횟수,52,35%
-인기 출시 예정 게임,count,총 노출 횟수,48,32%
-떠오르는 출시 예정 게임,count,총 노출 횟수,51,33%
-top_games,Jump Ship,차트인 횟수,15,10%
-top_games,빈딕투스,차트인 횟수,14,9%
-top_games,나혼자레벨업,차트인 횟수,12,8%
-top_games,Holstin,차트인 횟수,12,8%
-top_games,와일드 게이트,차트인 횟수,9,6%
-```
-
-데이터에서 실제 수치를 계산해주세요.
-"""
-    response = call_gemini(client, prompt)
-    if response:
-        rows = parse_csv_response(response)
-        save_csv(rows, output_dir / "03_chart_data.csv")
+    jobs.append(make_job(folder, "02_key_findings.csv", "핵심 발견점 생성", prompt, inputs=["chart_integration"]))
     
-    time.sleep(API_DELAY)
+    # --- 03_chart_data.csv (로컬 계산) ---
+    jobs.append(make_local_job(folder, "03_chart_data.csv", "차트별 통계 생성",
+                               snf_stats.chart_data_rows(chart_index), inputs=["chart_integration"]))
     
     # --- 04_strategy_cards.csv ---
-    print("   📝 차트 전략 카드 생성...")
     prompt = f"""
 차트 데이터 분석을 바탕으로 차트 진입 전략 3개를 도출해주세요.
 
 ## 차트 데이터
-{raw_data['chart_integration']['content']}
+{chart_digest(context, chart_index)}
 
 정확히 아래 CSV 형식으로만 출력:
 
@@ -776,119 +800,71 @@ id,icon,title,description,details
 3,🚀,3종 차트 동시 진입,모든 차트에 노출되면 평균 12회 이상,체험판+찜 동시 마케팅|출시 예정일 설정|떠오르는 차트는 바이럴|Day 1-2에 집중
 ```
 """
-    response = call_gemini(client, prompt)
-    if response:
-        rows = parse_csv_response(response)
-        save_csv(rows, output_dir / "04_strategy_cards.csv")
+    jobs.append(make_job(folder, "04_strategy_cards.csv", "차트 전략 카드 생성", prompt, inputs=["chart_integration"]))
     
-    time.sleep(API_DELAY)
+    # --- 05_demo_chart.csv (로컬 계산) ---
+    jobs.append(make_local_job(folder, "05_demo_chart.csv", "인기 체험판 차트 상세 생성",
+                               snf_stats.chart_detail_rows(chart_index, "인기 체험판", DEMO_CHART_COLUMNS),
+                               inputs=["chart_integration"]))
     
-    # --- 05_demo_chart.csv ---
-    print("   📝 인기 체험판 차트 상세 생성...")
-    prompt = f"""
-인기 체험판 차트 데이터만 필터링하여 분석해주세요.
-
-## 차트 데이터 (차트 구분 = 인기 체험판)
-{raw_data['chart_integration']['content']}
-
-정확히 아래 CSV 형식으로만 출력:
-
-```csv
-rank,name,appearances,best_rank,first_date,last_date,consecutive_days
-1,Jump Ship,6,1,2025-06-10,2025-06-16,5
-2,빈딕투스,5,1,2025-06-11,2025-06-16,4
-3,와일드 게이트,4,1,2025-06-11,2025-06-16,3
-4,스텔라 블레이드,3,3,2025-06-11,2025-06-13,3
-5,PIONER,3,5,2025-06-11,2025-06-13,2
-```
-
-차트 구분이 "인기 체험판"인 데이터만 분석해주세요.
-"""
-    response = call_gemini(client, prompt)
-    if response:
-        rows = parse_csv_response(response)
-        save_csv(rows, output_dir / "05_demo_chart.csv")
-    
-    time.sleep(API_DELAY)
+    # --- 06_popular_upcoming.csv (로컬 계산) ---
+    jobs.append(make_local_job(folder, "06_popular_upcoming.csv", "인기 출시 예정 차트 상세 생성",
+                               snf_stats.chart_detail_rows(chart_index, "인기 출시 예정 게임", POPULAR_CHART_COLUMNS),
+                               inputs=["chart_integration"]))
     
-    # --- 06_popular_upcoming.csv ---
-    print("   📝 인기 출시 예정 차트 상세 생성...")
+    # --- 07_trending_upcoming.csv (숫자와 trend_direction은 로컬 계산, notes만 Gemini) ---
+    trending_rows = snf_stats.chart_detail_rows(chart_index, "떠오르는 출시 예정 게임", TRENDING_CHART_COLUMNS)
     prompt = f"""
-인기 출시 예정 게임 차트 데이터를 분석해주세요.
-
-## 차트 데이터 (차트 구분 = 인기 출시 예정 게임)
-{raw_data['chart_integration']['content']}
-
-정확히 아래 CSV 형식으로만 출력:
+떠오르는 출시 예정 게임 차트 데이터를 분석해주세요.
 
+## 계산된 통계 (rank, name, appearances, best_rank, trend_direction은 정확한 값이므로 그대로 유지)
 ```csv
-rank,name,appearances,best_rank,first_date,last_date
-1,나 혼자만 레벨업,6,3,2025-06-10,2025-06-16
-2,빈딕투스,4,1,2025-06-12,2025-06-16
-3,Dispatch,3,4,2025-06-13,2025-06-16
-4,Anvil Empires,4,6,2025-06-10,2025-06-12
-5,Holstin,3,9,2025-06-13,2025-06-16
+{format_rows_csv(trending_rows)}
 ```
 
-차트 구분이 "인기 출시 예정 게임"인 데이터만 분석해주세요.
-"""
-    response = call_gemini(client, prompt)
-    if response:
-        rows = parse_csv_response(response)
-        save_csv(rows, output_dir / "06_popular_upcoming.csv")
-    
-    time.sleep(API_DELAY)
-    
-    # --- 07_trending_upcoming.csv ---
-    print("   📝 떠오르는 출시 예정 차트 상세 생성...")
-    prompt = f"""
-떠오르는 출시 예정 게임 차트 데이터를 분석해주세요.
-
-## 차트 데이터 (차트 구분 = 떠오르는 출시 예정 게임)
-{raw_data['chart_integration']['content']}
+## 일자별 순위와 추세 (차트 구분 = 떠오르는 출시 예정 게임)
+추세는 첫 진입일 ~ 마지막 날을 반으로 나눠 뒤 절반이 평균 1계단 이상 높으면 상승, 낮으면 하락입니다.
+모멘텀은 그 평균 점수 차이(양수 = 상승), 하루 순위 변화는 첫 진입 → 마지막 진입의 하루 평균 순위 상승입니다.
+{chart_timeline_digest(context, chart_index, "떠오르는 출시 예정 게임", [row['name'] for row in trending_rows])}
 
+위 표의 각 게임에 대해 추세 지표를 근거로 notes(짧은 설명)만 채워서
 정확히 아래 CSV 형식으로만 출력:
 
 ```csv
 rank,name,appearances,best_rank,trend_direction,notes
 1,Jump Ship,5,1,상승,6일 연속 상위권
 2,Moonlighter 2,3,1,유지,첫날 1위
-3,나 혼자만 레벨업,4,4,유지,꾸준한 상위권
-4,와일드 게이트,3,7,상승,후반 상승세
-5,스텔라 블레이드,2,2,하락,초반 강세
 ```
 
-차트 구분이 "떠오르는 출시 예정 게임"인 데이터만 분석해주세요.
+name은 계산된 통계 표와 똑같이 적어주세요.
 """
-    response = call_gemini(client, prompt)
-    if response:
-        rows = parse_csv_response(response)
-        save_csv(rows, output_dir / "07_trending_upcoming.csv")
+    jobs.append(make_job(folder, "07_trending_upcoming.csv", "떠오르는 출시 예정 차트 상세 생성", prompt,
+                         inputs=["chart_integration"], rows=trending_rows, merge_keys=["name"]))
     
-    print("   ✅ Charts 완료!")
+    # --- 10_daily_activity.csv (로컬 계산, 일자별 차트 활동 그래프용) ---
+    jobs.append(make_local_job(folder, "10_daily_activity.csv", "일자별 차트 활동 생성",
+                               snf_stats.daily_activity_rows(chart_index), inputs=["chart_integration"]))
+    
+    return jobs
 
 
 # ============================================
 # 4. Report 생성
 # ============================================
-def generate_report(client, raw_data):
-    """Report 섹션의 모든 CSV 생성"""
-    print("\n" + "="*50)
-    print("📋 4/4 Report 생성")
-    print("="*50)
-    
-    output_dir = GITHUB_DATA_DIR / "04_report"
+def build_report_jobs(raw_data, context):
+    """Report 섹션의 프롬프트 작업 목록"""
+    folder = "04_report"
+    jobs = []
     
     # --- 01_checklist.csv ---
-    print("\n   📝 체크리스트 생성...")
     prompt = f"""
 전체 데이터를 종합하여 SNF 참가 준비 체크리스트 4개를 만들어주세요.
 
 ## 결산 페이지 (태그, 언어, 커뮤니티)
-{raw_data['report_page']['content']}
+{report_digest(context, ['tags', 'interface', 'community'], share=0.5)}
 
 ## TOP50 게임 (체험판, 멀티플레이)
-{raw_data['top50_games']['content']}
+{top50_digest(context, share=0.5)}
 
 정확히 아래 CSV 형식으로만 출력:
 
@@ -900,20 +876,14 @@ id,icon,title,description,detail_items
 4,👥,멀티플레이 고려,TOP 10의 70%가 멀티 지원,Co-op 모드 바이럴 효과|친구 초대 시스템|싱글이면 리더보드 추가|스트리머 협업 용이
 ```
 """
-    response = call_gemini(client, prompt)
-    if response:
-        rows = parse_csv_response(response)
-        save_csv(rows, output_dir / "01_checklist.csv")
-    
-    time.sleep(API_DELAY)
+    jobs.append(make_job(folder, "01_checklist.csv", "체크리스트 생성", prompt, inputs=["report_page", "top50_games"]))
     
     # --- 02_kpi_cards.csv ---
-    print("   📝 KPI 카드 생성...")
     prompt = f"""
 결산 데이터에서 핵심 KPI 4개를 추출해주세요.
 
 ## 결산 페이지
-{raw_data['report_page']['content']}
+{report_digest(context, ['tags', 'interface', 'community'])}
 
 정확히 아래 CSV 형식으로만 출력:
 
@@ -927,20 +897,14 @@ id,icon,value,label,sublabel,highlight
 
 데이터에서 실제 수치를 계산해주세요.
 """
-    response = call_gemini(client, prompt)
-    if response:
-        rows = parse_csv_response(response)
-        save_csv(rows, output_dir / "02_kpi_cards.csv")
-    
-    time.sleep(API_DELAY)
+    jobs.append(make_job(folder, "02_kpi_cards.csv", "KPI 카드 생성", prompt, inputs=["report_page"]))
     
     # --- 03_tags_analysis.csv ---
-    print("   📝 태그 분석 생성...")
     prompt = f"""
 결산 페이지의 태그 데이터를 분석해주세요.
 
 ## 결산 페이지
-{raw_data['report_page']['content']}
+{report_digest(context, ['tags'])}
 
 정확히 아래 CSV 형식으로만 출력:
 
@@ -956,51 +920,43 @@ genre_required,슈팅,FPS|Shooter|Multiplayer|PvP,,
 genre_required,로그라이크,Roguelike|Procedural|Difficult,,
 ```
 """
-    response = call_gemini(client, prompt)
-    if response:
-        rows = parse_csv_response(response)
-        save_csv(rows, output_dir / "03_tags_analysis.csv")
+    jobs.append(make_job(folder, "03_tags_analysis.csv", "태그 분석 생성", prompt, inputs=["report_page"]))
     
-    time.sleep(API_DELAY)
-    
-    # --- 04_language_support.csv ---
-    print("   📝 언어 지원 분석 생성...")
+    # --- 04_language_support.csv (숫자 행은 로컬 계산, note/strategy만 Gemini) ---
+    language_rows = snf_stats.language_support_rows(raw_data['report_page']['table'])
     prompt = f"""
 결산 페이지의 언어 지원 데이터를 분석해주세요.
 
+## 계산된 언어 지원 통계 (game_count, percentage, priority는 정확한 값이므로 그대로 유지)
+```csv
+{format_rows_csv(language_rows)}
+```
+
 ## 결산 페이지
-{raw_data['report_page']['content']}
+{report_digest(context, ['interface', 'voice', 'subtitles'])}
 
-정확히 아래 CSV 형식으로만 출력:
+계산된 통계의 interface 행마다 note(짧은 설명)를 채우고,
+게임 규모/지역별 언어 전략을 strategy 행으로 추가해서 정확히 아래 CSV 형식으로만 출력:
 
 ```csv
-support_type,rank,language,game_count,percentage,priority
-interface,1,영어,50,100%,필수
-interface,2,중국어 간체,46,92%,필수
-interface,3,한국어,35,70%,권장
-interface,4,일본어,34,68%,권장
-interface,5,중국어 번체,27,54%,권장
-interface,6,러시아어,28,56%,선택
-interface,7,프랑스어,26,52%,선택
-strategy,인디,영어+중국어+한국어,3,,
-strategy,AA급,영어+중국어+한국어+일본어+러시아어,5,,
-strategy,AAA급,10개 이상 다국어,10,,
+support_type,rank,language,game_count,percentage,priority,note
+interface,1,영어,50,100%,필수,글로벌 기본
+interface,2,중국어 간체,46,92%,필수,최대 시장
+strategy,인디,영어+중국어+한국어,3,,,최소 필수
+strategy,AA급,영어+중국어+한국어+일본어+러시아어,5,,,권장
+strategy,AAA급,10개 이상 다국어,10,,,필수
 ```
 """
-    response = call_gemini(client, prompt)
-    if response:
-        rows = parse_csv_response(response)
-        save_csv(rows, output_dir / "04_language_support.csv")
-    
-    time.sleep(API_DELAY)
+    jobs.append(make_job(folder, "04_language_support.csv", "언어 지원 분석 생성", prompt,
+                         inputs=["report_page"], rows=language_rows, merge_keys=["support_type", "language"],
+                         extra_rows={"support_type": ["strategy"]}))
     
     # --- 05_community.csv ---
-    print("   📝 커뮤니티 분석 생성...")
     prompt = f"""
 결산 페이지의 커뮤니티 데이터를 분석해주세요.
 
 ## 결산 페이지
-{raw_data['report_page']['content']}
+{report_digest(context, ['community', 'interface'])}
 
 정확히 아래 CSV 형식으로만 출력:
 
@@ -1021,30 +977,216 @@ timeline,실행단계,실시간 Q&A|핫픽스 공지|피드백 수집|매일 커
 timeline,정리단계,설문조사|로드맵 공개|지속적 소통|출시일 발표,SNF 종료 후,
 ```
 """
-    response = call_gemini(client, prompt)
-    if response:
-        rows = parse_csv_response(response)
-        save_csv(rows, output_dir / "05_community.csv")
+    jobs.append(make_job(folder, "05_community.csv", "커뮤니티 분석 생성", prompt, inputs=["report_page"]))
+    
+    # --- 07_language_charts.csv (로컬 계산, 음성/자막 언어 그래프용) ---
+    jobs.append(make_local_job(folder, "07_language_charts.csv", "음성/자막 언어 분포 생성",
+                               snf_stats.language_chart_rows(raw_data['report_page']['table']),
+                               inputs=["report_page"]))
     
-    print("   ✅ Report 완료!")
+    return jobs
+
+
+# ============================================
+# 섹션 실행
+# ============================================
+SECTIONS = {
+    "executive": {"folder": "01_executive", "title": "🎯 1/4 Executive Summary", "name": "Executive Summary", "build": build_executive_jobs},
+    "top_games": {"folder": "02_top_games", "title": "🏆 2/4 TOP Games", "name": "TOP Games", "build": build_top_games_jobs},
+    "charts": {"folder": "03_charts", "title": "📊 3/4 Charts", "name": "Charts", "build": build_charts_jobs},
+    "report": {"folder": "04_report", "title": "📋 4/4 Report", "name": "Report", "build": build_report_jobs},
+}
+
+
+def generate_section(ctx, raw_data, key):
+    """섹션 하나를 순차 생성 (API 호출 사이 API_DELAY 대기)"""
+    section = SECTIONS[key]
+    print("\n" + "="*50)
+    print(f"{section['title']} 생성")
+    print("="*50)
+    
+    called = False
+    for job in collect_jobs(ctx, raw_data, [key]):
+        if called:
+            with ctx['tracer'].span('sleep', reason='API_DELAY'):
+                time.sleep(API_DELAY)
+        print(f"\n   📝 {job['label']}...")
+        run_job(ctx, job)
+        called = job['prompt'] is not None and not job['cached']  # 로컬 계산은 호출 없음
+        if job['cached']:
+            print("   ♻️ 캐시 사용")
+    
+    print(f"   ✅ {section['name']} 완료!")
+
+
+def generate_executive(backend, raw_data):
+    """Executive Summary 섹션의 모든 CSV 생성"""
+    generate_section(make_context(backend), raw_data, "executive")
+
+
+def generate_top_games(backend, raw_data):
+    """TOP Games 섹션의 모든 CSV 생성"""
+    generate_section(make_context(backend), raw_data, "top_games")
+
+
+def generate_charts(backend, raw_data):
+    """Charts 섹션의 모든 CSV 생성"""
+    generate_section(make_context(backend), raw_data, "charts")
+
+
+def generate_report(backend, raw_data):
+    """Report 섹션의 모든 CSV 생성"""
+    generate_section(make_context(backend), raw_data, "report")
+
+
+def generate_sequential(ctx, raw_data):
+    """기존 방식: 섹션별 순차 호출 + 섹션 간 대기"""
+    for i, key in enumerate(SECTIONS):
+        if i > 0:
+            print(f"\n   ⏳ API 제한 방지를 위해 {SECTION_DELAY}초 대기...")
+            with ctx['tracer'].span('sleep', reason='SECTION_DELAY'):
+                time.sleep(SECTION_DELAY)
+        generate_section(ctx, raw_data, key)
+
+
+def generate_concurrent(ctx, raw_data, workers=DEFAULT_WORKERS):
+    """모든 섹션의 프롬프트를 RPM/TPM 한도 안에서 동시에 호출"""
+    jobs = collect_jobs(ctx, raw_data, SECTIONS)
+    local_count = sum(1 for job in jobs if job['prompt'] is None)
+    print(f"\n   ⚡ {len(jobs) - local_count}개 프롬프트 동시 실행 (워커 {workers}개), 로컬 계산 {local_count}개")
+    
+    def worker(job):
+        print(f"   📝 {job['output']} ({job['label']})")
+        return run_job(ctx, job)
+    
+    started = time.monotonic()
+    results = run_concurrent(jobs, worker, max_workers=workers)
+    failed = [output for output, (ok, saved) in results.items() if not ok or not saved]
+    cached = sum(1 for job in jobs if job.get('cached') and not job.get('resumed'))
+    resumed = sum(1 for job in jobs if job.get('resumed'))
+    members = {member['output']: member for job in jobs for member in job.get('batch', [job])}
+    repairs = sum(job.get('repairs', 0) for job in members.values())
+    print(f"\n   ⏱️ {time.monotonic() - started:.1f}초 소요, 캐시 {cached}개, "
+          + (f"이어하기 {resumed}개, " if resumed else "") + f"재요청 {repairs}회, 실패 {len(failed)}개")
+    for output in sorted(failed):
+        job = members.get(output, {})
+        reason = f" ({'; '.join(job['parse'].problems()[:2])})" if 'parse' in job and not job['parse'].ok else ""
+        print(f"   ⚠️ 생성 실패: {output}{reason}")
+    # 저장은 됐지만 응답이 불량했던 파일 (로컬 계산 병합, 일괄 요청의 개별 파일)
+    for output, job in sorted(members.items()):
+        if 'parse' in job and not job['parse'].ok and output not in failed:
+            kept = "숫자 행만 저장" if job['rows'] is not None else "기존 파일 유지"
+            print(f"   ⚠️ 응답 불량 ({kept}): {output} ({'; '.join(job['parse'].problems()[:2])})")
+    return results
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="SNF Dashboard AI Insights Generator")
+    parser.add_argument("--sequential", action="store_true",
+                        help="기존 방식대로 순차 호출 (API_DELAY/섹션 대기 적용)")
+    parser.add_argument("--rpm", type=int, default=DEFAULT_RPM, help="분당 요청 수 한도")
+    parser.add_argument("--tpm", type=int, default=DEFAULT_TPM, help="분당 토큰 수 한도")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="동시 호출 워커 수")
+    parser.add_argument("--retry-delay", type=float, default=RETRY_DELAY, help="429 재시도 기본 대기(초)")
+    parser.add_argument("--output-dir", type=Path, default=GITHUB_DATA_DIR, help="CSV 저장 위치")
+    parser.add_argument("--no-cache", action="store_true", help="응답 캐시를 읽지도 쓰지도 않음")
+    parser.add_argument("--refresh", action="append", default=[], choices=list(SECTIONS) + ["all"],
+                        metavar="SECTION", help="캐시를 무시하고 다시 호출할 섹션 (반복 가능, all = 전체)")
+    parser.add_argument("--cache-dir", type=Path, default=CACHE_DIR, help="응답 캐시 위치")
+    parser.add_argument("--cache-max-age-days", type=float, default=DEFAULT_MAX_AGE_DAYS,
+                        help="이보다 오래된 캐시 항목은 삭제")
+    parser.add_argument("--cache-max-mb", type=float, default=DEFAULT_MAX_MB,
+                        help="캐시 전체 크기 한도 (초과 시 오래 안 쓴 항목부터 삭제)")
+    parser.add_argument("--no-snapshot", action="store_true",
+                        help="원본 CSV 파싱 스냅샷(.cache/dataset.pickle)을 쓰지 않고 매번 다시 파싱")
+    parser.add_argument("--festival", help="RAW_DIR 대신 기록 저장소에 넣어 둔 축제 데이터 사용 (festival_store.py ingest)")
+    parser.add_argument("--store", type=Path, default=DEFAULT_STORE, help="축제 기록 저장소 위치")
+    parser.add_argument("--context-budget", type=int, default=DEFAULT_BUDGET,
+                        help="프롬프트에 넣는 원본 요약 하나의 토큰 한도")
+    parser.add_argument("--raw-context", action="store_true",
+                        help="요약 대신 원본 CSV 앞부분을 그대로 프롬프트에 넣음 (이전 방식)")
+    parser.add_argument("--batch", action="store_true",
+                        help="섹션마다 CSV들을 JSON 응답 요청 하나로 묶어 호출 (25회 → 약 4회)")
+    parser.add_argument("--repair-attempts", type=int, default=REPAIR_ATTEMPTS,
+                        help="응답이 스키마 검사에 실패하면 오류를 붙여 다시 요청할 횟수 (프롬프트당)")
+    parser.add_argument("--repair-budget", type=int, default=REPAIR_BUDGET,
+                        help="실행 전체 재요청 한도")
+    parser.add_argument("--incremental", action="store_true",
+                        help="원본 파일 지문/프롬프트가 바뀐 출력 CSV만 다시 생성")
+    parser.add_argument("--backend", choices=list(BACKENDS), default="gemini",
+                        help="LLM 백엔드 (gemini / fake / replay: 캐시된 응답 재생 / local: OpenAI 호환 서버)")
+    parser.add_argument("--model", help=f"모델 이름 (gemini·replay 기본: {MODEL_NAME}, local은 필수)")
+    parser.add_argument("--local-url", default=LOCAL_URL, help="local 백엔드 주소 (OpenAI 호환 /v1)")
+    parser.add_argument("--fake", action="store_const", const="fake", dest="backend",
+                        help="--backend fake 와 같음 (API 호출 없음)")
+    parser.add_argument("--fake-latency", type=float, default=None,
+                        help="fake/replay 응답 지연(초) (기본: fake 0.2, replay 0)")
+    parser.add_argument("--fake-error-rate", type=float, default=0.0, help="fake/replay 429 비율")
+    parser.add_argument("--fake-invalid-rate", type=float, default=0.0,
+                        help="fake/replay가 헤더만 있는 불량 CSV를 돌려주는 비율 (재요청 시험용)")
+    parser.add_argument("--resume", action="store_true",
+                        help="출력 폴더의 실행 일지(.run_journal.jsonl)를 보고 끝난 작업은 건너뛰어 이어서 실행")
+    session = parser.add_mutually_exclusive_group()
+    session.add_argument("--record-session", type=Path, metavar="PATH",
+                         help="주고받은 프롬프트/응답을 세션 기록 파일(.json.gz)로 저장")
+    session.add_argument("--replay-session", type=Path, metavar="PATH",
+                         help="세션 기록의 응답으로 재생성 (API 호출/캐시/대기 없음, --backend 무시)")
+    args = parser.parse_args(argv)
+    if args.fake_latency is None:
+        args.fake_latency = 0.2 if args.backend == "fake" else 0.0
+    return args
 
 
 # ============================================
 # 메인 실행
 # ============================================
-def main():
+def save_run_report(tracer, args, backend, status):
+    """단계별 시간/토큰 표 출력 + .run_report.json / 실행 이력 저장"""
+    report = tracer.report(status=status, backend=backend.name, model=backend.model,
+                           mode="sequential" if args.sequential else "concurrent", batch=args.batch,
+                           output_dir=str(args.output_dir))
+    print_summary(report)
+    print(f"   📄 실행 기록: {write_report(report, args.output_dir)}")
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    tracer = Tracer()
+
     print("=" * 60)
     print("🚀 SNF Dashboard AI Insights Generator v2.0")
     print(f"   실행 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("=" * 60)
     
-    # 1. Gemini API 설정
-    client = setup_gemini()
-    if not client:
+    # 1. LLM 백엔드 설정
+    replay = None
+    if args.replay_session:
+        try:
+            replay = SessionArchive.load(args.replay_session)
+        except (OSError, ValueError) as e:
+            print(f"❌ 세션 기록을 읽지 못했습니다: {e}")
+            return
+        # 기록할 때와 같은 원본/옵션으로 프롬프트를 만들어야 응답을 찾을 수 있음
+        args.festival = args.festival or replay.festival
+        for name, value in replay.options.items():
+            setattr(args, name, value)
+    backend = setup_backend(args, replay)
+    if not backend:
         return
     
     # 2. 원본 데이터 로드
-    raw_data = load_all_raw_data()
+    dataset = None
+    if args.festival:
+        with FestivalStore(args.store) as store:
+            try:
+                dataset = store.load_dataset(args.festival)
+            except KeyError as e:
+                print(f"\n❌ {e.args[0]}")
+                print(f"   저장된 축제: {', '.join(f['festival'] for f in store.festivals()) or '없음'}")
+                return
+        print(f"\n🗂️ 축제 기록 사용: {args.festival} ({args.store})")
+    with tracer.span('load'):
+        raw_data = load_all_raw_data(None if args.no_snapshot else SNAPSHOT_PATH, dataset=dataset)
     
     loaded_count = sum(1 for v in raw_data.values() if v['path'])
     if loaded_count == 0:
@@ -1053,32 +1195,73 @@ def main():
         return
     
     print(f"\n✅ {loaded_count}/{len(RAW_FILES)} 파일 로드 완료")
+    inputs = input_state(RAW_FILES, raw_data)
+    if replay and replay.changed_inputs(inputs):
+        print(f"   ⚠️ 기록 이후 바뀐 원본: {', '.join(replay.changed_inputs(inputs))} (해당 CSV는 재생되지 않음)")
+    recorder = None
+    if args.record_session:
+        recorder = SessionArchive(getattr(backend, 'source_model', backend.model), args.festival, inputs,
+                                  {name: getattr(args, name) for name in SESSION_OPTIONS})
     
     # 3. 각 섹션별 인사이트 생성
     print("\n" + "="*60)
     print("🤖 AI 인사이트 생성 시작 (총 25개 CSV 파일)")
     print("="*60)
     
+    cache = None
+    if replay:
+        # 재생은 기록만 쓰므로 캐시, 호출 간격 제한, 순차 모드 대기가 필요 없음
+        args.sequential = False
+    elif not args.no_cache:
+        cache = ResponseCache(args.cache_dir, max_age_days=args.cache_max_age_days,
+                              max_bytes=int(args.cache_max_mb * 1024 * 1024))
+        removed = cache.evict()
+        print(f"\n♻️ 응답 캐시: {args.cache_dir} ({len(cache)}개 항목, {removed}개 정리)")
+    refresh = [s['folder'] for key, s in SECTIONS.items() if key in args.refresh or "all" in args.refresh]
+    manifest = BuildManifest(args.output_dir)
+    journal = RunJournal(args.output_dir, resume=args.resume, model=backend.model)
+    if args.resume:
+        last = {None: "중단됨", "ok": "완료", "partial": "일부 실패", "failed": "오류로 중단"}.get(
+            journal.finished, journal.finished)
+        print(f"\n📒 이어하기: 지난 실행 {last}, 완료 {len(journal.done)}개, 실패 {len(journal.failed)}개 "
+              f"({journal.path.name})")
+    
     try:
-        generate_executive(client, raw_data)
-        print("\n   ⏳ API 제한 방지를 위해 30초 대기...")
-        time.sleep(30)
-        
-        generate_top_games(client, raw_data)
-        print("\n   ⏳ API 제한 방지를 위해 30초 대기...")
-        time.sleep(30)
-        
-        generate_charts(client, raw_data)
-        print("\n   ⏳ API 제한 방지를 위해 30초 대기...")
-        time.sleep(30)
-        
-        generate_report(client, raw_data)
+        if args.sequential:
+            ctx = make_context(backend, args.output_dir, retry_delay=args.retry_delay, cache=cache,
+                               refresh=refresh, manifest=manifest, incremental=args.incremental,
+                               context_budget=args.context_budget, raw_context=args.raw_context,
+                               batch=args.batch, repair_attempts=args.repair_attempts,
+                               repair_budget=args.repair_budget, session=recorder, tracer=tracer,
+                               journal=journal)
+            generate_sequential(ctx, raw_data)
+        else:
+            limiter = None if replay else RateLimiter(rpm=args.rpm, tpm=args.tpm)
+            ctx = make_context(backend, args.output_dir, limiter=limiter, retry_delay=args.retry_delay, cache=cache,
+                               refresh=refresh, manifest=manifest, incremental=args.incremental,
+                               context_budget=args.context_budget, raw_context=args.raw_context,
+                               batch=args.batch, repair_attempts=args.repair_attempts,
+                               repair_budget=args.repair_budget, session=recorder, tracer=tracer,
+                               journal=journal)
+            generate_concurrent(ctx, raw_data, workers=args.workers)
         
     except Exception as e:
         print(f"\n❌ 오류 발생: {e}")
         import traceback
         traceback.print_exc()
+        journal.finish("failed")
+        save_run_report(tracer, args, backend, "failed")
+        print(f"\n💡 끝난 {len(journal.done)}개 작업은 기록되어 있습니다. 이어서 실행: "
+              "python generate_insights.py --resume" + (" --sequential" if args.sequential else ""))
         return
+    finally:
+        # 실패하더라도 성공한 출력의 빌드 기록은 남김
+        manifest.save()
+        if recorder is not None:
+            size = recorder.save(args.record_session)
+            print(f"\n📼 세션 기록 저장: {args.record_session} ({len(recorder)}개 응답, {size / 1024:.1f}KB)")
+    
+    journal.finish("partial" if journal.failed else "ok")
     
     # 4. 결과 요약
     print("\n" + "="*60)
@@ -1088,17 +1271,26 @@ def main():
     # 생성된 파일 카운트
     csv_count = 0
     for folder in ["01_executive", "02_top_games", "03_charts", "04_report"]:
-        folder_path = GITHUB_DATA_DIR / folder
+        folder_path = args.output_dir / folder
         if folder_path.exists():
             count = len(list(folder_path.glob("*.csv")))
             csv_count += count
             print(f"   📁 {folder}/: {count}개 CSV")
     
     print(f"\n   ✅ 총 {csv_count}개 CSV 파일 생성")
-    print(f"\n💾 저장 위치: {GITHUB_DATA_DIR}")
+    print(f"\n💾 저장 위치: {args.output_dir}")
+    
+    # 5. 수치 교차 검증 (원본 계산값과 다른 숫자 표시)
+    with tracer.span('cross_check'):
+        report = check_dataset(args.output_dir, {key: value['table'] for key, value in raw_data.items()})
+    print_report(report)
+    save_run_report(tracer, args, backend, "ok")
     
+    if journal.failed:
+        print(f"\n💡 실패한 {len(journal.failed)}개 작업만 다시 실행: python generate_insights.py --resume")
     print("\n🔄 다음 단계:")
-    print("   1. 생성된 CSV 파일 확인")
+    print("   1. 생성된 CSV 파일 확인" + (f" (수치 불일치 {report['mismatches']}개: .cross_check.json)"
+                                      if report['mismatches'] else ""))
     print("   2. git add . && git commit -m 'Update AI insights' && git push")
     print("   3. 대시보드에서 새로고침하여 확인")
     
@@ -0,0 +1,194 @@
+"""
+LLM 백엔드
+==========
+generate_insights.py가 프롬프트를 보내는 대상을 바꿔 끼울 수 있게 합니다.
+모든 백엔드는 generate(prompt, config) → Completion(응답 텍스트, 입력/출력 토큰 수) 하나만 구현하고,
+model 속성을 응답 캐시 키로 씁니다 (백엔드가 다르면 캐시 항목도 섞이지 않음).
+
+    gemini   Google Gemini API (google-genai 패키지, GEMINI_API_KEY 필요)
+    fake     프롬프트의 ```csv 출력 예시를 그대로 돌려주는 가짜 (fake_gemini.py)
+    replay   응답 캐시에 기록된 응답을 그대로 돌려줌 (API 호출 없이 실제 응답으로 재실행)
+    local    OpenAI 호환 /v1/chat/completions 서버 (Ollama, llama.cpp server 등)
+
+fake / replay는 지연 시간과 429 비율을 조절할 수 있어 API 없이 전체 파이프라인의
+부하 시험, 벤치마크, CI 실행에 씁니다. 429는 실제 API와 같은 메시지 형태로 발생하므로
+generate_insights.py의 재시도/리미터 로직이 그대로 동작합니다.
+
+google-genai는 gemini 백엔드를 만들 때만 import하므로, 패키지가 없어도 다른 백엔드는 동작합니다.
+
+사용법:
+    python generate_insights.py --backend fake --fake-latency 0.5 --fake-error-rate 0.2
+    python generate_insights.py --backend replay                  # 지난 실행의 캐시된 응답으로 재생성
+    python generate_insights.py --backend local --model qwen2.5:7b --local-url http://localhost:11434/v1
+"""
+
+import json
+import os
+import urllib.error
+import urllib.request
+from typing import NamedTuple
+
+from fake_gemini import FakeGeminiClient
+from response_cache import ResponseCache, prompt_key
+
+GEMINI_MODEL = "gemini-2.0-flash"
+LOCAL_URL = "http://localhost:11434/v1"   # Ollama 기본 주소
+LOCAL_TIMEOUT = 300                       # 초 (로컬 모델은 느릴 수 있음)
+
+
+class Completion(NamedTuple):
+    """응답 텍스트 + 백엔드가 알려준 토큰 수 (모르면 None)"""
+    text: str
+    input_tokens: int = None
+    output_tokens: int = None
+
+
+class BackendUnavailable(Exception):
+    """백엔드를 만들 수 없을 때 (패키지/API 키/기록 없음)"""
+
+
+class ReplayMiss(Exception):
+    """재생할 기록이 없는 프롬프트"""
+
+
+class LLMBackend:
+    """백엔드 공통 인터페이스"""
+
+    name = None
+    model = None
+
+    def generate(self, prompt, config=None):
+        """프롬프트 하나 → Completion (응답이 없으면 text가 None)
+
+        config는 Gemini generate_content 설정 형식 (예: --batch의 response_schema).
+        429는 메시지에 '429' 또는 'RESOURCE_EXHAUSTED'가 들어간 예외로 알립니다.
+        """
+        raise NotImplementedError
+
+    def describe(self):
+        return f"{self.name} (모델: {self.model})"
+
+
+class GeminiBackend(LLMBackend):
+    name = "gemini"
+
+    def __init__(self, model=GEMINI_MODEL, api_key=None):
+        try:
+            from google import genai
+        except ImportError as e:
+            raise BackendUnavailable("google-genai 패키지가 설치되지 않았습니다.\n"
+                                     "   실행: pip install google-genai") from e
+        api_key = api_key or os.environ.get("GEMINI_API_KEY")
+        if not api_key:
+            raise BackendUnavailable("GEMINI_API_KEY 환경변수가 설정되지 않았습니다.\n"
+                                     '   Windows: $env:GEMINI_API_KEY = "your-api-key"')
+        self.model = model
+        self.client = genai.Client(api_key=api_key)
+
+    def generate(self, prompt, config=None):
+        kwargs = {'config': config} if config else {}
+        response = self.client.models.generate_content(model=self.model, contents=prompt, **kwargs)
+        if not response:
+            return Completion(None)
+        usage = getattr(response, 'usage_metadata', None)
+        return Completion(response.text, getattr(usage, 'prompt_token_count', None),
+                          getattr(usage, 'candidates_token_count', None))
+
+
+class FakeBackend(LLMBackend):
+    """fake_gemini.FakeGeminiClient 감싸기 (호출 수/동시 실행 수 기록은 self.client에)"""
+
+    name = "fake"
+
+    def __init__(self, latency=0.2, error_rate=0.0, invalid_rate=0.0, seed=None, responder=None):
+        self.model = "fake"
+        self.client = FakeGeminiClient(latency=latency, error_rate=error_rate, seed=seed,
+                                       invalid_rate=invalid_rate, responder=responder)
+
+    def generate(self, prompt, config=None):
+        response = self.client.models.generate_content(model=self.model, contents=prompt, config=config)
+        return Completion(response.text if response else None)
+
+
+class ReplayBackend(FakeBackend):
+    """기록된 응답 재생 (지연/429/불량 응답 주입은 FakeBackend와 같음)
+
+    records는 get(model, prompt)를 가진 저장소로, 기본은 응답 캐시 폴더입니다.
+    기록은 source_model(원래 응답한 모델) 이름으로 찾고, 이 백엔드 자체의 캐시 키는
+    'replay:<모델>'이라 재생 중 불량 응답을 캐시에서 지워도 기록은 남습니다.
+    """
+
+    name = "replay"
+
+    def __init__(self, records, source_model=GEMINI_MODEL, latency=0.0, error_rate=0.0,
+                 invalid_rate=0.0, seed=None):
+        super().__init__(latency=latency, error_rate=error_rate, invalid_rate=invalid_rate,
+                         seed=seed, responder=self._lookup)
+        self.records = records
+        self.source_model = source_model
+        self.model = f"replay:{source_model}"
+        self.misses = 0
+
+    @classmethod
+    def from_cache_dir(cls, cache_dir, source_model=GEMINI_MODEL, **options):
+        if not len(ResponseCache(cache_dir)):
+            raise BackendUnavailable(f"{cache_dir}에 기록된 응답이 없습니다. 먼저 실제 API로 한 번 실행하세요.")
+        # 재생용이므로 오래된 기록도 만료시키지 않음
+        return cls(ResponseCache(cache_dir, max_age_days=None), source_model, **options)
+
+    def _lookup(self, model, contents, config):
+        response = self.records.get(self.source_model, prompt_key(contents, config))
+        if response is None:
+            with self.client.lock:
+                self.misses += 1
+            raise ReplayMiss(f"기록된 응답 없음 ({self.source_model}, 프롬프트 {len(contents):,}자)")
+        return response
+
+
+class LocalBackend(LLMBackend):
+    """OpenAI 호환 채팅 API (표준 라이브러리 urllib만 사용)
+
+    config의 response_schema는 response_format의 JSON 스키마로 옮겨 보냅니다.
+    """
+
+    name = "local"
+
+    def __init__(self, model, base_url=LOCAL_URL, api_key=None, timeout=LOCAL_TIMEOUT):
+        if not model:
+            raise BackendUnavailable("local 백엔드는 --model 로 모델 이름을 지정해야 합니다.")
+        self.model = model
+        self.base_url = base_url.rstrip('/')
+        self.api_key = api_key or os.environ.get("LOCAL_LLM_API_KEY")
+        self.timeout = timeout
+
+    def describe(self):
+        return f"{self.name} (모델: {self.model}, {self.base_url})"
+
+    def generate(self, prompt, config=None):
+        body = {'model': self.model, 'messages': [{'role': 'user', 'content': prompt}]}
+        if config and config.get('response_schema'):
+            body['response_format'] = {'type': 'json_schema',
+                                       'json_schema': {'name': 'response', 'schema': config['response_schema']}}
+        headers = {'Content-Type': 'application/json'}
+        if self.api_key:
+            headers['Authorization'] = f"Bearer {self.api_key}"
+        request = urllib.request.Request(f"{self.base_url}/chat/completions",
+                                         data=json.dumps(body).encode('utf-8'), headers=headers)
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                result = json.load(response)
+        except urllib.error.HTTPError as e:
+            # 429는 메시지에 상태 코드가 들어가므로 재시도 대상으로 처리됨
+            raise RuntimeError(f"{e.code} {e.reason}: {e.read().decode('utf-8', 'replace')[:200]}") from e
+        choices = result.get('choices') or []
+        usage = result.get('usage') or {}
+        return Completion(choices[0]['message']['content'] if choices else None,
+                          usage.get('prompt_tokens'), usage.get('completion_tokens'))
+
+
+BACKENDS = {
+    'gemini': GeminiBackend,
+    'fake': FakeBackend,
+    'replay': ReplayBackend,
+    'local': LocalBackend,
+}
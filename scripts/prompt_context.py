@@ -0,0 +1,137 @@
+"""
+프롬프트 컨텍스트 요약
+======================
+원본 CSV 원문(최대 100행)을 프롬프트마다 그대로 붙이는 대신,
+프롬프트가 필요로 하는 컬럼만 골라 미리 계산한 요약(집계, 빈도, 상위 행)으로 바꿉니다.
+
+    context = PromptContext(raw_data, budget=DEFAULT_BUDGET)
+    context.table('top50_games', ['url', 'rank', 'genre'], sort_by='rank', limit=20)
+    context.rows('chart_integration', snf_stats.chart_digest_rows(index), notes=[...])
+    context.savings()   # (원문 토큰, 요약 토큰)
+
+요약 하나는 budget(추정 토큰) 안에 들어가도록 아래 행부터 잘라냅니다.
+verbatim=True면 예전처럼 원문을 그대로 넣습니다 (--raw-context).
+"""
+
+import threading
+from collections import Counter
+
+from scheduler import estimate_tokens
+from snf_dataset import SCHEMAS
+from snf_stats import extract_game_name, split_list
+
+DEFAULT_BUDGET = 1500  # 요약 하나의 추정 토큰 한도
+TOP_VALUES = 12        # 목록 컬럼(태그, 언어 등) 빈도 상위 개수
+
+
+def column_label(key, name):
+    """컬럼명 → 프롬프트에 보여줄 노션 헤더 (url은 게임명으로 바꿔 넣음)"""
+    if name == 'url':
+        return '게임명'
+    for column, source, _ in SCHEMAS.get(key, []):
+        if column == name:
+            return source
+    return name
+
+
+def _cell(value):
+    text = '' if value is None else str(value)
+    if any(ch in text for ch in ',"\n'):
+        text = '"' + text.replace('"', '""') + '"'
+    return text
+
+
+def _render(header, rows, notes, total):
+    lines = list(notes)
+    if rows:
+        lines.append(','.join(_cell(h) for h in header))
+        lines.extend(','.join(_cell(v) for v in row) for row in rows)
+    if total > len(rows):
+        lines.append(f"... (상위 {len(rows)}행만 표시, 전체 {total}행)")
+    return '\n'.join(lines)
+
+
+class PromptContext:
+    """섹션 하나의 프롬프트 요약기 (원문 대비 토큰 절감량을 함께 기록)"""
+
+    def __init__(self, raw_data, budget=DEFAULT_BUDGET, verbatim=False):
+        self.raw_data = raw_data
+        self.budget = budget
+        self.verbatim = verbatim
+        self.lock = threading.Lock()
+        self.raw_tokens = 0
+        self.digest_tokens = 0
+        self.digests = {}   # 만든 요약 텍스트 (--batch에서 공통 데이터로 한 번만 보냄)
+
+    def _record(self, key, text):
+        with self.lock:
+            self.raw_tokens += estimate_tokens(self.raw_data[key]['content'])
+            self.digest_tokens += estimate_tokens(text)
+            self.digests[text] = None
+        return text
+
+    def savings(self):
+        """(원문을 붙였을 때 토큰, 요약 토큰)"""
+        return self.raw_tokens, self.digest_tokens
+
+    def rows(self, key, rows, columns=None, labels=None, notes=(), limit=None, share=1.0):
+        """미리 계산한 행 목록 → 요약 텍스트
+
+        columns: 보여줄 키 (기본은 첫 행의 모든 키), labels: {키: 헤더}
+        notes: 표 위에 붙일 집계 문장, share: 프롬프트 하나에 요약이 여럿일 때 budget 비율
+        """
+        if self.verbatim:
+            return self._record(key, self.raw_data[key]['content'])
+        if self.raw_data[key]['table'] is None:
+            return self._record(key, '데이터 없음')
+        columns = columns or (list(rows[0].keys()) if rows else [])
+        labels = labels or {}
+        header = [labels.get(c, c) for c in columns]
+        values = [[row.get(c, '') for c in columns] for row in rows]
+        shown = values[:limit] if limit else values
+        budget = int(self.budget * share)
+        text = _render(header, shown, notes, len(values))
+        # budget 초과 시 아래 행부터 제거 (절반씩 줄인 뒤 한 행씩 조정)
+        while shown and estimate_tokens(text) > budget:
+            step = max(1, len(shown) // 2) if estimate_tokens(text) > budget * 2 else 1
+            shown = shown[:-step]
+            text = _render(header, shown, notes, len(values))
+        return self._record(key, text)
+
+    def table(self, key, columns, sort_by=None, limit=None, derived=None, lists=(), summary=(), share=1.0):
+        """원본 Table에서 필요한 컬럼만 뽑아 요약
+
+        derived: {헤더: 행 → 값} 미리 계산해 넣을 컬럼 (예: 찜 증가량)
+        lists: 쉼표 목록 컬럼 → 게임 수 기준 빈도 상위 TOP_VALUES개를 notes로
+        summary: 정수 컬럼 → 합계/평균/범위를 notes로
+        """
+        table = self.raw_data[key]['table']
+        if self.verbatim or table is None:
+            return self.rows(key, [], share=share)
+        # 게임명이 없는 행(비고 등)과 정렬 기준 값이 없는 행은 제외
+        records = [r for r in table.records() if r.get('url', True) and (not sort_by or r[sort_by] is not None)]
+        if sort_by:
+            records.sort(key=lambda r: r[sort_by])
+
+        notes = [f"(전체 {len(records)}개 게임 기준 요약)"]
+        for name in summary:
+            values = [r[name] for r in records if r[name] is not None]
+            if values:
+                notes.append(f"- {column_label(key, name)}: 합계 {sum(values):,}, 평균 {sum(values) / len(values):,.1f}, "
+                             f"범위 {min(values):,}~{max(values):,}")
+        for name in lists:
+            counts = Counter()
+            for r in records:
+                counts.update(list(dict.fromkeys(split_list(r[name]))))
+            top = ', '.join(f"{value}({n})" for value, n in counts.most_common(TOP_VALUES))
+            notes.append(f"- {column_label(key, name)} 상위 (게임 수): {top or '없음'}")
+
+        derived = derived or {}
+        shaped = []
+        for r in records:
+            row = {c: extract_game_name(r[c]) if c == 'url' else r[c] for c in columns}
+            row.update({label: fn(r) for label, fn in derived.items()})
+            shaped.append(row)
+        keys = list(columns) + list(derived)
+        labels = {c: column_label(key, c) for c in columns}
+        return self.rows(key, shaped, columns=keys, labels=labels, notes=notes, limit=limit, share=share)
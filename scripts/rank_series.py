@@ -0,0 +1,147 @@
+"""
+차트 순위 시계열
+================
+3종 차트 기록을 게임 × 차트 × 날짜 순위 행렬(빈 칸 = 차트 밖)로 펼쳐 놓고,
+(게임, 차트) 행마다 기록이 있는 칸만 훑어 추세 지표를 계산합니다 (긴 기간도 기록 수에 비례).
+05_demo_chart.csv의 consecutive_days와 07_trending_upcoming.csv의 trend_direction은
+Gemini에게 맡기지 않고 여기서 계산합니다.
+
+    matrix = RankMatrix(index.entries())      # [(게임, 차트, 날짜, 순위)]
+    matrix.series('PIONER', '인기 체험판')     # [None, 3, 1, 2, None, ...] (날짜 순)
+    matrix.metrics('인기 체험판')['PIONER']
+    # {'days_on_chart': 5, 'first_date': '2025-06-10', 'last_date': '2025-06-16', 'consecutive_days': 3,
+    #  'current_streak': 0, 'avg_rank': 2.4, 'velocity': 0.33, 'momentum': -4.2, 'volatility': 1.1,
+    #  'trend_direction': '하락'}
+
+- 날짜 축은 기록의 첫날부터 마지막 날까지 빠짐없이 이어지므로, 기록이 없는 날은 연속이 끊긴 것으로 봅니다
+- "마지막 날"은 차트마다 따로 봅니다 (먼저 기록이 끝난 차트의 게임이 다른 차트 기간 때문에 하락으로 보이지 않도록)
+- 행렬은 array('H') 하나(칸마다 2바이트)라서 수백 개 게임 × 수십 일 × 3종 차트도 수백 KB입니다
+- 점수 = (최하위 순위 + 1 - 순위), 차트 밖이면 0 → 차트에서 빠지는 것도 하락으로 계산
+
+지표:
+    consecutive_days   가장 긴 연속 진입 일수
+    current_streak     그 차트의 마지막 기록 날까지 이어지는 연속 진입 일수
+    velocity           첫 진입 → 마지막 진입 사이 하루 평균 순위 상승 (양수 = 상승)
+    momentum           첫 진입일 ~ 그 차트의 마지막 기록 날을 반으로 나눠 (뒤 절반 평균 점수 - 앞 절반 평균 점수)
+    volatility         이어진 이틀 사이 순위 변화의 표준편차
+    trend_direction    momentum이 TREND_THRESHOLD 이상이면 상승, -TREND_THRESHOLD 이하면 하락, 그 사이는 유지
+"""
+
+from array import array
+from datetime import timedelta
+from statistics import fmean, pstdev
+
+ABSENT = 0
+UNRANKED = 0xFFFF          # 차트에 있었지만 순위가 비어 있는 기록
+TREND_THRESHOLD = 1.0      # 평균 점수 1 = 평균 1계단
+
+
+class RankMatrix:
+    """(게임, 차트, 날짜) → 순위 밀집 행렬"""
+
+    def __init__(self, entries):
+        entries = [(game, chart_type, day, rank) for game, chart_type, day, rank in entries if day]
+        self.games = sorted({game for game, _, _, _ in entries})
+        self.chart_types = list(dict.fromkeys(chart_type for _, chart_type, _, _ in entries))
+        if entries:
+            first = min(day for _, _, day, _ in entries)
+            last = max(day for _, _, day, _ in entries)
+            self.days = [first + timedelta(days=i) for i in range((last - first).days + 1)]
+        else:
+            self.days = []
+        self.max_rank = max((rank for _, _, _, rank in entries if rank and rank > 0), default=0)
+
+        game_pos = {game: i for i, game in enumerate(self.games)}
+        chart_pos = {chart_type: i for i, chart_type in enumerate(self.chart_types)}
+        width = len(self.days)
+        self.data = array('H', bytes(2 * len(self.games) * len(self.chart_types) * width))
+        occupied = {}   # 행 시작 위치 → 기록이 있는 날짜 위치 (긴 기간에서 빈 칸을 훑지 않도록)
+        self.chart_last = [0] * len(self.chart_types)   # 차트별 마지막 기록 날짜 위치
+        for game, chart_type, day, rank in entries:
+            start = self._offset(game_pos[game], chart_pos[chart_type])
+            position = (day - self.days[0]).days
+            self.chart_last[chart_pos[chart_type]] = max(self.chart_last[chart_pos[chart_type]], position)
+            occupied.setdefault(start, set()).add(position)
+            cell = start + position
+            rank = min(rank, UNRANKED - 1) if rank and rank > 0 else UNRANKED
+            current = self.data[cell]
+            if current == ABSENT or current == UNRANKED or rank < current:
+                self.data[cell] = rank   # 같은 날 중복 기록은 더 높은 순위
+        self._game_pos = game_pos
+        self._chart_pos = chart_pos
+        self._occupied = {start: sorted(positions) for start, positions in occupied.items()}
+
+    def _offset(self, game_index, chart_index):
+        return (game_index * len(self.chart_types) + chart_index) * len(self.days)
+
+    def _row(self, game, chart_type):
+        if game not in self._game_pos or chart_type not in self._chart_pos:
+            return None
+        start = self._offset(self._game_pos[game], self._chart_pos[chart_type])
+        return self.data[start:start + len(self.days)]
+
+    def series(self, game, chart_type):
+        """날짜 순 순위 목록 (차트 밖 / 순위 없음은 None)"""
+        row = self._row(game, chart_type)
+        if row is None:
+            return [None] * len(self.days)
+        return [rank if rank not in (ABSENT, UNRANKED) else None for rank in row]
+
+    def metrics(self, chart_type):
+        """차트 하나의 {게임: 지표} (그 차트에 한 번이라도 들어온 게임만)"""
+        if chart_type not in self._chart_pos:
+            return {}
+        chart_index = self._chart_pos[chart_type]
+        results = {}
+        for game_index, game in enumerate(self.games):
+            start = self._offset(game_index, chart_index)
+            if start in self._occupied:
+                results[game] = self._row_metrics(start, self._occupied[start], self.chart_last[chart_index])
+        return results
+
+    def _row_metrics(self, start, present, last):
+        """행 하나의 지표 (present: 기록이 있는 날짜 위치, 오름차순, last: 그 차트의 마지막 기록 날짜 위치)"""
+        ranked = [(i, self.data[start + i]) for i in present if self.data[start + i] != UNRANKED]
+
+        longest = run = 0
+        previous = None
+        for i in present:
+            run = run + 1 if previous == i - 1 else 1
+            longest = max(longest, run)
+            previous = i
+        current = run if present[-1] == last else 0
+
+        velocity = 0.0
+        if len(ranked) >= 2 and ranked[-1][0] > ranked[0][0]:
+            velocity = (ranked[0][1] - ranked[-1][1]) / (ranked[-1][0] - ranked[0][0])
+
+        # 첫 진입일부터 그 차트의 마지막 기록 날까지를 반으로 나눈 앞/뒤 구간의 평균 점수 (차트 밖 0)
+        top = self.max_rank + 1
+        half = (last + 1 - present[0]) // 2
+        momentum = 0.0
+        if half:
+            early = sum(top - rank for i, rank in ranked if i < present[0] + half)
+            late = sum(top - rank for i, rank in ranked if i >= last + 1 - half)
+            momentum = (late - early) / half
+
+        changes = [b - a for (day_a, a), (day_b, b) in zip(ranked, ranked[1:]) if day_b == day_a + 1]
+        volatility = pstdev(changes) if len(changes) >= 2 else 0.0
+
+        if momentum >= TREND_THRESHOLD:
+            trend = '상승'
+        elif momentum <= -TREND_THRESHOLD:
+            trend = '하락'
+        else:
+            trend = '유지'
+        return {
+            'days_on_chart': len(present),
+            'first_date': self.days[present[0]].isoformat(),
+            'last_date': self.days[present[-1]].isoformat(),
+            'consecutive_days': longest,
+            'current_streak': current,
+            'avg_rank': round(fmean(rank for _, rank in ranked), 2) if ranked else '',
+            'velocity': round(velocity, 2),
+            'momentum': round(momentum, 2),
+            'volatility': round(volatility, 2),
+            'trend_direction': trend,
+        }
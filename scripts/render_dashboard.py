@@ -0,0 +1,608 @@
+"""
+대시보드 사전 렌더링
+====================
+생성된 섹션 CSV로 dashboard.html의 표, KPI 카드, 전략 카드, 인사이트를 미리 채워 넣습니다.
+브라우저가 CSV를 받아 update* 함수로 innerHTML을 다시 그릴 때까지 "로딩 중..." 자리표시가
+보이던 문제가 사라지고, 첫 화면부터 최신 데이터가 표시됩니다.
+
+    render_* 함수 = dashboard.html의 update* 함수를 그대로 옮긴 것 (같은 마크업을 만듦)
+
+렌더링한 페이지는 PRERENDERED_AT 상수에 시각이 기록되며, 이 경우 페이지 로드 시 GitHub 데이터를
+다시 받지 않습니다. 사이드바의 "🔄 최신 데이터" 버튼이나 주소 뒤 ?live 로 실시간 로딩을 할 수 있습니다.
+그래프 시리즈(chart_series.py)는 CHART_SERIES 상수에 넣어, 탭을 처음 열 때 그 값으로 그래프를 그립니다.
+같은 파일을 다시 렌더링하면 id로 찾은 영역만 교체되므로 몇 번이고 실행해도 됩니다.
+
+사용법:
+    python render_dashboard.py                         # generate_insights.py / build_bundle.py 실행 후
+    python render_dashboard.py --output ../tmp/dashboard.html
+"""
+
+import argparse
+import html
+import json
+import re
+from datetime import datetime
+from html.parser import HTMLParser
+from pathlib import Path
+
+from build_bundle import DASHBOARD_PATH, GITHUB_DATA_DIR, collect_files
+from chart_series import build_series
+
+# dashboard.html에서 갱신할 줄: const PRERENDERED_AT = '2025-06-17 18:02';
+PRERENDERED_PATTERN = re.compile(r"(const PRERENDERED_AT = ')[^']*(';)")
+# 한 줄짜리 JSON: const CHART_SERIES = {...};
+SERIES_PATTERN = re.compile(r"(const CHART_SERIES = ).*?(;)$", re.MULTILINE)
+
+VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+
+
+# ============================================
+# HTML 영역 찾기
+# ============================================
+class Element:
+    """시작 태그/내용의 위치 (문자 오프셋)"""
+
+    __slots__ = ("tag", "id", "classes", "parent", "start", "inner_start", "inner_end")
+
+    def __init__(self, tag, attrs, parent, start, inner_start):
+        attrs = dict(attrs)
+        self.tag = tag
+        self.id = attrs.get("id")
+        self.classes = set((attrs.get("class") or "").split())
+        self.parent = parent
+        self.start = start
+        self.inner_start = inner_start
+        self.inner_end = None
+
+    def matches(self, token):
+        if token.startswith("#"):
+            return self.id == token[1:]
+        if token.startswith("."):
+            return token[1:] in self.classes
+        return self.tag == token
+
+
+class _Locator(HTMLParser):
+    """태그 위치만 기록하는 파서 (script/style 내용은 건너뜀)"""
+
+    def __init__(self, text):
+        super().__init__(convert_charrefs=False)
+        self.line_offsets = [0]
+        for line in text.splitlines(keepends=True):
+            self.line_offsets.append(self.line_offsets[-1] + len(line))
+        self.elements = []
+        self.stack = []
+        self.feed(text)
+        self.close()
+
+    def _offset(self):
+        line, column = self.getpos()
+        return self.line_offsets[line - 1] + column
+
+    def handle_starttag(self, tag, attrs):
+        start = self._offset()
+        element = Element(tag, attrs, self.stack[-1] if self.stack else None,
+                          start, start + len(self.get_starttag_text()))
+        self.elements.append(element)
+        if tag not in VOID_TAGS:
+            self.stack.append(element)
+
+    def handle_startendtag(self, tag, attrs):
+        start = self._offset()
+        self.elements.append(Element(tag, attrs, self.stack[-1] if self.stack else None,
+                                     start, start + len(self.get_starttag_text())))
+
+    def handle_endtag(self, tag):
+        # 닫는 태그와 짝이 맞는 요소까지 꺼냄 (짝 없는 닫는 태그는 무시)
+        for i in range(len(self.stack) - 1, -1, -1):
+            if self.stack[i].tag == tag:
+                self.stack[i].inner_end = self._offset()
+                del self.stack[i:]
+                return
+
+
+class Page:
+    """dashboard.html 편집기 (DOM 대신 문자열 위치로 교체)
+
+    선택자는 '#id', '.class', 'tag'를 공백(자손)으로 이은 것만 지원하며, 첫 번째 일치 요소를 씁니다.
+    찾지 못한 요소는 update* 함수처럼 조용히 건너뜁니다.
+    """
+
+    def __init__(self, text):
+        self.text = text
+        self.elements = _Locator(text).elements
+        self.by_id = {}
+        for element in self.elements:
+            if element.id and element.id not in self.by_id:
+                self.by_id[element.id] = element
+        self.patches = {}   # (시작, 끝) → 새 문자열
+
+    def find(self, selector):
+        tokens = selector.split()
+        if len(tokens) == 1 and tokens[0].startswith("#"):
+            return self.by_id.get(tokens[0][1:])
+        for element in self.elements:
+            if not element.matches(tokens[-1]):
+                continue
+            remaining = tokens[:-1]
+            ancestor = element.parent
+            while remaining and ancestor is not None:
+                if ancestor.matches(remaining[-1]):
+                    remaining = remaining[:-1]
+                ancestor = ancestor.parent
+            if not remaining:
+                return element
+        return None
+
+    def set_html(self, selector, markup):
+        """element.innerHTML = markup"""
+        element = self.find(selector)
+        if element is not None and element.inner_end is not None:
+            self.patches[(element.inner_start, element.inner_end)] = markup
+
+    def set_text(self, selector, text):
+        """element.textContent = text"""
+        self.set_html(selector, html.escape(str(text), quote=False))
+
+    def set_style(self, selector, prop, value):
+        """element.style[prop] = value (시작 태그의 style 속성 수정)"""
+        element = self.find(selector)
+        if element is None:
+            return
+        key = (element.start, element.inner_start)
+        tag = self.patches.get(key, self.text[element.start:element.inner_start])
+        declaration = f"{prop}: {html.escape(str(value))};"
+        match = re.search(r'\sstyle="([^"]*)"', tag)
+        if match:
+            rules = [r.strip() for r in match.group(1).split(";")
+                     if r.strip() and r.split(":", 1)[0].strip() != prop]
+            style = " ".join([f"{r};" for r in rules] + [declaration])
+            tag = tag[:match.start(1)] + style + tag[match.end(1):]
+        else:
+            tag = re.sub(r"\s*(/?>)$", lambda m: f' style="{declaration}"{m.group(1)}', tag, count=1)
+        self.patches[key] = tag
+
+    def render(self):
+        """모든 교체를 적용한 HTML (겹치는 교체가 있으면 ValueError)"""
+        text = self.text
+        last_start = len(text)
+        for (start, end), replacement in sorted(self.patches.items(), reverse=True):
+            if end > last_start:
+                raise ValueError(f"겹치는 교체 영역: {start}~{end}")
+            text = text[:start] + replacement + text[end:]
+            last_start = start
+        return text
+
+
+# ============================================
+# update* 함수와 같은 값 포맷
+# ============================================
+def parse_int(value):
+    """JS parseInt (앞쪽 정수만 읽음, 실패 시 None)"""
+    match = re.match(r"\s*([+-]?\d+)", str(value or ""))
+    return int(match.group(1)) if match else None
+
+
+def format_number(value):
+    """formatNumber: 천 단위 콤마"""
+    if not value or value == "-":
+        return "-"
+    n = parse_int(re.sub(r"[^0-9-]", "", str(value)))
+    return value if n is None else f"{n:,}"
+
+
+def _items(text):
+    return "".join(f"<li>• {item}</li>" for item in text.split("|")) if text else ""
+
+
+# ============================================
+# 01_executive
+# ============================================
+def render_strategies(page, data):
+    page.set_html("#executive .bg-slate-50 .grid", "".join(f"""
+                    <div class="bg-white p-4 rounded-xl border border-slate-200 shadow-sm">
+                        <h5 class="font-bold text-[#003380] mb-2 flex items-center gap-2">
+                            <span>{row.get('icon', '')}</span> {row.get('title', '')}
+                        </h5>
+                        <ul class="text-sm text-slate-500 space-y-1">
+                            {_items(row.get('details'))}
+                        </ul>
+                    </div>
+                """ for row in data))
+
+
+def render_exec_kpi(page, data):
+    for i, row in enumerate(data):
+        page.set_text(f"#kpi-value-{i}", row.get('value', ''))
+        page.set_text(f"#kpi-label-{i}", row.get('label', ''))
+        page.set_text(f"#kpi-change-{i}", row.get('sublabel') or '')
+
+
+def render_exec_insights(page, data):
+    page.set_html("#exec-insights-container", "".join(f"""
+                <div class="bg-white p-5 rounded-2xl border-l-4 hover:bg-slate-50 transition-all shadow-sm" style="border-color: {row.get('border_color') or '#0047AB'}">
+                    <div class="flex items-start gap-3">
+                        <span class="text-2xl">{row.get('icon', '')}</span>
+                        <div>
+                            <h4 class="font-semibold mb-1">{row.get('title', '')}</h4>
+                            <p class="text-sm text-slate-500">{row.get('description', '')}</p>
+                        </div>
+                    </div>
+                </div>
+            """ for row in data))
+
+
+def render_top5_games(page, data):
+    for i, row in enumerate(data[:5]):
+        page.set_text(f"#top5-name-{i}", row.get('name', ''))
+        page.set_text(f"#top5-genre-{i}", row.get('genre', ''))
+        increase = parse_int(row.get('wishlist_increase')) or 0
+        page.set_text(f"#top5-wishlist-{i}", f"+{int(increase / 1000 + 0.5)}K" if increase > 1000 else f"+{increase}")
+
+
+def render_chart_summary(page, data):
+    for i, row in enumerate(data):
+        page.set_text(f"#chart-summary-value-{i}", row.get('value', ''))
+        page.set_text(f"#chart-summary-label-{i}", row.get('label', ''))
+        page.set_text(f"#chart-summary-sub-{i}", row.get('description') or '')
+
+
+def render_genre_distribution(page, data):
+    page.set_html("#genre-bars-container", "".join(f"""
+                    <div class="genre-bar-item">
+                        <div class="flex justify-between items-center mb-1">
+                            <span class="text-sm font-medium text-slate-700">{row.get('icon', '')} {row.get('genre', '')}</span>
+                            <span class="text-sm font-semibold" style="color: {row.get('color', '')}">{row.get('percentage', '')}</span>
+                        </div>
+                        <div class="w-full bg-slate-200 rounded-full h-3 overflow-hidden">
+                            <div class="h-full rounded-full transition-all duration-1000" style="width: {parse_int(row.get('percentage')) or 0}%; background-color: {row.get('color', '')}"></div>
+                        </div>
+                    </div>
+                """ for row in data))
+
+
+def render_snf_guide(page, data):
+    page.set_html("#snf-guide-container", "".join(f"""
+                <div class="flex items-center gap-4 p-4 bg-white rounded-2xl border border-slate-200 hover:border-blue-400 transition-all shadow-sm">
+                    <div class="w-10 h-10 bg-blue-100 rounded-xl flex items-center justify-center flex-shrink-0">
+                        <span class="text-xl">{row.get('icon', '')}</span>
+                    </div>
+                    <div class="flex-1">
+                        <p class="text-base font-semibold text-slate-800">{row.get('title', '')}</p>
+                        <p class="text-sm text-slate-500">{row.get('description', '')}</p>
+                    </div>
+                    <span class="text-emerald-500 text-lg">{'✓' if row.get('status') == 'ready' else ''}</span>
+                </div>
+            """ for row in data))
+
+
+# ============================================
+# 02_top_games
+# ============================================
+def render_top_games_kpi(page, data):
+    for i, row in enumerate(data):
+        page.set_text(f"#topgames-kpi-value-{i}", row.get('value', ''))
+        page.set_text(f"#topgames-kpi-label-{i}", row.get('label', ''))
+        page.set_text(f"#topgames-kpi-sub-{i}", row.get('sublabel') or row.get('highlight') or '')
+
+
+def _findings(data):
+    return "".join(f"""
+                <div class="bg-[#F8FAFC] p-4 rounded-xl border border-[#E2E8F0]">
+                    <h4 class="font-bold text-[#0047AB] mb-2">{row.get('title', '')}</h4>
+                    <p class="text-sm text-[#64748B] leading-relaxed">{row.get('description', '')}</p>
+                </div>
+            """ for row in data)
+
+
+def render_top_games_findings(page, data):
+    page.set_html("#topgames-findings-container", _findings(data))
+
+
+def render_top10_table(page, data):
+    rank_colors = ['text-[#0047AB]', 'text-[#94A3B8]', 'text-[#3B82F6]']
+    rows = []
+    for i, row in enumerate(data):
+        review_status = row.get('review_status') or ''
+        review_count = row.get('review_count')
+        rows.append(f"""
+                    <tr>
+                        <td class="text-center font-bold {rank_colors[i] if i < 3 else ''}">{row.get('rank', '')}</td>
+                        <td class="font-semibold">{row.get('name', '')}</td>
+                        <td>{row.get('genre', '')}</td>
+                        <td><span class="badge {'badge-positive' if '긍정' in review_status else 'badge-neutral'}">{review_status or '-'}</span></td>
+                        <td class="text-right">{format_number(review_count) if review_count and review_count != '0' else '-'}</td>
+                        <td class="text-right text-[#0047AB]">{'+' + format_number(row['wishlist_increase']) if row.get('wishlist_increase') else '-'}</td>
+                        <td class="text-right font-semibold">{row.get('wishlist_percent') or '-'}</td>
+                        <td class="text-center">{row.get('top_language') or '-'}</td>
+                    </tr>
+                """)
+    page.set_html("#top10-tbody", "".join(rows))
+
+
+def render_top10_insight(page, data):
+    row = next((r for r in data if r.get('tab_id') == 'top10'), data[0])
+    page.set_text("#top10-insight-content", row.get('content', ''))
+
+
+def render_top50_insight(page, data):
+    row = next((r for r in data if r.get('tab_id') == 'top50'), data[1] if len(data) > 1 else None)
+    if row:
+        page.set_text("#top50-insight-content", row.get('content', ''))
+
+
+def render_top50_summary(page, data):
+    for i, row in enumerate(data):
+        page.set_text(f"#top50-summary-title-{i}", row.get('title', ''))
+        page.set_text(f"#top50-summary-value-{i}", row.get('value', ''))
+        page.set_text(f"#top50-summary-desc-{i}", row.get('description', ''))
+
+
+def render_top50_table(page, data):
+    rank_colors = ['text-[#0047AB]', 'text-[#94A3B8]', 'text-[#3B82F6]']
+    rows = []
+    for i, row in enumerate(data[:15]):
+        has_demo = row.get('demo_available') in ('가능', 'Y', '✓')
+        rows.append(f"""
+                    <tr>
+                        <td class="text-center {'font-bold' if i < 3 else ''} {rank_colors[i] if i < 3 else 'text-[#94A3B8]'}">{row.get('rank', '')}</td>
+                        <td class="font-semibold">{row.get('name') or '-'}</td>
+                        <td>{row.get('genre') or '-'}</td>
+                        <td class="text-center"><span class="badge {'badge-positive' if has_demo else 'badge-neutral'}">{'✓' if has_demo else '✗'}</span></td>
+                        <td class="text-center">{row.get('play_type') or '-'}</td>
+                        <td>{row.get('release_date') or '-'}</td>
+                        <td class="text-center {'font-semibold' if i < 3 else ''}">{row.get('chart_count') or '-'}</td>
+                    </tr>
+                """)
+    page.set_html("#top50-tbody", "".join(rows) + '<tr><td colspan="7" class="text-center text-[#94A3B8] text-sm py-2">'
+                  '... 16~50위 게임 생략 (총 50개 게임 데이터 보유) ...</td></tr>')
+
+
+# ============================================
+# 03_charts
+# ============================================
+def render_chart_insights(page, data):
+    for row in data:
+        page.set_text(f"#chart-insight-{row.get('chart_type')}-content", row.get('content', ''))
+
+
+def render_snf_strategy(page, data):
+    for i, row in enumerate(data):
+        page.set_text(f"#snf-strategy-title-{i}", f"{row.get('icon', '')} {row.get('title', '')}")
+        page.set_style(f"#snf-strategy-title-{i}", "color", row.get('color') or '#0047AB')
+        if row.get('details'):
+            page.set_html(f"#snf-strategy-list-{i}", _items(row['details']))
+
+
+def render_charts_kpi(page, data):
+    for i, row in enumerate(data):
+        # Champion 게임 (index 1)은 게임 이름과 태그를 표시
+        if i == 1 and row.get('game_name'):
+            page.set_text(f"#charts-kpi-value-{i}", row['game_name'])
+            page.set_text(f"#charts-kpi-sub-{i}", row.get('value', ''))
+            page.set_text(f"#charts-kpi-label-{i}", row.get('label', ''))
+            if row.get('tags'):
+                page.set_html(f"#charts-kpi-tags-{i}", "".join(
+                    f'<span class="text-xs px-2 py-1 bg-[#10B981]/20 text-[#10B981] rounded">{tag}</span>'
+                    for tag in row['tags'].split('|')))
+        else:
+            page.set_text(f"#charts-kpi-value-{i}", row.get('value', ''))
+            page.set_text(f"#charts-kpi-label-{i}", row.get('label', ''))
+            page.set_text(f"#charts-kpi-sub-{i}", row.get('description') or '')
+
+
+def render_charts_findings(page, data):
+    page.set_html("#charts-findings-container", _findings(data))
+
+
+def _top3(i):
+    return 'text-[#0047AB]' if i < 3 else ''
+
+
+def render_demo_table(page, data):
+    page.set_html("#demo-tbody", "".join(f"""
+                <tr>
+                    <td class="text-center font-bold {_top3(i)}">{row.get('rank', '')}</td>
+                    <td class="font-semibold">{row.get('name', '')}</td>
+                    <td class="text-right">{row.get('appearances') or row.get('chart_count') or '-'}</td>
+                    <td class="text-center">{row.get('best_rank') or '-'}</td>
+                    <td class="text-center">{row.get('consecutive_days') or '-'}</td>
+                </tr>
+            """ for i, row in enumerate(data)))
+
+
+def render_popular_upcoming_table(page, data):
+    page.set_html("#popular-upcoming-tbody", "".join(f"""
+                <tr>
+                    <td class="text-center font-bold {_top3(i)}">{row.get('rank', '')}</td>
+                    <td class="font-semibold">{row.get('name', '')}</td>
+                    <td class="text-right">{row.get('appearances') or row.get('chart_count') or '-'}</td>
+                    <td class="text-center">{row.get('best_rank') or '-'}</td>
+                </tr>
+            """ for i, row in enumerate(data)))
+
+
+TREND_STYLES = {'상승': ('📈', 'text-green-600'), '하락': ('📉', 'text-red-500'), '유지': ('➡️', 'text-blue-500')}
+
+
+def render_trending_upcoming_table(page, data):
+    rows = []
+    for i, row in enumerate(data):
+        icon, css = TREND_STYLES.get(row.get('trend_direction'), ('', 'text-slate-500'))
+        rows.append(f"""
+                    <tr>
+                        <td class="text-center font-bold {_top3(i)}">{row.get('rank', '')}</td>
+                        <td class="font-semibold">{row.get('name', '')}</td>
+                        <td class="text-center">{row.get('appearances') or '-'}</td>
+                        <td class="text-center">{row.get('best_rank') or '-'}</td>
+                        <td class="text-center {css}">{icon} {row.get('trend_direction') or '-'}</td>
+                    </tr>
+                """)
+    page.set_html("#trending-upcoming-tbody", "".join(rows))
+
+
+# ============================================
+# 04_report
+# ============================================
+def render_report_checklist(page, data):
+    page.set_html("#report-checklist-container", "".join(f"""
+                    <div class="bg-white p-4 rounded-xl border border-slate-200 shadow-sm">
+                        <h5 class="font-bold text-[#003380] mb-2 flex items-center gap-2">
+                            <span>{row.get('icon', '')}</span> {row.get('title', '')}
+                        </h5>
+                        <ul class="text-sm text-slate-500 space-y-1">
+                            {_items(row.get('detail_items'))}
+                        </ul>
+                    </div>
+                """ for row in data))
+
+
+def render_report_kpi(page, data):
+    for i, row in enumerate(data):
+        page.set_text(f"#report-kpi-value-{i}", row.get('value', ''))
+        page.set_text(f"#report-kpi-label-{i}", row.get('label', ''))
+        page.set_text(f"#report-kpi-sub-{i}", row.get('highlight') or '')
+
+
+def render_tags_analysis(page, data):
+    page.set_html("#tags-analysis-container", "".join(f"""
+                <div class="flex items-center justify-between p-3 bg-slate-50 rounded-xl">
+                    <span class="font-medium text-slate-700">{row.get('tag_name', '')}</span>
+                    <span class="text-[#0047AB] font-semibold">{row.get('percentage', '')}</span>
+                </div>
+            """ for row in data if row.get('analysis_type') == 'top_tags'))
+
+
+PRIORITY_BADGES = {'필수': 'bg-red-100 text-red-600', '권장': 'bg-blue-100 text-blue-600'}
+SUMMARY_STATS = {
+    'voice': ('voice-support-stat', 'TOP 10 중 <span class="text-[#0047AB] font-bold">{}</span>만 음성 제공'),
+    'interface_avg': ('interface-lang-stat', '평균 <span class="text-[#0047AB] font-bold">{}</span> 언어'),
+    'subtitle_avg': ('subtitle-lang-stat', '평균 <span class="text-[#0047AB] font-bold">{}</span> 언어'),
+}
+
+
+def render_language_support(page, data):
+    interface = [row for row in data if row.get('support_type') == 'interface']
+    page.set_html("#language-support-container", "".join(f"""
+                    <div class="flex items-center justify-between p-3 bg-slate-50 rounded-xl">
+                        <div class="flex items-center gap-2">
+                            <span class="font-medium text-slate-700">{row.get('language', '')}</span>
+                            <span class="text-xs px-2 py-0.5 rounded {PRIORITY_BADGES.get(row.get('priority'), 'bg-slate-100 text-slate-500')}">{row.get('priority', '')}</span>
+                        </div>
+                        <span class="text-[#0047AB] font-semibold">{row.get('percentage', '')}</span>
+                    </div>
+                """ for row in interface))
+    # 필수 언어 5종
+    page.set_html("#essential-languages-list", "".join(f"""
+                    <li>• <span class="font-semibold text-[#1E293B]">{row.get('language', '')}</span> - {row.get('percentage', '')} ({row.get('note') or ''})</li>
+                """ for row in interface[:5]))
+    strategies = [row for row in data if row.get('support_type') == 'strategy']
+    if strategies:
+        page.set_html("#language-strategy-list", "".join(f"""
+                    <li>• {row.get('rank', '')}: {row.get('language', '')} ({row.get('game_count', '')}개){' - ' + row['note'] if row.get('note') else ''}</li>
+                """ for row in strategies))
+    for row in data:
+        if row.get('support_type') == 'summary' and row.get('rank') in SUMMARY_STATS:
+            element_id, template = SUMMARY_STATS[row['rank']]
+            page.set_html(f"#{element_id}", template.format(row.get('percentage', '')))
+
+
+def render_community(page, data):
+    page.set_html("#community-container", "".join(f"""
+                <div class="flex items-center justify-between p-3 bg-slate-50 rounded-xl">
+                    <div class="flex items-center gap-2">
+                        <span class="font-medium text-slate-700">{row.get('platform', '')}</span>
+                        <span class="text-xs px-2 py-0.5 rounded {'bg-red-100 text-red-600' if row.get('priority') == '필수' else 'bg-blue-100 text-blue-600'}">{row.get('priority', '')}</span>
+                    </div>
+                    <span class="text-[#0047AB] font-semibold">{row.get('usage_rate', '')}</span>
+                </div>
+            """ for row in data if row.get('analysis_type') == 'channel_usage'))
+
+
+def render_report_insights(page, data):
+    for row in data:
+        page.set_text(f"#report-insight-{row.get('tab_id')}-content", row.get('content', ''))
+
+
+# loadGitHubData()와 같은 순서 (CSV → render 함수)
+RENDERERS = [
+    ('01_executive/01_strategies.csv', render_strategies),
+    ('01_executive/02_kpi_cards.csv', render_exec_kpi),
+    ('01_executive/03_insights.csv', render_exec_insights),
+    ('01_executive/04_top5_games.csv', render_top5_games),
+    ('01_executive/05_chart_summary.csv', render_chart_summary),
+    ('01_executive/06_genre_distribution.csv', render_genre_distribution),
+    ('01_executive/07_snf_guide.csv', render_snf_guide),
+    ('02_top_games/01_kpi_cards.csv', render_top_games_kpi),
+    ('02_top_games/02_key_findings.csv', render_top_games_findings),
+    ('02_top_games/03_top10_table.csv', render_top10_table),
+    ('02_top_games/05_top50_table.csv', render_top50_table),
+    ('02_top_games/07_tab_insights.csv', render_top10_insight),
+    ('02_top_games/07_tab_insights.csv', render_top50_insight),
+    ('02_top_games/08_top50_summary.csv', render_top50_summary),
+    ('03_charts/01_kpi_cards.csv', render_charts_kpi),
+    ('03_charts/02_key_findings.csv', render_charts_findings),
+    ('03_charts/05_demo_chart.csv', render_demo_table),
+    ('03_charts/06_popular_upcoming.csv', render_popular_upcoming_table),
+    ('03_charts/07_trending_upcoming.csv', render_trending_upcoming_table),
+    ('03_charts/08_chart_insights.csv', render_chart_insights),
+    ('03_charts/09_snf_strategy.csv', render_snf_strategy),
+    ('04_report/01_checklist.csv', render_report_checklist),
+    ('04_report/02_kpi_cards.csv', render_report_kpi),
+    ('04_report/03_tags_analysis.csv', render_tags_analysis),
+    ('04_report/04_language_support.csv', render_language_support),
+    ('04_report/05_community.csv', render_community),
+    ('04_report/06_tab_insights.csv', render_report_insights),
+]
+
+
+def render_dashboard(template, files, rendered_at=None):
+    """dashboard.html 문자열 + {CSV 경로: 행 목록} → 사전 렌더링된 HTML
+
+    반환: (HTML, 렌더링한 CSV 경로 목록)
+    """
+    rendered_at = rendered_at or datetime.now().strftime('%Y-%m-%d %H:%M')
+    page = Page(template)
+    used = []
+    for filename, render in RENDERERS:
+        data = files.get(filename)
+        if not data:
+            continue
+        render(page, data)
+        if filename not in used:
+            used.append(filename)
+    page.set_text("#last-load-time", f"사전 렌더링: {rendered_at}")
+    text, count = PRERENDERED_PATTERN.subn(lambda m: f"{m.group(1)}{rendered_at}{m.group(2)}", page.render())
+    if count == 0:
+        raise ValueError("dashboard.html에서 PRERENDERED_AT 상수를 찾지 못했습니다.")
+    series = json.dumps(build_series(files), ensure_ascii=False, separators=(',', ':')).replace('</', '<\\/')
+    text, count = SERIES_PATTERN.subn(lambda m: f"{m.group(1)}{series}{m.group(2)}", text)
+    if count == 0:
+        raise ValueError("dashboard.html에서 CHART_SERIES 상수를 찾지 못했습니다.")
+    return text, used
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="SNF 대시보드 사전 렌더링")
+    parser.add_argument("--data-dir", type=Path, default=GITHUB_DATA_DIR, help="섹션 CSV가 있는 폴더")
+    parser.add_argument("--template", type=Path, default=DASHBOARD_PATH, help="원본 dashboard.html")
+    parser.add_argument("--output", type=Path, help="저장 위치 (기본: --template 파일을 덮어씀)")
+    args = parser.parse_args(argv)
+
+    files = collect_files(args.data_dir)
+    if not files:
+        print(f"❌ {args.data_dir}에 섹션 CSV가 없습니다.")
+        return 1
+    text, used = render_dashboard(args.template.read_text(encoding='utf-8'), files)
+    output = args.output or args.template
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(text, encoding='utf-8')
+    print(f"🖼️ {len(used)}개 CSV로 사전 렌더링 → {output}")
+    missing = sorted({name for name, _ in RENDERERS} - set(used))
+    if missing:
+        print(f"   ⚠️ 데이터 없음 (자리표시 유지): {', '.join(missing)}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
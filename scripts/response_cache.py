@@ -0,0 +1,113 @@
+"""
+Gemini 응답 캐시
+================
+(모델명, 프롬프트) 해시를 키로 응답 텍스트를 디스크에 저장합니다.
+원본 CSV나 프롬프트가 바뀌지 않았다면 같은 키가 나오므로 API를 다시 부르지 않습니다.
+
+    scripts/.cache/responses/ab/ab12...ef.json
+
+max_age_days 동안 사용되지 않은 항목은 삭제하고, 전체 크기가 max_bytes를 넘으면
+가장 오래 사용되지 않은 항목부터 지웁니다.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+DEFAULT_MAX_AGE_DAYS = 30
+DEFAULT_MAX_MB = 50
+
+
+def cache_key(model, prompt):
+    """(모델명, 프롬프트)의 SHA-256 해시"""
+    digest = hashlib.sha256()
+    digest.update(model.encode('utf-8'))
+    digest.update(b'\0')
+    digest.update(prompt.encode('utf-8'))
+    return digest.hexdigest()
+
+
+def prompt_key(prompt, config=None):
+    """캐시 키로 쓰는 프롬프트 (응답 스키마 등 설정이 다르면 다른 응답이므로 포함)"""
+    return prompt + ("\0" + json.dumps(config, sort_keys=True) if config else "")
+
+
+class ResponseCache:
+    """내용 주소 기반 응답 캐시 (여러 스레드에서 동시에 사용 가능)"""
+
+    def __init__(self, cache_dir, max_age_days=DEFAULT_MAX_AGE_DAYS, max_bytes=DEFAULT_MAX_MB * 1024 * 1024):
+        self.cache_dir = Path(cache_dir)
+        self.max_age = max_age_days * 86400 if max_age_days else None
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key):
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _entries(self):
+        if not self.cache_dir.exists():
+            return []
+        return list(self.cache_dir.glob("*/*.json"))
+
+    def __len__(self):
+        return len(self._entries())
+
+    def get(self, model, prompt):
+        """캐시된 응답 텍스트 (없거나 만료되면 None)"""
+        path = self._path(cache_key(model, prompt))
+        try:
+            if self.max_age and time.time() - path.stat().st_mtime > self.max_age:
+                path.unlink(missing_ok=True)
+                raise FileNotFoundError(path)
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        # 최근 사용 시각 갱신 (크기 초과 시 정리 순서에 사용)
+        os.utime(path, None)
+        self.hits += 1
+        return entry['response']
+
+    def put(self, model, prompt, response):
+        """응답 저장 (임시 파일에 쓴 뒤 교체하므로 중간에 끊겨도 깨지지 않음)"""
+        key = cache_key(model, prompt)
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        entry = {'model': model, 'created': time.time(), 'response': response}
+        tmp_path = path.with_suffix(f".{os.getpid()}.{id(entry)}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def discard(self, model, prompt):
+        """항목 삭제 (검사에 실패한 응답을 다음 실행에서 다시 쓰지 않도록)"""
+        self._path(cache_key(model, prompt)).unlink(missing_ok=True)
+
+    def evict(self):
+        """만료 항목과 크기 한도 초과분 삭제, 삭제한 개수 반환"""
+        now = time.time()
+        removed = 0
+        alive = []
+        for path in self._entries():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:   # 다른 실행이 먼저 지운 항목
+                continue
+            if self.max_age and now - stat.st_mtime > self.max_age:
+                path.unlink(missing_ok=True)
+                removed += 1
+            else:
+                alive.append((stat.st_mtime, stat.st_size, path))
+        if self.max_bytes:
+            total = sum(size for _, size, _ in alive)
+            for _, size, path in sorted(alive):
+                if total <= self.max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+                removed += 1
+        return removed
@@ -0,0 +1,101 @@
+"""
+실행 일지 (--resume)
+===================
+generate_insights.py가 출력 CSV 하나를 끝낼 때마다 그 결과와 응답을 출력 폴더의 .run_journal.jsonl에
+한 줄씩 바로 기록합니다 (쓸 때마다 fsync). 실행이 중간에 멈춰도 (세 번째 429, Ctrl+C, 네트워크 오류)
+--resume으로 다시 실행하면 끝난 작업은 건너뛰고 실패한 프롬프트부터 이어 갑니다.
+
+    {"event": "start", "run": "20250617-101500", "started": "...", "model": "gemini-2.0-flash"}
+    {"event": "done", "output": "01_executive/01_strategies.csv", "key": "<cache_key>", "response": "..."}
+    {"event": "failed", "output": "03_charts/02_key_findings.csv", "key": "...", "error": "429 RESOURCE_EXHAUSTED"}
+    {"event": "resume", ...}
+    {"event": "finish", "status": "ok"}
+
+key는 (모델, 프롬프트) 해시라서 원본이나 프롬프트가 바뀐 작업은 완료로 보지 않고 다시 생성합니다.
+완료된 작업의 출력 파일이 지워졌다면 일지에 남은 응답으로 다시 저장하므로 API를 부르지 않습니다.
+--resume 없이 실행하면 일지를 새로 시작합니다.
+모델 응답 전문이 들어 있으므로 .gitignore로 커밋에서 제외합니다 (출력 폴더가 github_data/여도 git add .에 포함되지 않음).
+"""
+
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+
+JOURNAL_NAME = ".run_journal.jsonl"
+
+
+class RunJournal:
+    """출력 폴더 하나의 실행 일지"""
+
+    def __init__(self, output_dir, resume=False, model=None):
+        self.path = Path(output_dir) / JOURNAL_NAME
+        self.lock = threading.Lock()
+        self.done = {}        # output → key
+        self.responses = {}   # key → 응답 텍스트
+        self.failed = {}      # output → 오류 메시지
+        self.finished = None
+        if resume:
+            self._load()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if not resume or not self.path.exists():
+            self.path.write_text("", encoding='utf-8')
+        event = "resume" if resume else "start"
+        self._append({'event': event, 'run': datetime.now().strftime("%Y%m%d-%H%M%S"),
+                      'started': datetime.now().strftime("%Y-%m-%d %H:%M:%S"), 'model': model})
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return
+        for line in lines:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue   # 기록 도중 끊긴 마지막 줄
+            event = entry.get('event')
+            if event == 'done':
+                self.done[entry['output']] = entry['key']
+                self.responses[entry['key']] = entry['response']
+                self.failed.pop(entry['output'], None)
+            elif event == 'failed':
+                self.failed[entry['output']] = entry['error']
+            elif event == 'finish':
+                self.finished = entry.get('status')
+            elif event == 'resume':
+                self.finished = None
+
+    def _append(self, entry):
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        with self.lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def is_done(self, output, key):
+        """이전 실행에서 같은 프롬프트로 끝낸 작업인지"""
+        return self.done.get(output) == key
+
+    def response(self, key):
+        return self.responses.get(key)
+
+    def record_done(self, output, key, response):
+        with self.lock:
+            self.done[output] = key
+            self.failed.pop(output, None)
+            if response is not None:
+                self.responses[key] = response
+        self._append({'event': 'done', 'output': output, 'key': key, 'response': response})
+
+    def record_failed(self, output, key, error):
+        with self.lock:
+            self.failed[output] = str(error)
+        self._append({'event': 'failed', 'output': output, 'key': key, 'error': str(error)[:500]})
+
+    def finish(self, status):
+        self.finished = status
+        self._append({'event': 'finish', 'status': status})
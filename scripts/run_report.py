@@ -0,0 +1,228 @@
+"""
+실행 시간 / 토큰 기록
+=====================
+generate_insights.py 실행 중 각 단계를 구간(span)으로 재서, 시간과 할당량이 어디에 쓰였는지 남깁니다.
+
+    load          원본 CSV 로드
+    prompts       섹션별 프롬프트 작성 (원본 요약 포함)
+    job           출력 CSV 하나 (아래 구간들을 포함)
+    rate_wait     RPM/TPM 리미터 대기
+    call          LLM 호출 1회 (시도마다 하나, 입력/출력 토큰 포함)
+    backoff       429 후 재시도 대기
+    sleep         --sequential 모드의 API_DELAY / SECTION_DELAY 고정 대기
+    parse         응답 파싱 + 스키마 검사
+    save          로컬 계산 병합 + save_csv
+    cross_check   수치 교차 검증
+
+결과는 출력 폴더의 .run_report.json (구간 전체, .gitignore로 커밋 제외)과 RUN_HISTORY (실행마다 요약 한 줄)에 저장합니다.
+토큰 수는 백엔드가 알려준 값(Gemini usage_metadata 등)을 쓰고, 모르면 글자 수로 추정해 따로 표시합니다.
+동시 실행 모드에서는 여러 스레드의 구간이 겹치므로 단계별 합계가 전체 실행 시간보다 클 수 있습니다.
+
+사용법:
+    python run_report.py                          # 최근 실행 요약 (RUN_HISTORY)
+    python run_report.py ../github_data/.run_report.json   # 한 실행의 단계별 표
+"""
+
+import argparse
+import itertools
+import json
+import threading
+import time
+import unicodedata
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+REPORT_NAME = ".run_report.json"
+RUN_HISTORY = SCRIPT_DIR / ".cache" / "run_history.jsonl"
+SLOWEST_JOBS = 5
+
+
+class Tracer:
+    """스레드별 중첩을 기억하는 구간 기록기 (enabled=False면 아무것도 기록하지 않음)"""
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.started_at = datetime.now()
+        self.origin = time.perf_counter()
+        self.spans = []
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.ids = itertools.count(1)
+
+    def _stack(self):
+        if not hasattr(self.local, 'stack'):
+            self.local.stack = []
+        return self.local.stack
+
+    @contextmanager
+    def span(self, name, **attrs):
+        """with 블록 하나를 구간으로 기록 (블록 안에서 yield된 attrs에 값을 더 넣을 수 있음)"""
+        if not self.enabled:
+            yield attrs
+            return
+        stack = self._stack()
+        parent = stack[-1] if stack else None
+        span_id = next(self.ids)
+        start = time.perf_counter()
+        stack.append(span_id)
+        try:
+            yield attrs
+        finally:
+            stack.pop()
+            self._append(span_id, name, start, time.perf_counter() - start, attrs, parent)
+
+    def add(self, name, seconds, **attrs):
+        """이미 끝난 구간 기록 (예: 직접 잰 sleep)"""
+        if self.enabled:
+            stack = self._stack()
+            self._append(next(self.ids), name, time.perf_counter() - seconds, seconds, attrs,
+                         stack[-1] if stack else None)
+
+    def _append(self, span_id, name, start, seconds, attrs, parent):
+        record = {
+            'name': name,
+            'start': round(start - self.origin, 4),
+            'seconds': round(seconds, 4),
+            'thread': threading.current_thread().name,
+            'id': span_id,
+            'parent': parent,
+        }
+        record.update(attrs)
+        with self.lock:
+            self.spans.append(record)
+
+    def elapsed(self):
+        return time.perf_counter() - self.origin
+
+    def report(self, **meta):
+        """JSON으로 저장할 실행 기록"""
+        with self.lock:
+            spans = sorted(self.spans, key=lambda s: s['start'])
+        return {
+            'started_at': self.started_at.strftime("%Y-%m-%d %H:%M:%S"),
+            'wall_seconds': round(self.elapsed(), 3),
+            **meta,
+            'stages': stage_totals(spans),
+            'tokens': token_totals(spans),
+            'spans': spans,
+        }
+
+
+def stage_totals(spans):
+    """구간 이름별 {count, seconds, max}"""
+    totals = {}
+    for span in spans:
+        stage = totals.setdefault(span['name'], {'count': 0, 'seconds': 0.0, 'max': 0.0})
+        stage['count'] += 1
+        stage['seconds'] += span['seconds']
+        stage['max'] = max(stage['max'], span['seconds'])
+    return {name: {**stage, 'seconds': round(stage['seconds'], 3), 'max': round(stage['max'], 3)}
+            for name, stage in totals.items()}
+
+
+def token_totals(spans):
+    """call 구간의 입력/출력 토큰 합계 (estimated: 추정값이 섞인 호출 수)"""
+    totals = {'input': 0, 'output': 0, 'calls': 0, 'estimated': 0}
+    for span in spans:
+        if span['name'] != 'call':
+            continue
+        totals['calls'] += 1
+        totals['input'] += span.get('input_tokens') or 0
+        totals['output'] += span.get('output_tokens') or 0
+        totals['estimated'] += bool(span.get('estimated'))
+    return totals
+
+
+def write_report(report, output_dir, history_path=RUN_HISTORY):
+    """출력 폴더에 .run_report.json 저장 + 실행 이력에 요약 한 줄 추가"""
+    path = Path(output_dir) / REPORT_NAME
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=1)
+    if history_path:
+        summary = {key: value for key, value in report.items() if key != 'spans'}
+        history_path = Path(history_path)
+        history_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(history_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(summary, ensure_ascii=False) + "\n")
+    return path
+
+
+def fit(text, width, right=True):
+    """한글(전각 2칸)을 고려해 표 칸 너비 맞추기"""
+    text = str(text)
+    used = sum(2 if unicodedata.east_asian_width(ch) in "WF" else 1 for ch in text)
+    padding = " " * max(0, width - used)
+    return padding + text if right else text + padding
+
+
+def print_summary(report):
+    """단계별 시간/토큰 표"""
+    wall = report['wall_seconds']
+    print(f"\n⏱️ 실행 시간 분석 (전체 {wall:.1f}초)")
+    print("   " + fit('단계', 12, right=False) + "".join(
+        fit(title, width) for title, width in (('횟수', 6), ('합계(초)', 10), ('평균', 8), ('최대', 8), ('비중', 7))))
+    for name, stage in sorted(report['stages'].items(), key=lambda item: -item[1]['seconds']):
+        if name == 'job':
+            continue   # 다른 구간을 포함하므로 표에서는 제외
+        share = stage['seconds'] / wall if wall else 0
+        print(f"   {name:<12}{stage['count']:>6}{stage['seconds']:>10.1f}"
+              f"{stage['seconds'] / stage['count']:>8.2f}{stage['max']:>8.2f}{share:>7.0%}")
+    tokens = report['tokens']
+    if tokens['calls']:
+        note = f" (추정 {tokens['estimated']}회 포함)" if tokens['estimated'] else ""
+        print(f"   🔢 LLM 호출 {tokens['calls']}회, 입력 {tokens['input']:,} / 출력 {tokens['output']:,} 토큰{note}")
+    jobs = sorted((s for s in report['spans'] if s['name'] == 'job'), key=lambda s: -s['seconds'])
+    if jobs:
+        slowest = ", ".join(f"{s['output']} {s['seconds']:.1f}초" for s in jobs[:SLOWEST_JOBS])
+        print(f"   🐢 오래 걸린 작업: {slowest}")
+    if any(s['seconds'] > wall for s in report['stages'].values()):
+        print("   (동시 실행이라 단계 합계가 전체 시간보다 클 수 있습니다)")
+
+
+def print_history(history_path=RUN_HISTORY, limit=10):
+    """최근 실행들의 전체 시간/호출/토큰 비교"""
+    try:
+        with open(history_path, 'r', encoding='utf-8') as f:
+            runs = [json.loads(line) for line in f if line.strip()][-limit:]
+    except FileNotFoundError:
+        runs = []
+    if not runs:
+        print(f"❌ 실행 이력이 없습니다: {history_path}")
+        return False
+    print(f"📈 최근 실행 {len(runs)}회 ({history_path})")
+    print("   " + fit('시작', 20, right=False) + fit('백엔드', 10, right=False) + "".join(
+        fit(title, width) for title, width in (('전체(초)', 9), ('호출', 6), ('대기(초)', 9),
+                                               ('입력 토큰', 11), ('출력 토큰', 10))))
+    for run in runs:
+        stages = run.get('stages', {})
+        waited = sum(stages.get(name, {}).get('seconds', 0) for name in ('rate_wait', 'backoff', 'sleep'))
+        tokens = run.get('tokens', {})
+        print(f"   {run['started_at']:<20}{run.get('backend', '-'):<10}{run['wall_seconds']:>9.1f}"
+              f"{tokens.get('calls', 0):>6}{waited:>9.1f}{tokens.get('input', 0):>11,}{tokens.get('output', 0):>10,}")
+    return True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="generate_insights.py 실행 기록 보기")
+    parser.add_argument("report", type=Path, nargs="?", help=".run_report.json (없으면 최근 실행 이력)")
+    parser.add_argument("--history", type=Path, default=RUN_HISTORY, help="실행 이력 파일")
+    parser.add_argument("--limit", type=int, default=10, help="이력에서 보여줄 실행 수")
+    args = parser.parse_args(argv)
+
+    if args.report is None:
+        return 0 if print_history(args.history, args.limit) else 1
+    try:
+        with open(args.report, 'r', encoding='utf-8') as f:
+            report = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        return 1
+    print_summary(report)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,112 @@
+"""
+Gemini 호출 스케줄러
+====================
+서로 독립적인 프롬프트를 스레드 풀로 동시에 보내면서,
+분당 요청 수(RPM)와 분당 토큰 수(TPM) 한도를 60초 이동 창으로 지킵니다.
+(어느 60초 구간을 잘라도 요청 수 ≤ RPM, 토큰 수 ≤ TPM — 시작 직후나 쉬었다 다시 보낼 때도 한꺼번에 몰리지 않음)
+
+고정 대기(API_DELAY, 섹션 간 30초) 대신 할당량이 허용하는 만큼만 기다립니다.
+429 응답을 받으면 모든 워커가 함께 쉬도록 리미터를 일시 정지합니다.
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# gemini-2.0-flash 무료 등급 기준
+DEFAULT_RPM = 15
+DEFAULT_TPM = 1_000_000
+DEFAULT_WORKERS = 4
+
+
+def estimate_tokens(text):
+    """토큰 수 추정 (한글이 섞인 프롬프트 기준 약 2자당 1토큰)"""
+    return max(1, len(text or "") // 2)
+
+
+class SlidingWindow:
+    """최근 window초 동안 꺼낸 양이 limit을 넘지 않게 하는 이동 창"""
+
+    def __init__(self, limit, window=60.0, clock=time.monotonic):
+        self.limit = float(limit)
+        self.window = window
+        self.clock = clock
+        self.events = deque()   # (꺼낸 시각, 양)
+        self.used = 0.0
+
+    def _expire(self, now):
+        while self.events and self.events[0][0] <= now - self.window:
+            self.used -= self.events.popleft()[1]
+
+    def wait_time(self, amount):
+        """amount만큼 꺼내기 위해 기다려야 하는 시간(초)"""
+        now = self.clock()
+        self._expire(now)
+        amount = min(amount, self.limit)
+        excess = self.used + amount - self.limit
+        if excess <= 0:
+            return 0.0
+        # 오래된 기록부터 창 밖으로 나가면서 excess만큼 비워지는 시각까지 대기
+        for at, taken in self.events:
+            excess -= taken
+            if excess <= 0:
+                return at + self.window - now
+        return self.window
+
+    def take(self, amount):
+        amount = min(amount, self.limit)
+        self.events.append((self.clock(), amount))
+        self.used += amount
+
+
+class RateLimiter:
+    """RPM/TPM 두 이동 창을 함께 지키는 스레드 안전 리미터"""
+
+    def __init__(self, rpm=DEFAULT_RPM, tpm=DEFAULT_TPM, clock=time.monotonic, sleep=time.sleep):
+        self.windows = []
+        if rpm:
+            self.windows.append(("requests", SlidingWindow(rpm, clock=clock)))
+        if tpm:
+            self.windows.append(("tokens", SlidingWindow(tpm, clock=clock)))
+        self.clock = clock
+        self.sleep = sleep
+        self.paused_until = 0.0
+        self.lock = threading.Lock()
+
+    def acquire(self, tokens=1):
+        """요청 1건과 tokens개의 토큰을 확보할 때까지 대기"""
+        amounts = {"requests": 1, "tokens": tokens}
+        while True:
+            with self.lock:
+                wait = self.paused_until - self.clock()
+                if wait <= 0:
+                    wait = max([w.wait_time(amounts[name]) for name, w in self.windows] + [0.0])
+                    if wait <= 0:
+                        for name, window in self.windows:
+                            window.take(amounts[name])
+                        return
+            self.sleep(wait)
+
+    def pause(self, seconds):
+        """429 응답 후 모든 워커를 seconds초 동안 멈춤"""
+        with self.lock:
+            self.paused_until = max(self.paused_until, self.clock() + seconds)
+
+
+def run_concurrent(jobs, worker, max_workers=DEFAULT_WORKERS):
+    """jobs를 스레드 풀에서 실행하고 {output: (성공 여부, 결과 또는 예외)} 반환
+
+    한 작업이 실패해도 나머지 작업은 계속 진행됩니다.
+    """
+    results = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(worker, job): job for job in jobs}
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                results[job['output']] = (True, future.result())
+            except Exception as e:
+                print(f"   ❌ {job['output']}: {e}")
+                results[job['output']] = (False, e)
+    return results
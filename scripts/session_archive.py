@@ -0,0 +1,119 @@
+"""
+LLM 세션 기록 / 재생
+====================
+한 번의 generate_insights.py 실행에서 주고받은 (프롬프트, 응답) 쌍을 파일 하나에 담아 두고,
+나중에 API 호출 없이 같은 응답으로 CSV 전체를 다시 만듭니다.
+save_csv 형식이나 응답 파서를 고친 뒤 결과를 확인할 때 씁니다.
+
+    {"version": 1, "model": "gemini-2.0-flash", "created": "...", "festival": null,
+     "options": {"batch": false, "context_budget": 1500, "raw_context": false},
+     "inputs": {"top10_evaluation": {"file": "...", "sha256": "..."}, ...},
+     "entries": {"<cache_key(모델, 프롬프트)>": {"output": "01_executive/01_strategies.csv", "response": "..."}}}
+
+프롬프트 본문은 저장하지 않고 해시만 키로 씁니다 (response_cache.cache_key와 같음).
+options는 프롬프트 모양을 바꾸는 실행 옵션으로, 재생할 때 그대로 다시 적용합니다.
+gzip(mtime 0) + 키 정렬로 저장하므로 같은 세션은 항상 같은 바이트의 파일이 됩니다.
+캐시에서 온 응답도 기록하고, 스키마 검사에 실패한 응답과 재요청 응답도 그대로 남겨
+재생할 때 같은 CSV가 나옵니다 (같은 프롬프트로 여러 번 요청했으면 마지막 응답).
+
+사용법:
+    python generate_insights.py --record-session ../sessions/2025-06.json.gz
+    python generate_insights.py --replay-session ../sessions/2025-06.json.gz --output-dir ../tmp_out
+    python session_archive.py ../sessions/2025-06.json.gz      # 기록 내용 보기
+"""
+
+import argparse
+import gzip
+import json
+import threading
+from datetime import datetime
+from pathlib import Path
+
+from response_cache import cache_key
+
+ARCHIVE_VERSION = 1
+
+
+class SessionArchive:
+    """(모델, 프롬프트) → 응답 기록 (ResponseCache와 같은 get 인터페이스)"""
+
+    def __init__(self, model, festival=None, inputs=None, options=None, entries=None, created=None):
+        self.model = model
+        self.festival = festival
+        self.options = options or {}
+        self.inputs = inputs or {}
+        self.entries = entries or {}
+        self.created = created or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def record(self, model, prompt, response, output=None):
+        with self.lock:
+            self.entries[cache_key(model, prompt)] = {'output': output, 'response': response}
+
+    def get(self, model, prompt):
+        entry = self.entries.get(cache_key(model, prompt))
+        return entry['response'] if entry else None
+
+    def changed_inputs(self, inputs):
+        """기록 당시와 sha256이 다른 원본 키 목록"""
+        return sorted(key for key, state in self.inputs.items()
+                      if inputs.get(key, {}).get('sha256') != state.get('sha256'))
+
+    def save(self, path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            'version': ARCHIVE_VERSION,
+            'model': self.model,
+            'created': self.created,
+            'festival': self.festival,
+            'options': self.options,
+            'inputs': self.inputs,
+            'entries': self.entries,
+        }
+        content = json.dumps(data, ensure_ascii=False, sort_keys=True, separators=(',', ':')).encode('utf-8')
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(gzip.compress(content, mtime=0))
+        tmp_path.replace(path)
+        return path.stat().st_size
+
+    @classmethod
+    def load(cls, path):
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') != ARCHIVE_VERSION:
+            raise ValueError(f"{path}: 지원하지 않는 세션 기록 버전 {data.get('version')}")
+        return cls(data['model'], data.get('festival'), data.get('inputs'), data.get('options'),
+                   data['entries'], data.get('created'))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="LLM 세션 기록 내용 보기")
+    parser.add_argument("archive", type=Path, help="세션 기록 파일 (.json.gz)")
+    args = parser.parse_args(argv)
+
+    try:
+        archive = SessionArchive.load(args.archive)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        return 1
+    print(f"📼 {args.archive} ({args.archive.stat().st_size / 1024:.1f}KB)")
+    print(f"   모델: {archive.model}, 기록: {archive.created}, 축제: {archive.festival or 'raw/'}")
+    if archive.options:
+        print(f"   옵션: {', '.join(f'{k}={v}' for k, v in sorted(archive.options.items()))}")
+    print(f"   응답 {len(archive)}개")
+    outputs = {}
+    for entry in archive.entries.values():
+        outputs.setdefault(entry['output'] or '-', []).append(len(entry['response'] or ''))
+    for output, sizes in sorted(outputs.items()):
+        note = f" (응답 {len(sizes)}개, 재요청 포함)" if len(sizes) > 1 else ""
+        print(f"   - {output}: {sum(sizes):,}자{note}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,381 @@
+"""
+SNF 원본 데이터셋
+=================
+github_data/raw/의 노션 CSV 8개를 한 번만 읽어 컬럼 배열(Table)로 보관합니다.
+generate_insights.py와 verify_and_generate.py가 함께 사용합니다.
+
+- 파일은 한 번만, 한 행씩 읽습니다 (SHA-256 지문, 프롬프트용 앞부분/통계, 파싱 모두 같은 스트림에서)
+- PREVIEW_LINES보다 긴 파일은 앞부분 대신 앞부분 + 전체 통계 요약을 프롬프트에 넣음 (stream_stats)
+- 노션 헤더('참여 전 찜 수(GDCo) ', 'DEMO페이지 접속(6/17기준)(' 등)를 영문 컬럼명으로 통일
+- 찜 수/순위는 int(쉼표 제거), 날짜는 date, Steam URL은 app_id로 변환
+- snapshot_path를 주면 파싱 결과를 pickle로 저장해, 파일이 그대로면 다음 실행에서 CSV 파싱을 건너뜀
+
+    dataset = load_dataset(RAW_DIR)
+    top50 = dataset['top50_games']
+    top50['genre']        # ['액션 RPG', '슈팅', ...]
+    top50['chart_count']  # [14, 9, 15, ...]
+
+    # 아주 큰 파일은 Table을 만들지 않고 한 행씩 처리
+    for row in RowStream("chart_integration", path):
+        index.add(row)
+"""
+
+import csv
+import glob
+import hashlib
+import io
+import os
+import pickle
+import re
+from datetime import date
+from pathlib import Path
+
+from stream_stats import TableSummary
+
+# 원본 CSV 파일 패턴
+RAW_FILES = {
+    "top10_evaluation": "TOP10 게임 종합 평가*.csv",
+    "top10_chart_count": "TOP10 차트인 횟수*.csv",
+    "top50_games": "가장 많이 플레이한 TOP50 게임*.csv",
+    "report_page": "결산 페이지*.csv",
+    "trending_upcoming": "떠오르는 출시 예정 게임*.csv",
+    "popular_demo": "인기 체험판*.csv",
+    "popular_upcoming": "인기 출시 예정 게임*.csv",
+    "chart_integration": "전체 장르 - 각 게임별 SNF기간 3종 차트인 횟수*.csv",
+}
+
+# 일자별 차트 파일 공통 구조 (인기 체험판 / 인기 출시 예정 / 떠오르는 출시 예정)
+_DAILY_CHART_SCHEMA = [
+    ("url", "게임명", "str"),
+    ("app_id", "게임명", "app_id"),
+    ("date", "날짜", "date"),
+    ("rank", "랭킹", "int"),
+    ("interface_count", "인터페이스 언어개수", "int"),
+    ("tags", "태그", "str"),
+    ("tag_count", "태그 개수", "int"),
+]
+
+# 파일별 컬럼 정의: (컬럼명, 노션 헤더(정확히 일치 → 접두어 일치), 타입)
+SCHEMAS = {
+    "top10_evaluation": [
+        ("url", "게임명", "str"),
+        ("app_id", "게임명", "app_id"),
+        ("rank", "랭킹", "int"),
+        ("review_status", "리뷰 상황", "str"),
+        ("review_count", "리뷰 수", "int"),
+        ("review_lang", "리뷰 언어 등록 유저 국적", "str"),
+        ("wishlist_rank", "찜 랭크", "int"),
+        ("wishlist_before", "참여 전 찜 수", "int"),
+        ("wishlist_after", "참여 후 찜 수", "int"),
+        ("followers", "팔로워", "int"),
+    ],
+    "top10_chart_count": [
+        ("url", "게임명", "str"),
+        ("app_id", "게임명", "app_id"),
+        ("chart_count", "차트인 횟수", "int"),
+    ],
+    "top50_games": [
+        ("url", "게임명", "str"),
+        ("app_id", "게임명", "app_id"),
+        ("demo", "DEMO페이지 접속", "str"),
+        ("multiplayer", "멀티 플레이", "str"),
+        ("rank", "순위", "int"),
+        ("genre", "장르", "str"),
+        ("release", "정식 출시일", "str"),
+        ("chart_count", "차트인 횟수", "int"),
+        ("notes", "참고사항", "str"),
+    ],
+    "report_page": [
+        ("url", "게임명", "str"),
+        ("app_id", "게임명", "app_id"),
+        ("developer", "개발자", "str"),
+        ("publisher", "배급사", "str"),
+        ("voice", "음성", "str"),
+        ("interface", "인터페이스", "str"),
+        ("interface_count", "인터페이스 언어개수", "int"),
+        ("subtitles", "자막", "str"),
+        ("tags", "태그", "str"),
+        ("tag_count", "태그개수", "int"),
+        ("community", "커뮤니티", "str"),
+    ],
+    "trending_upcoming": _DAILY_CHART_SCHEMA,
+    "popular_demo": _DAILY_CHART_SCHEMA,
+    "popular_upcoming": _DAILY_CHART_SCHEMA,
+    "chart_integration": [
+        ("game", "게임명", "str"),
+        ("date", "날짜", "date"),
+        ("rank", "랭킹", "int"),
+        ("genre_filter", "장르 필터", "str"),
+        ("chart_type", "차트 구분", "str"),
+    ],
+}
+
+PREVIEW_LINES = 100   # 이 행 수까지는 CSV 원문을 그대로 프롬프트에 넣음
+SAMPLE_LINES = 30     # 더 긴 파일은 앞 30행 + 전체 통계 요약
+
+# 스키마나 미리보기 형식이 바뀌면 이전 스냅샷은 무시
+SNAPSHOT_VERSION = hashlib.sha256(
+    repr((sorted(SCHEMAS.items()), PREVIEW_LINES, SAMPLE_LINES)).encode('utf-8')).hexdigest()[:12]
+
+
+# ============================================
+# 값 변환
+# ============================================
+def parse_int(value):
+    """'1,234' → 1234 (숫자가 아니면 None)"""
+    text = str(value or '').replace(',', '').strip()
+    return int(text) if text.lstrip('-').isdigit() else None
+
+
+def parse_date(value):
+    """'2025년 6월 10일' / '2025-06-10' / '2025.06.10' → date (실패 시 None)"""
+    numbers = re.findall(r'\d+', str(value or ''))
+    if len(numbers) < 3:
+        return None
+    try:
+        return date(int(numbers[0]), int(numbers[1]), int(numbers[2]))
+    except ValueError:
+        return None
+
+
+def parse_app_id(value):
+    """Steam URL → app ID 문자열 (없으면 None)"""
+    match = re.search(r'app/(\d+)', str(value or ''))
+    return match.group(1) if match else None
+
+
+PARSERS = {
+    "str": lambda value: (value or '').strip(),
+    "int": parse_int,
+    "date": parse_date,
+    "app_id": parse_app_id,
+}
+
+
+# ============================================
+# Table
+# ============================================
+class Table:
+    """원본 CSV 하나를 컬럼 배열로 보관"""
+
+    def __init__(self, key, columns, path=None, sha256=None, preview="데이터 없음"):
+        self.key = key
+        self.columns = columns
+        self.path = Path(path) if path else None
+        self.sha256 = sha256
+        self.preview = preview
+
+    def __len__(self):
+        return len(next(iter(self.columns.values()), []))
+
+    def __bool__(self):
+        """행이 0개여도 불러온 표는 참 (`if table:`이 '없음'만 걸러내도록)"""
+        return True
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def __contains__(self, name):
+        return name in self.columns
+
+    @property
+    def names(self):
+        return list(self.columns)
+
+    def records(self):
+        """행 단위 dict 목록 (집계 코드에서 행이 필요할 때)"""
+        names = self.names
+        return [dict(zip(names, values)) for values in zip(*(self.columns[n] for n in names))]
+
+
+def _resolve_headers(header, schema):
+    """스키마 컬럼 → (원본 헤더 인덱스, 타입) (정확히 일치하는 헤더 우선, 없으면 접두어 일치)"""
+    cleaned = [h.lstrip('\ufeff').strip() for h in header]
+    mapping = {}
+    used = set()
+    for name, source, kind in schema:
+        index = cleaned.index(source) if source in cleaned else None
+        if index is None:
+            index = next((i for i, h in enumerate(cleaned) if h.startswith(source)), None)
+        mapping[name] = (index, kind)
+        if index is not None:
+            used.add(index)
+    # 스키마에 없는 헤더도 문자열 컬럼으로 보존
+    for i, h in enumerate(cleaned):
+        if i not in used and h and h not in mapping:
+            mapping[h] = (i, "str")
+    return mapping
+
+
+class _HashingReader(io.RawIOBase):
+    """읽는 바이트를 그대로 SHA-256에 넣는 래퍼 (지문 계산용으로 파일을 다시 읽지 않음)"""
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.digest = hashlib.sha256()
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        n = self.raw.readinto(buffer)
+        if n:
+            self.digest.update(memoryview(buffer)[:n])
+        return n
+
+
+class RowStream:
+    """CSV를 한 행씩 타입 변환된 dict로 내보내는 스트림 (메모리 사용량 일정)
+
+    반복이 끝나면 sha256과 rows(빈 행 제외 행 수)가 채워집니다.
+    on_raw(cells)를 주면 변환 전 원본 셀 목록도 함께 받습니다.
+    """
+
+    def __init__(self, key, path, on_raw=None):
+        self.key = key
+        self.path = Path(path)
+        self.on_raw = on_raw
+        self.columns = []   # [(컬럼명, 타입)]
+        self.header = []
+        self.sha256 = None
+        self.rows = 0
+
+    def __iter__(self):
+        with open(self.path, 'rb', buffering=0) as raw:
+            hashing = _HashingReader(raw)
+            text = io.TextIOWrapper(io.BufferedReader(hashing, 1 << 20), encoding='utf-8-sig', newline='')
+            reader = csv.reader(text)
+            self.header = next(reader, [])
+            mapping = _resolve_headers(self.header, SCHEMAS.get(self.key, []))
+            self.columns = [(name, kind) for name, (_, kind) in mapping.items()]
+            fields = [(name, index, PARSERS[kind]) for name, (index, kind) in mapping.items()]
+            for row in reader:
+                if not any(cell.strip() for cell in row):
+                    continue
+                self.rows += 1
+                if self.on_raw:
+                    self.on_raw(row)
+                yield {name: parse(row[index] if index is not None and index < len(row) else '')
+                       for name, index, parse in fields}
+            # 남은 바이트까지 지문에 포함
+            while text.read(1 << 20):
+                pass
+            self.sha256 = hashing.digest.hexdigest()
+
+
+def _format_lines(rows):
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator='\n').writerows(rows)
+    return buffer.getvalue().rstrip('\n')
+
+
+class Preview:
+    """프롬프트용 앞부분 + 전체 통계를 스트리밍 중에 함께 모음
+
+    짧은 파일은 CSV 원문 그대로, PREVIEW_LINES 이상이면 앞 SAMPLE_LINES행 + TableSummary.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.head = []
+        self.summary = None
+        stream.on_raw = self._keep_head
+
+    def _keep_head(self, cells):
+        if len(self.head) < PREVIEW_LINES:
+            self.head.append(cells)
+
+    def rows(self):
+        """stream의 행을 그대로 내보내면서 통계를 누적"""
+        for row in self.stream:
+            if self.summary is None:
+                self.summary = TableSummary(self.stream.key, self.stream.columns)
+            self.summary.add(row)
+            yield row
+
+    def render(self):
+        header = self.stream.header
+        if self.stream.rows < PREVIEW_LINES:
+            return _format_lines([header] + self.head)
+        return '\n'.join([
+            _format_lines([header] + self.head[:SAMPLE_LINES]),
+            f"... (앞 {SAMPLE_LINES}행만 표시, 전체 {self.stream.rows:,}행)",
+            "",
+            self.summary.render(),
+        ])
+
+
+def read_table(key, path):
+    """파일을 한 번 스트리밍해 Table, 지문, 프롬프트용 앞부분/통계를 함께 만듦"""
+    stream = RowStream(key, path)
+    preview = Preview(stream)
+    columns = None
+    for row in preview.rows():
+        if columns is None:
+            columns = {name: [] for name, _ in stream.columns}
+        for name, values in columns.items():
+            values.append(row[name])
+    if columns is None:
+        columns = {name: [] for name, _ in stream.columns}
+    return Table(key, columns, path, stream.sha256, preview.render())
+
+
+def find_csv_file(raw_dir, pattern):
+    """패턴에 맞는 CSV 파일 찾기 (여러 개면 가장 최근 파일)"""
+    files = glob.glob(str(Path(raw_dir) / pattern))
+    return Path(max(files, key=os.path.getmtime)) if files else None
+
+
+# ============================================
+# 로드 + 스냅샷
+# ============================================
+def _file_state(path):
+    stat = path.stat()
+    return (str(path), stat.st_size, stat.st_mtime_ns)
+
+
+def _load_snapshot(snapshot_path):
+    try:
+        with open(snapshot_path, 'rb') as f:
+            snapshot = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        return {}
+    if snapshot.get('version') != SNAPSHOT_VERSION:
+        return {}
+    return snapshot.get('tables', {})
+
+
+def _save_snapshot(snapshot_path, tables):
+    snapshot_path = Path(snapshot_path)
+    snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = snapshot_path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_path, 'wb') as f:
+        pickle.dump({'version': SNAPSHOT_VERSION, 'tables': tables}, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, snapshot_path)
+
+
+def load_dataset(raw_dir, snapshot_path=None):
+    """RAW_FILES 8개를 Table로 로드 ({키: Table 또는 None})
+
+    snapshot_path가 있으면 (경로, 크기, 수정 시각)이 같은 파일은 스냅샷에서 가져옵니다.
+    """
+    previous = _load_snapshot(snapshot_path) if snapshot_path else {}
+    tables = {}
+    states = {}
+    changed = False
+    for key, pattern in RAW_FILES.items():
+        path = find_csv_file(raw_dir, pattern)
+        if not path:
+            tables[key] = None
+            continue
+        state = _file_state(path)
+        cached = previous.get(key)
+        if cached and cached[0] == state:
+            tables[key] = cached[1]
+        else:
+            tables[key] = read_table(key, path)
+            changed = True
+        states[key] = (state, tables[key])
+    if snapshot_path and (changed or states.keys() != previous.keys()):
+        _save_snapshot(snapshot_path, states)
+    return tables
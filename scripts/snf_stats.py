@@ -0,0 +1,476 @@
+"""
+SNF 통계 엔진
+=============
+숫자만으로 이루어진 CSV(찜 증가량, 장르/플레이 방식/체험판 분포, 차트 등장 횟수 등)는
+Gemini에게 계산을 맡기지 않고 원본 데이터에서 직접 만듭니다.
+Gemini는 서술형 컬럼(설명, 메모, 전략)만 작성합니다.
+
+generate_insights.py와 verify_and_generate.py가 함께 사용합니다.
+입력은 snf_dataset.Table(타입이 정리된 컬럼 배열)이며, 모든 집계는 한 번의 순회로 끝납니다.
+"""
+
+import re
+from collections import Counter, defaultdict
+
+from chart_index import ChartIndex
+from game_catalog import load_catalog
+
+CHART_TYPES = ['인기 체험판', '인기 출시 예정 게임', '떠오르는 출시 예정 게임']
+
+# 대시보드 차트 색상 (진한 파랑 → 연한 파랑, 기타는 회색)
+PALETTE = ['#003380', '#0047AB', '#3B82F6', '#60A5FA', '#93C5FD']
+OTHER_COLOR = '#94A3B8'
+
+REVIEW_ORDER = ['압도적 긍정', '매우 긍정적', '긍정적', '대체로 긍정적', '복합적', '대체로 부정적', '확인불가']
+
+# Executive 장르 분포 분류 (06_genre_distribution.csv)
+GENRE_GROUPS = [
+    ('⚔️', '액션 RPG', ('액션 RPG', 'MMORPG', 'RPG'), '#0047AB'),
+    ('🔫', '슈팅', ('슈팅', 'FPS'), '#3B82F6'),
+    ('🎲', '로그라이크', ('로그라이크', '로그라이트'), '#8B5CF6'),
+    ('👻', '공포', ('공포', '호러'), '#F59E0B'),
+]
+GENRE_OTHER = ('📦', '기타', '#64748B')
+
+# 리뷰 언어 약칭 → 표시명
+LANGUAGE_LABELS = {'간체': '간체 중국어', '번체': '번체 중국어'}
+
+
+# ============================================
+# 값 정규화
+# ============================================
+def extract_game_name(url_or_name, catalog=None):
+    """Steam URL / 게임명 → 게임 카탈로그의 표시명 (game_catalog.py)"""
+    if not url_or_name:
+        return ""
+    return (catalog or load_catalog()).display_name(url_or_name)
+
+
+def percent(part, total):
+    """'42%' 형식 (total이 0이면 '0%')"""
+    return f"{round(part / total * 100)}%" if total else "0%"
+
+
+def split_list(value):
+    """'영어, 한국어' → ['영어', '한국어'] ('지원 안함'이면 빈 목록)"""
+    text = str(value or '').strip()
+    if not text or text in ('지원 안함', '없음', '-'):
+        return []
+    return [item.strip() for item in re.split(r'[,/|]', text) if item.strip()]
+
+
+# ============================================
+# 원본 행 정규화
+# ============================================
+def normalize_top10_evaluation(table, catalog=None):
+    """TOP10 게임 종합 평가 → 찜 증가량/증가율 포함 dict 목록"""
+    games = []
+    names = (catalog or load_catalog()).resolve_column(table['url']) if table else []
+    for row, name in zip(table.records() if table else [], names):
+        if row['rank'] is None:
+            continue  # '*참고' 등 비고 행
+        before = row['wishlist_before'] or 0
+        after = row['wishlist_after'] or 0
+        increase = after - before
+        games.append({
+            'rank': row['rank'],
+            'url': row['url'],
+            'app_id': row['app_id'],
+            'name': name,
+            'review_status': row['review_status'],
+            'review_count': row['review_count'] or 0,
+            'review_lang': row['review_lang'],
+            'wishlist_before': before,
+            'wishlist_after': after,
+            'wishlist_increase': increase,
+            'wishlist_pct': (increase / before * 100) if before > 0 else 0,
+        })
+    games.sort(key=lambda g: g['rank'])
+    return games
+
+
+def normalize_top50_games(table, catalog=None):
+    """가장 많이 플레이한 TOP50 게임"""
+    games = []
+    names = (catalog or load_catalog()).resolve_column(table['url']) if table else []
+    for row, name in zip(table.records() if table else [], names):
+        games.append({
+            'rank': row['rank'] or 0,
+            'url': row['url'],
+            'app_id': row['app_id'],
+            'name': name,
+            'demo': row['demo'],
+            'multiplayer': row['multiplayer'],
+            'genre': row['genre'],
+            'release': row['release'],
+            'chart_count': row['chart_count'],
+            'notes': row['notes'],
+        })
+    games.sort(key=lambda g: g['rank'])
+    return games
+
+
+def normalize_chart_entries(table, catalog=None):
+    """전체 장르 - 3종 차트인 기록 (date는 datetime.date)
+
+    게임명은 카탈로그 표시명으로 통일하고, 카탈로그에 있는 게임은 app_id로 URL 파일과 연결합니다.
+    """
+    if table is None:
+        return []
+    catalog = catalog or load_catalog()
+    games = catalog.resolve_column(table['game'])
+    app_ids = catalog.app_id_column(table['game'])
+    return [
+        {'game': game, 'app_id': app_id, 'date': day, 'rank': rank or 0, 'chart_type': chart_type}
+        for game, app_id, day, rank, chart_type in zip(games, app_ids, table['date'], table['rank'],
+                                                        table['chart_type'])
+    ]
+
+
+# ============================================
+# 검증 통계 (verify_and_generate.py)
+# ============================================
+def as_chart_index(chart_data):
+    """차트 기록 목록 → ChartIndex (이미 인덱스면 그대로)"""
+    return chart_data if isinstance(chart_data, ChartIndex) else ChartIndex(chart_data)
+
+
+def compute_stats(top10_eval, top50_games, chart_data):
+    """모든 통계 계산"""
+    # TOP 10 상세 (TOP 50에서 상위 10개)
+    top10_from_50 = [g for g in top50_games if g['rank'] <= 10]
+
+    stats = {}
+
+    # TOP 10 통계
+    stats['top10_multi'] = len([g for g in top10_from_50 if g['multiplayer'] == '멀티플레이'])
+    stats['top10_single'] = len([g for g in top10_from_50 if g['multiplayer'] == '싱글 플레이'])
+    stats['top10_demo'] = len([g for g in top10_from_50 if g['demo'] == '가능'])
+    stats['top10_no_demo'] = len([g for g in top10_from_50 if g['demo'] == '불가능'])
+
+    # TOP 10 리뷰 통계
+    stats['top10_positive_review'] = len([g for g in top10_eval if '긍정' in g['review_status']])
+
+    # TOP 10 간체 중국어
+    stats['top10_chinese'] = len([g for g in top10_eval if '간체' in g.get('review_lang', '')])
+
+    # TOP 10 찜 수 통계
+    stats['top10_total_wishlist_increase'] = sum(g['wishlist_increase'] for g in top10_eval)
+    stats['top10_avg_wishlist_increase'] = stats['top10_total_wishlist_increase'] // 10
+
+    # TOP 10 차트인 횟수 평균
+    chart_counts = [g['chart_count'] for g in top10_from_50 if g['chart_count'] is not None]
+    stats['top10_avg_chart_count'] = sum(chart_counts) / len(chart_counts) if chart_counts else 0
+
+    # TOP 50 통계
+    stats['top50_multi'] = len([g for g in top50_games if g['multiplayer'] == '멀티플레이'])
+    stats['top50_demo'] = len([g for g in top50_games if g['demo'] == '가능'])
+    stats['top50_total'] = len(top50_games)
+
+    # 장르 분포
+    stats['genres'] = Counter(g['genre'] for g in top50_games).most_common(10)
+
+    # 차트 데이터 통계 (한 번 순회한 인덱스에서 조회)
+    index = as_chart_index(chart_data)
+    stats['chart_total_entries'] = len(index)
+    stats['chart_types'] = dict(index.type_counts)
+
+    # 게임별 차트인 횟수
+    stats['top_chart_games'] = index.game_counts.most_common(10)
+
+    # 각 차트별 1위 기록
+    for game_name, count in index.game_counts.most_common(5):
+        stats[f'first_places_{game_name}'] = index.first_places(game_name, CHART_TYPES)
+
+    return stats
+
+
+# ============================================
+# 출력 CSV 행 생성
+# ============================================
+def _top_language(review_lang):
+    first = split_list(review_lang)
+    if not first:
+        return ''
+    return LANGUAGE_LABELS.get(first[0], first[0])
+
+
+def _distribution_rows(chart_type, counter, total, limit, with_percentage=True, keep=None):
+    """상위 limit개 + 기타 분포 행 (keep: 개별 표시 조건)"""
+    rows = []
+    items = counter.most_common()
+    shown = [(label, count) for label, count in items[:limit] if keep is None or keep(count)]
+    for i, (label, count) in enumerate(shown):
+        row = {'chart_type': chart_type, 'label': label, 'value': count, 'color': PALETTE[i % len(PALETTE)]}
+        if with_percentage:
+            row['percentage'] = percent(count, total)
+        rows.append(row)
+    rest = total - sum(count for _, count in shown)
+    if rest > 0:
+        row = {'chart_type': chart_type, 'label': '기타', 'value': rest, 'color': OTHER_COLOR}
+        if with_percentage:
+            row['percentage'] = percent(rest, total)
+        rows.append(row)
+    return rows
+
+
+def top10_table_rows(top10_eval, top50_games):
+    """02_top_games/03_top10_table.csv"""
+    genre_by_app = {g['app_id'] or g['url']: g['genre'] for g in top50_games}
+    return [{
+        'rank': g['rank'],
+        'name': g['name'],
+        'genre': genre_by_app.get(g['app_id'] or g['url'], ''),
+        'review_status': g['review_status'] or '확인불가',
+        'review_count': g['review_count'],
+        'wishlist_before': g['wishlist_before'],
+        'wishlist_after': g['wishlist_after'],
+        'wishlist_increase': g['wishlist_increase'],
+        'wishlist_percent': f"{g['wishlist_pct']:+.1f}%",
+        'top_language': _top_language(g['review_lang']),
+    } for g in top10_eval]
+
+
+def top5_games_rows(top10_eval, top50_games):
+    """01_executive/04_top5_games.csv"""
+    columns = ('rank', 'name', 'genre', 'wishlist_increase', 'wishlist_percent', 'review_status')
+    return [{c: row[c] for c in columns} for row in top10_table_rows(top10_eval, top50_games)[:5]]
+
+
+def top10_chart_rows(top10_eval, top50_games):
+    """02_top_games/04_top10_charts.csv (찜 증가 TOP5, 리뷰 분포, 장르 분포)"""
+    rows = []
+    by_increase = sorted(top10_eval, key=lambda g: g['wishlist_increase'], reverse=True)[:5]
+    for i, g in enumerate(by_increase):
+        rows.append({'chart_type': 'wishlist_top5', 'label': f"{g['name']}({g['rank']}위)",
+                     'value': g['wishlist_increase'], 'color': PALETTE[i]})
+
+    reviews = Counter(g['review_status'] or '확인불가' for g in top10_eval)
+    order = {status: i for i, status in enumerate(REVIEW_ORDER)}
+    ordered = sorted(reviews.items(), key=lambda item: (order.get(item[0], len(order) - 1), -item[1]))
+    for i, (status, count) in enumerate(ordered):
+        color = OTHER_COLOR if status == '확인불가' else PALETTE[i % len(PALETTE)]
+        rows.append({'chart_type': 'review_dist', 'label': status, 'value': count, 'color': color})
+
+    genre_by_app = {g['app_id'] or g['url']: g['genre'] for g in top50_games}
+    genres = Counter(genre_by_app.get(g['app_id'] or g['url']) or '기타' for g in top10_eval)
+    rows.extend(_distribution_rows('genre_dist', genres, len(top10_eval), limit=4,
+                                   with_percentage=False, keep=lambda count: count >= 2))
+    return rows
+
+
+def top50_table_rows(top50_games, limit=15):
+    """02_top_games/05_top50_table.csv"""
+    return [{
+        'rank': g['rank'],
+        'name': g['name'],
+        'genre': g['genre'],
+        'play_type': '멀티' if g['multiplayer'] == '멀티플레이' else '싱글',
+        'demo_available': g['demo'],
+        'release_date': g['release'],
+        'chart_count': g['chart_count'] if g['chart_count'] is not None else '',
+        'notes': g['notes'],
+    } for g in top50_games[:limit]]
+
+
+def top50_chart_rows(top50_games):
+    """02_top_games/06_top50_charts.csv (장르/플레이 방식/체험판 분포)"""
+    total = len(top50_games)
+    rows = _distribution_rows('genre_dist', Counter(g['genre'] or '기타' for g in top50_games), total, limit=5)
+
+    multi = sum(1 for g in top50_games if g['multiplayer'] == '멀티플레이')
+    demo = sum(1 for g in top50_games if g['demo'] == '가능')
+    for chart_type, label, count, color in [
+        ('play_type', '멀티플레이', multi, '#0047AB'),
+        ('play_type', '싱글플레이', total - multi, '#60A5FA'),
+        ('demo_avail', '체험판 제공', demo, '#0047AB'),
+        ('demo_avail', '체험판 없음', total - demo, OTHER_COLOR),
+    ]:
+        rows.append({'chart_type': chart_type, 'label': label, 'value': count,
+                     'color': color, 'percentage': percent(count, total)})
+    return rows
+
+
+def genre_distribution_rows(top50_games):
+    """01_executive/06_genre_distribution.csv (액션 RPG/슈팅/로그라이크/공포/기타)"""
+    counts = Counter()
+    for g in top50_games:
+        for _, label, keywords, _ in GENRE_GROUPS:
+            if any(keyword in g['genre'] for keyword in keywords):
+                counts[label] += 1
+                break
+        else:
+            counts[GENRE_OTHER[1]] += 1
+    total = len(top50_games)
+    groups = [(icon, label, color) for icon, label, _, color in GENRE_GROUPS] + [GENRE_OTHER]
+    return [{'id': i, 'icon': icon, 'genre': label, 'percentage': percent(counts[label], total), 'color': color}
+            for i, (icon, label, color) in enumerate(groups, 1)]
+
+
+def chart_data_rows(chart_data, top_n=5):
+    """03_charts/03_chart_data.csv (차트별 노출 수, 최다 차트인 게임)"""
+    index = as_chart_index(chart_data)
+    total = len(index)
+    by_type = index.type_counts
+    rows = [{'chart_type': ct, 'stat_type': 'count', 'label': '총 노출 횟수',
+             'value': by_type.get(ct, 0), 'percentage': percent(by_type.get(ct, 0), total)}
+            for ct in CHART_TYPES]
+    for game, count in index.game_counts.most_common(top_n):
+        rows.append({'chart_type': 'top_games', 'stat_type': game, 'label': '차트인 횟수',
+                     'value': count, 'percentage': percent(count, total)})
+    return rows
+
+
+def daily_activity_rows(chart_data):
+    """03_charts/10_daily_activity.csv (날짜 × 차트별 진입 게임 수)"""
+    index = as_chart_index(chart_data)
+    return [{'date': day.isoformat(), 'chart_type': ct, 'games': len(index.ranking(ct, day))}
+            for day in index.dates() for ct in CHART_TYPES]
+
+
+def chart_game_summaries(chart_data, chart_type):
+    """차트 하나의 게임별 등장 횟수, 최고 순위, 기간, 최장 연속 일수 (등장 횟수 순)"""
+    return as_chart_index(chart_data).summaries(chart_type)
+
+
+def chart_detail_rows(chart_data, chart_type, columns, limit=5):
+    """03_charts/05~07 상세 표 (summaries에 없는 컬럼은 빈 값 → Gemini가 채움)"""
+    rows = []
+    for i, summary in enumerate(as_chart_index(chart_data).summaries(chart_type)[:limit], 1):
+        summary['rank'] = i
+        rows.append({c: summary.get(c, '') for c in columns})
+    return rows
+
+
+def chart_digest_rows(chart_data, top_n=15):
+    """프롬프트용 게임별 차트 요약 (전체 횟수, 차트별 횟수, 최고 순위, 1위 횟수)"""
+    index = as_chart_index(chart_data)
+    rows = []
+    for game, total in index.game_counts.most_common(top_n):
+        stats = {s.chart_type: s for s in index.by_game[game]}
+        ranks = [s.best_rank for s in stats.values() if s.best_rank is not None]
+        row = {'게임명': game, '전체': total}
+        row.update({ct: stats[ct].appearances if ct in stats else 0 for ct in CHART_TYPES})
+        row['최고 순위'] = min(ranks) if ranks else ''
+        row['1위 횟수'] = sum(s.first_places for s in stats.values())
+        rows.append(row)
+    return rows
+
+
+def chart_digest_notes(chart_data):
+    """프롬프트용 차트 전체 집계 문장"""
+    index = as_chart_index(chart_data)
+    total = len(index)
+    days = index.dates()
+    notes = [f"- 총 노출 {total}회, 고유 게임 {len(index.game_counts)}개"
+             + (f", 기간 {days[0].isoformat()} ~ {days[-1].isoformat()} ({len(days)}일)" if days else "")]
+    for ct in CHART_TYPES:
+        games = sum(1 for (_, t) in index.stats if t == ct)
+        notes.append(f"- {ct}: {index.type_counts.get(ct, 0)}회 ({percent(index.type_counts.get(ct, 0), total)}), "
+                     f"게임 {games}개")
+    all_three = sum(1 for game in index.game_counts if len(index.by_game[game]) == len(CHART_TYPES))
+    notes.append(f"- 3종 차트 모두 진입: {all_three}개 게임")
+    return notes
+
+
+def chart_timeline_rows(chart_data, chart_type, games):
+    """프롬프트용 일자별 순위 ('6/10:1 6/11:3 ...') + 추세 지표 (rank_series)"""
+    index = as_chart_index(chart_data)
+    ranks = defaultdict(list)
+    for day in index.dates(chart_type):
+        for rank, game in index.ranking(chart_type, day):
+            ranks[game].append(f"{day.month}/{day.day}:{rank}")
+    metrics = index.rank_matrix().metrics(chart_type)
+    rows = []
+    for game in games:
+        series = metrics.get(game, {})
+        rows.append({'게임명': game, '일자별 순위': ' '.join(ranks.get(game, [])),
+                     '추세': series.get('trend_direction', ''), '모멘텀': series.get('momentum', ''),
+                     '하루 순위 변화': series.get('velocity', ''), '변동성': series.get('volatility', ''),
+                     '현재 연속': series.get('current_streak', '')})
+    return rows
+
+
+def language_support_rows(report_table, limit=7):
+    """04_report/04_language_support.csv의 숫자 행 (interface, summary)
+
+    note 컬럼과 strategy 행은 Gemini가 채웁니다.
+    """
+    games = [row for row in report_table.records() if row['url']] if report_table else []
+    total = len(games)
+    interface = Counter()
+    for row in games:
+        interface.update(list(dict.fromkeys(split_list(row['interface']))))
+
+    def priority(count):
+        ratio = count / total if total else 0
+        return '필수' if ratio >= 0.8 else '권장' if ratio >= 0.6 else '선택'
+
+    rows = [{'support_type': 'interface', 'rank': i, 'language': language, 'game_count': count,
+             'percentage': percent(count, total), 'priority': priority(count), 'note': ''}
+            for i, (language, count) in enumerate(interface.most_common(limit), 1)]
+
+    voice = sum(1 for row in games if split_list(row['voice']))
+    interface_counts = [row['interface_count'] or len(split_list(row['interface'])) for row in games]
+    subtitle_counts = [len(split_list(row['subtitles'])) for row in games]
+    average = lambda values: f"{sum(values) / len(values):.1f}개" if values else "0개"
+    rows.extend([
+        {'support_type': 'summary', 'rank': 'voice', 'language': '음성 지원', 'game_count': voice,
+         'percentage': percent(voice, total), 'priority': '', 'note': f'{total}개 게임 기준'},
+        {'support_type': 'summary', 'rank': 'interface_avg', 'language': '인터페이스 평균', 'game_count': '',
+         'percentage': average(interface_counts), 'priority': '', 'note': ''},
+        {'support_type': 'summary', 'rank': 'subtitle_avg', 'language': '자막 평균', 'game_count': '',
+         'percentage': average(subtitle_counts), 'priority': '', 'note': ''},
+    ])
+    return rows
+
+
+def language_chart_rows(report_table, limit=7):
+    """04_report/07_language_charts.csv (음성 지원 언어, 자막 언어 분포)"""
+    games = [row for row in report_table.records() if row['url']] if report_table else []
+    voice = Counter()
+    subtitles = Counter()
+    for row in games:
+        voice.update(list(dict.fromkeys(split_list(row['voice']))) or ['없음'])
+        subtitles.update(list(dict.fromkeys(split_list(row['subtitles']))))
+    no_voice = voice.pop('없음', 0)
+    rows = _distribution_rows('voice', voice, sum(voice.values()), limit=4, with_percentage=False)
+    if no_voice:
+        rows.append({'chart_type': 'voice', 'label': '없음', 'value': no_voice, 'color': OTHER_COLOR})
+    for i, (language, count) in enumerate(subtitles.most_common(limit)):
+        rows.append({'chart_type': 'subtitles', 'label': language, 'value': count,
+                     'color': PALETTE[i % len(PALETTE)]})
+    return rows
+
+
+def merge_rows(local_rows, llm_rows, keys, extra_rows=None):
+    """로컬 계산 행에 Gemini가 쓴 서술 컬럼을 합침
+
+    - 로컬 행의 값이 있으면 항상 로컬 값 사용 (숫자는 Gemini 값을 믿지 않음)
+    - 로컬 행에서 비어 있는 컬럼만 같은 키의 Gemini 행에서 채움
+    - 로컬에 없는 Gemini 행은 extra_rows({컬럼: 허용 값 목록})에 맞는 서술 행만 뒤에 붙이고
+      나머지는 버림 (예시 행이나 지어낸 숫자 행이 계산 결과에 섞이지 않도록)
+
+        merge_rows(rows, llm_rows, ['support_type', 'language'], extra_rows={'support_type': ['strategy']})
+    """
+    def key_of(row):
+        return tuple(str(row.get(k, '')).strip() for k in keys)
+
+    def is_extra(row):
+        return bool(extra_rows) and all(str(row.get(c, '')).strip() in values for c, values in extra_rows.items())
+
+    local_keys = {key_of(row) for row in local_rows}
+    llm_rows = [row for row in llm_rows if key_of(row) in local_keys or is_extra(row)]
+    columns = list(local_rows[0].keys()) if local_rows else []
+    for row in llm_rows:
+        columns.extend(c for c in row if c not in columns)
+    llm_by_key = {key_of(row): row for row in llm_rows}
+
+    merged = []
+    for row in local_rows:
+        extra = llm_by_key.get(key_of(row), {})
+        merged.append({c: row[c] if row.get(c, '') != '' else extra.get(c, '') for c in columns})
+    for row in llm_rows:
+        if key_of(row) not in local_keys:
+            merged.append({c: row.get(c, '') for c in columns})
+    return merged
@@ -0,0 +1,117 @@
+"""
+스트리밍 집계
+=============
+행을 하나씩 받아 컬럼별 통계(개수, 빈 값, 합계/최소/최대, 날짜 범위, 자주 나오는 값)를
+고정된 메모리 안에서 누적합니다. 수백 MB짜리 일자별 차트 로그도 전체를 메모리에 올리지 않고 요약합니다.
+
+    summary = TableSummary("chart_integration", [("game", "str"), ("rank", "int"), ...])
+    for row in RowStream("chart_integration", path):
+        summary.add(row)
+    summary.render()   # 프롬프트에 넣을 고정 크기 요약 텍스트
+"""
+
+from collections import Counter
+
+TOP_VALUES = 8        # 요약에 보여줄 자주 나오는 값 개수
+TRACKED_VALUES = 64   # 고유값이 많을 때 빈도 추적용 슬롯 수 (Misra-Gries)
+DISTINCT_LIMIT = 1000 # 이 개수까지는 값별 개수를 정확히 셈
+
+
+class TopCounter:
+    """Misra-Gries 빈도 추정 (슬롯 수가 고정이므로 고유값이 많아도 메모리 일정)
+
+    추정치는 실제 개수 이하이며, 오차는 최대 (전체 개수 / 슬롯 수)입니다.
+    """
+
+    def __init__(self, capacity=TRACKED_VALUES, seed=None):
+        self.capacity = capacity
+        self.counts = dict(seed or {})
+
+    def add(self, value):
+        if value in self.counts:
+            self.counts[value] += 1
+        elif len(self.counts) < self.capacity:
+            self.counts[value] = 1
+        else:
+            # 모든 슬롯을 1씩 줄이고 0이 된 값은 버림 (슬롯 수만큼 추가될 때 한 번꼴)
+            self.counts = {v: n - 1 for v, n in self.counts.items() if n > 1}
+
+    def most_common(self, n=TOP_VALUES):
+        return sorted(self.counts.items(), key=lambda item: (-item[1], str(item[0])))[:n]
+
+
+class ColumnSummary:
+    """컬럼 하나의 누적 통계"""
+
+    def __init__(self, name, kind):
+        self.name = name
+        self.kind = kind
+        self.count = 0
+        self.missing = 0
+        self.total = 0
+        self.minimum = None
+        self.maximum = None
+        self.exact = Counter()   # 고유값이 DISTINCT_LIMIT 이하인 동안 정확한 개수
+        self.top = None          # 넘으면 TopCounter로 전환
+
+    def add(self, value):
+        self.count += 1
+        if value is None or value == '':
+            self.missing += 1
+            return
+        if self.kind == "int":
+            self.total += value
+        if self.kind in ("int", "date"):
+            if self.minimum is None or value < self.minimum:
+                self.minimum = value
+            if self.maximum is None or value > self.maximum:
+                self.maximum = value
+            return
+        if self.top is not None:
+            self.top.add(value)
+            return
+        self.exact[value] += 1
+        if len(self.exact) > DISTINCT_LIMIT:
+            self.top = TopCounter(seed=self.exact.most_common(TRACKED_VALUES))
+            self.exact = None
+
+    def render(self):
+        filled = self.count - self.missing
+        missing = f", 빈 값 {self.missing:,}" if self.missing else ""
+        if self.kind == "int":
+            if not filled:
+                return f"- {self.name}: 정수, 값 없음"
+            return (f"- {self.name}: 정수 {self.minimum:,}~{self.maximum:,}, 합계 {self.total:,}, "
+                    f"평균 {self.total / filled:,.1f}{missing}")
+        if self.kind == "date":
+            if not filled:
+                return f"- {self.name}: 날짜, 값 없음"
+            return f"- {self.name}: 날짜 {self.minimum.isoformat()} ~ {self.maximum.isoformat()}{missing}"
+        if self.top is None:
+            distinct = f"{len(self.exact):,}개"
+            top, label = self.exact.most_common(TOP_VALUES), "상위"
+        else:
+            distinct = f"{DISTINCT_LIMIT:,}개 이상"
+            top, label = self.top.most_common(), "상위(추정)"
+        top = [(value, n) for value, n in top if n > 1]
+        top_text = f", {label}: " + ", ".join(f"{value}({n:,})" for value, n in top) if top else ""
+        return f"- {self.name}: 고유값 {distinct}{missing}{top_text}"
+
+
+class TableSummary:
+    """파일 하나의 컬럼별 요약 (행 수와 무관하게 출력 크기 일정)"""
+
+    def __init__(self, key, columns):
+        self.key = key
+        self.rows = 0
+        self.columns = [ColumnSummary(name, kind) for name, kind in columns]
+
+    def add(self, row):
+        self.rows += 1
+        for column in self.columns:
+            column.add(row.get(column.name))
+
+    def render(self):
+        lines = [f"# 전체 통계 ({self.rows:,}행)"]
+        lines.extend(column.render() for column in self.columns)
+        return '\n'.join(lines)
@@ -0,0 +1,7 @@
+"""
+scripts/ 모듈 단위 테스트 (표준 라이브러리 unittest)
+
+사용법 (scripts/ 에서):
+    python -m unittest                  # 전체
+    python -m unittest tests.test_scheduler -v
+"""
@@ -0,0 +1,15 @@
+import unittest
+
+from build_offline import script_safe
+
+
+class ScriptSafeTest(unittest.TestCase):
+    def test_only_closing_tags_are_escaped(self):
+        vendor = 'var re = /<\\/?[a-z]+>/g;\nvar t = `\n// 템플릿 안의 주석 같은 줄\n</div>`;\n'
+        self.assertEqual(script_safe(vendor), vendor)
+        self.assertEqual(script_safe('s = "</script>";'), 's = "<\\/script>";')
+        self.assertEqual(script_safe('/* </STYLE> */'), '/* <\\/STYLE> */')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+
+from csv_schema import SCHEMAS, extract_csv_block, parse_csv_text, parse_response, validate_rows
+
+STRATEGIES = SCHEMAS['01_executive/01_strategies.csv']
+CHART_KPI = SCHEMAS['03_charts/01_kpi_cards.csv']
+
+
+class ParseCsvTextTest(unittest.TestCase):
+    def test_quoted_commas_and_escaped_quotes(self):
+        text = ('id,icon,title,description,details\n'
+                '1,🎯,"체험판, 데모 집중","""첫날"" 10위권 진입",a|b\n')
+        rows, stats = parse_csv_text(text, STRATEGIES)
+        self.assertEqual(rows[0]['title'], '체험판, 데모 집중')
+        self.assertEqual(rows[0]['description'], '"첫날" 10위권 진입')
+        self.assertEqual((stats.repaired, stats.rejected), (0, 0))
+
+    def test_unquoted_comma_in_text_column_is_rejoined(self):
+        text = ('id,icon,title,description,details\n'
+                '1,🎯,전략,체험판이 효과적, 전환율 높음,a|b\n')
+        rows, stats = parse_csv_text(text, STRATEGIES)
+        self.assertEqual(rows[0]['description'], '체험판이 효과적, 전환율 높음')
+        self.assertEqual(rows[0]['details'], 'a|b')
+        self.assertEqual(stats.repaired, 1)
+
+    def test_ragged_rows(self):
+        text = ('id,icon,title,description,details\n'
+                '1,🎯,짧은 행,설명\n'                 # 끝의 빈 값 누락 → 채움
+                '2,🚀,긴 행,설명,a|b,,\n'             # 끝의 빈 값 초과 → 버림
+                '3,📊\n')                              # 필수 컬럼(title) 없음 → 거부
+        rows, stats = parse_csv_text(text, STRATEGIES)
+        self.assertEqual([row['id'] for row in rows], ['1', '2'])
+        self.assertEqual(rows[0]['details'], '')
+        self.assertEqual((stats.repaired, stats.rejected), (2, 1))
+        self.assertIn('4행', stats.errors[0])   # 헤더 포함 줄 번호
+
+    def test_header_repair_and_column_order(self):
+        text = ' "ID" ,Title,ICON,description,details\n1,전략,🎯,설명,a\n'
+        rows, _ = parse_csv_text(text, STRATEGIES)
+        self.assertEqual(list(rows[0]), STRATEGIES['columns'])
+        self.assertEqual(rows[0]['icon'], '🎯')
+
+    def test_missing_header_is_restored(self):
+        rows, stats = parse_csv_text('1,🎯,전략,설명,a\n2,📊,전략2,설명,b\n', STRATEGIES)
+        self.assertEqual(len(rows), 2)
+        self.assertFalse(stats.missing_columns)
+
+    def test_color_without_hash_is_repaired(self):
+        text = ('id,icon,value,label,description,color\n'
+                '1,📊,150회,총 노출,설명,0047AB\n2,🎮,47개,게임,설명,zz\n3,🏆,3회,1위,설명,#fff\n')
+        rows, stats = parse_csv_text(text, CHART_KPI)
+        self.assertEqual([row['color'] for row in rows], ['#0047AB', '#fff'])
+        self.assertEqual(stats.rejected, 1)
+
+    def test_missing_column_and_too_few_rows_are_problems(self):
+        _, stats = parse_csv_text('id,icon,title\n1,🎯,전략\n', STRATEGIES)
+        self.assertFalse(stats.ok)
+        problems = ' '.join(stats.problems())
+        self.assertIn('description', problems)
+        self.assertIn('최소 3개', problems)
+
+
+class ExtractBlockTest(unittest.TestCase):
+    def test_prefers_csv_fence(self):
+        text = "설명입니다.\n```json\n{}\n```\n```csv\na,b\n1,2\n```\n끝"
+        self.assertEqual(extract_csv_block(text), 'a,b\n1,2')
+
+    def test_any_fence_then_plain_text(self):
+        self.assertEqual(extract_csv_block("```\na,b\n```"), 'a,b')
+        self.assertEqual(extract_csv_block("a,b\n1,2"), 'a,b\n1,2')
+
+    def test_parse_response_reads_fenced_block(self):
+        text = ("다음은 결과입니다.\n```csv\nid,icon,title,description,details\n"
+                "1,🎯,가,설명,a\n2,📊,나,설명,b\n3,🚀,다,설명,c\n```")
+        rows, stats = parse_response(text, STRATEGIES)
+        self.assertTrue(stats.ok)
+        self.assertEqual(len(rows), 3)
+
+
+class ValidateRowsTest(unittest.TestCase):
+    def test_batch_rows(self):
+        rows = [{'id': 1, 'icon': '🎯', 'title': '가', 'description': '설명', 'details': 'a', 'extra': 'x'},
+                {'id': 'two', 'icon': '📊', 'title': '나', 'description': '설명', 'details': 'b'},
+                {'id': 3, 'icon': '🚀', 'title': '', 'description': '설명'}]
+        result, stats = validate_rows(rows, STRATEGIES)
+        self.assertEqual(result, [{'id': '1', 'icon': '🎯', 'title': '가', 'description': '설명', 'details': 'a'}])
+        self.assertEqual(stats.extra_columns, ['extra'])
+        self.assertEqual(stats.rejected, 2)
+        self.assertFalse(stats.ok)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from game_catalog import GameCatalog, normalize_name
+
+
+class GameCatalogTest(unittest.TestCase):
+    def setUp(self):
+        self.catalog = GameCatalog()
+        self.catalog.add("2373990", "나 혼자만 레벨업: 어라이즈", "Solo Leveling: ARISE",
+                         ["나 혼자만 레벨업:어라이즈 오버드라이브"])
+        self.catalog.add("3105890", "PIONER")
+
+    def test_normalize_name(self):
+        self.assertEqual(normalize_name("Solo Leveling: ARISE™"), "sololevelingarise")
+        self.assertEqual(normalize_name("스텔라 블레이드™"), normalize_name("스텔라블레이드"))
+
+    def test_lookup_by_url_id_name_alias(self):
+        for value in ("https://store.steampowered.com/app/2373990/Solo_Leveling/", "2373990",
+                      "나 혼자만 레벨업:어라이즈", "solo leveling arise", "나 혼자만 레벨업:어라이즈 오버드라이브"):
+            self.assertEqual(self.catalog.app_id(value), "2373990", value)
+        self.assertEqual(self.catalog.display_name("https://store.steampowered.com/app/999"), "Game_999")
+        self.assertEqual(self.catalog.display_name(" Dispatch "), "Dispatch")
+
+    def test_conflicting_name_changes_nothing(self):
+        with self.assertRaises(ValueError):
+            self.catalog.add("3105890", "PIONER", aliases=["Solo Leveling ARISE"])
+        self.assertEqual(self.catalog.get("3105890")['aliases'], [])
+        self.assertEqual(self.catalog.app_id("Solo Leveling ARISE"), "2373990")
+        with self.assertRaises(ValueError):
+            self.catalog.add("abc", "잘못된 ID")
+        with self.assertRaises(KeyError):
+            self.catalog.add_alias("1", "없는 게임")
+
+    def test_rename_keeps_old_name_as_alias(self):
+        self.assertEqual(self.catalog.app_id("파이오니어"), None)   # 조회 결과 기억
+        game = self.catalog.add("3105890", "파이오니어")
+        self.assertEqual(game['name'], "파이오니어")
+        self.assertIn("PIONER", game['aliases'])
+        self.assertEqual(self.catalog.app_id("pioner"), "3105890")
+        self.assertEqual(self.catalog.app_id("파이오니어"), "3105890")   # 등록 후 기억 초기화
+
+    def test_resolve_column(self):
+        values = ["나 혼자만 레벨업:어라이즈 오버드라이브", "Dispatch", "dispatch ", "PIONER", "", None]
+        self.assertEqual(self.catalog.resolve_column(values),
+                         ["나 혼자만 레벨업: 어라이즈", "Dispatch", "Dispatch", "PIONER", "", ""])
+        self.assertEqual(self.catalog.app_id_column(values), ["2373990", None, None, "3105890", None, None])
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "catalog.json"
+            self.catalog.save(path)
+            loaded = GameCatalog.load(path)
+            self.assertEqual(loaded.games, self.catalog.games)
+            self.assertEqual(loaded.app_id("Solo Leveling ARISE"), "2373990")
+            self.assertEqual(len(GameCatalog.load(Path(tmp) / "없음.json")), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
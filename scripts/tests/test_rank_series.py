@@ -0,0 +1,62 @@
+import unittest
+from datetime import date, timedelta
+
+from rank_series import RankMatrix
+
+START = date(2025, 6, 1)
+
+
+def log(game, chart_type, ranks, start=0):
+    """ranks[i] = START + start + i일의 순위 (None이면 차트 밖)"""
+    return [(game, chart_type, START + timedelta(days=start + i), rank)
+            for i, rank in enumerate(ranks) if rank is not None]
+
+
+class RankMatrixTest(unittest.TestCase):
+    def test_series_and_streaks(self):
+        matrix = RankMatrix(log('G', 'A', [3, 2, None, 5, 4, 1]))
+        self.assertEqual(matrix.series('G', 'A'), [3, 2, None, 5, 4, 1])
+        metrics = matrix.metrics('A')['G']
+        self.assertEqual(metrics['days_on_chart'], 5)
+        self.assertEqual(metrics['consecutive_days'], 3)
+        self.assertEqual(metrics['current_streak'], 3)
+        self.assertEqual(metrics['first_date'], '2025-06-01')
+        self.assertEqual(metrics['last_date'], '2025-06-06')
+        self.assertEqual(metrics['avg_rank'], 3.0)
+
+    def test_trend_direction(self):
+        entries = (log('up', 'A', [9, 7, 5, 3, 1]) + log('down', 'A', [1, 2, 4, 6, 9])
+                   + log('flat', 'A', [4, 4, 4, 4, 4]) + log('gone', 'A', [1, 1, None, None, None]))
+        metrics = RankMatrix(entries).metrics('A')
+        self.assertEqual(metrics['up']['trend_direction'], '상승')
+        self.assertGreater(metrics['up']['velocity'], 0)
+        self.assertEqual(metrics['down']['trend_direction'], '하락')
+        self.assertLess(metrics['down']['velocity'], 0)
+        self.assertEqual(metrics['flat']['trend_direction'], '유지')
+        self.assertEqual(metrics['flat']['volatility'], 0)
+        self.assertEqual(metrics['gone']['trend_direction'], '하락')
+        self.assertEqual(metrics['gone']['current_streak'], 0)
+
+    def test_charts_ending_on_different_days(self):
+        # 차트 A는 6/1~6/5, 차트 B는 6/10까지 기록
+        entries = log('G', 'A', [1, 1, 1, 1, 1]) + log('H', 'B', [2] * 10)
+        matrix = RankMatrix(entries)
+        metrics = matrix.metrics('A')['G']
+        self.assertEqual(metrics['current_streak'], 5)
+        self.assertEqual(metrics['momentum'], 0)
+        self.assertEqual(metrics['trend_direction'], '유지')
+        self.assertEqual(matrix.metrics('B')['H']['current_streak'], 10)
+
+    def test_duplicate_day_keeps_best_rank(self):
+        entries = log('G', 'A', [5]) + log('G', 'A', [2])
+        self.assertEqual(RankMatrix(entries).series('G', 'A'), [2])
+
+    def test_only_games_on_the_chart(self):
+        matrix = RankMatrix(log('G', 'A', [1]) + log('H', 'B', [1]))
+        self.assertEqual(set(matrix.metrics('A')), {'G'})
+        self.assertEqual(matrix.metrics('C'), {})
+        self.assertEqual(RankMatrix([]).metrics('A'), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from run_journal import JOURNAL_NAME, RunJournal
+
+
+class RunJournalTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.output_dir = Path(self.tmp.name)
+        self.path = self.output_dir / JOURNAL_NAME
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_resume_after_truncated_last_line(self):
+        journal = RunJournal(self.output_dir, model="fake")
+        journal.record_done("a.csv", "key-a", "응답 A")
+        journal.record_failed("b.csv", "key-b", "429 RESOURCE_EXHAUSTED")
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write('{"event": "done", "output": "b.csv", "key": "ke')   # 기록 도중 중단
+
+        resumed = RunJournal(self.output_dir, resume=True, model="fake")
+        self.assertTrue(resumed.is_done("a.csv", "key-a"))
+        self.assertEqual(resumed.response("key-a"), "응답 A")
+        self.assertFalse(resumed.is_done("b.csv", "key-b"))
+        self.assertIn("b.csv", resumed.failed)
+        self.assertIsNone(resumed.finished)
+
+        resumed.record_done("b.csv", "key-b", "응답 B")
+        again = RunJournal(self.output_dir, resume=True)
+        self.assertTrue(again.is_done("b.csv", "key-b"))
+        self.assertNotIn("b.csv", again.failed)
+
+    def test_changed_prompt_is_not_done(self):
+        RunJournal(self.output_dir).record_done("a.csv", "old-key", "응답")
+        resumed = RunJournal(self.output_dir, resume=True)
+        self.assertFalse(resumed.is_done("a.csv", "new-key"))
+
+    def test_finish_status_and_fresh_start(self):
+        journal = RunJournal(self.output_dir)
+        journal.record_done("a.csv", "key-a", "응답")
+        journal.finish("partial")
+        self.assertEqual(RunJournal(self.output_dir, resume=True).finished, "partial")
+
+        fresh = RunJournal(self.output_dir)   # --resume 없이 실행하면 새로 시작
+        self.assertFalse(fresh.done)
+        events = [json.loads(line)['event'] for line in self.path.read_text(encoding='utf-8').splitlines()]
+        self.assertEqual(events, ['start'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+
+from scheduler import RateLimiter, SlidingWindow
+
+
+class FakeClock:
+    """sleep()하면 시간이 그만큼 흐르는 가짜 시계"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def max_in_window(times, window=60.0):
+    return max(sum(1 for t in times if start <= t < start + window) for start in times)
+
+
+class RateLimiterTest(unittest.TestCase):
+    def acquire_times(self, limiter, clock, count, tokens=1):
+        times = []
+        for _ in range(count):
+            limiter.acquire(tokens)
+            times.append(clock.now)
+        return times
+
+    def test_rpm_holds_in_every_60_second_window(self):
+        clock = FakeClock()
+        limiter = RateLimiter(rpm=15, tpm=None, clock=clock, sleep=clock.sleep)
+        times = self.acquire_times(limiter, clock, 100)
+        self.assertLessEqual(max_in_window(times), 15)
+        self.assertLessEqual(sum(1 for t in times if t < 60), 15)
+
+    def test_no_burst_after_idle(self):
+        clock = FakeClock()
+        limiter = RateLimiter(rpm=15, tpm=None, clock=clock, sleep=clock.sleep)
+        times = self.acquire_times(limiter, clock, 20)
+        clock.now += 45   # 쉬었다가 다시 보냄
+        times += self.acquire_times(limiter, clock, 40)
+        self.assertLessEqual(max_in_window(times), 15)
+
+    def test_tpm_limits_large_prompts(self):
+        clock = FakeClock()
+        limiter = RateLimiter(rpm=None, tpm=10_000, clock=clock, sleep=clock.sleep)
+        times = self.acquire_times(limiter, clock, 10, tokens=4_000)
+        for start in times:
+            used = sum(4_000 for t in times if start <= t < start + 60)
+            self.assertLessEqual(used, 10_000)
+
+    def test_pause_delays_everyone(self):
+        clock = FakeClock()
+        limiter = RateLimiter(rpm=100, tpm=None, clock=clock, sleep=clock.sleep)
+        limiter.pause(30)
+        limiter.acquire()
+        self.assertGreaterEqual(clock.now, 30)
+
+
+class SlidingWindowTest(unittest.TestCase):
+    def test_wait_until_oldest_leaves_window(self):
+        clock = FakeClock()
+        window = SlidingWindow(2, clock=clock)
+        window.take(1)
+        clock.now = 10
+        window.take(1)
+        clock.now = 20
+        self.assertEqual(window.wait_time(1), 40)
+        clock.now = 60
+        self.assertEqual(window.wait_time(1), 0)
+
+    def test_amount_over_limit_is_capped(self):
+        clock = FakeClock()
+        window = SlidingWindow(5, clock=clock)
+        self.assertEqual(window.wait_time(50), 0)
+        window.take(50)
+        self.assertEqual(window.wait_time(1), 60)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+
+from snf_stats import merge_rows
+
+TRENDING = [
+    {'rank': 1, 'name': 'PIONER', 'appearances': 4, 'best_rank': 1, 'trend_direction': '상승', 'notes': ''},
+    {'rank': 2, 'name': 'Dispatch', 'appearances': 3, 'best_rank': 2, 'trend_direction': '유지', 'notes': ''},
+]
+LANGUAGES = [
+    {'support_type': 'interface', 'rank': 1, 'language': '영어', 'game_count': 50, 'percentage': '100%',
+     'priority': '필수', 'note': ''},
+]
+
+
+class MergeRowsTest(unittest.TestCase):
+    def test_local_numbers_win_and_notes_fill(self):
+        llm_rows = [{'rank': '9', 'name': 'PIONER', 'appearances': '99', 'best_rank': '1',
+                     'trend_direction': '하락', 'notes': '6일 연속 상위권'}]
+        merged = merge_rows(TRENDING, llm_rows, ['name'])
+        self.assertEqual(merged[0]['rank'], 1)
+        self.assertEqual(merged[0]['appearances'], 4)
+        self.assertEqual(merged[0]['trend_direction'], '상승')
+        self.assertEqual(merged[0]['notes'], '6일 연속 상위권')
+        self.assertEqual(merged[1]['notes'], '')
+
+    def test_unmatched_numeric_rows_are_dropped(self):
+        llm_rows = [{'rank': '1', 'name': 'Jump Ship', 'appearances': '5', 'best_rank': '1',
+                     'trend_direction': '상승', 'notes': '예시 행'}]
+        merged = merge_rows(TRENDING, llm_rows, ['name'])
+        self.assertEqual([row['name'] for row in merged], ['PIONER', 'Dispatch'])
+
+    def test_only_allowed_extra_rows_are_kept(self):
+        llm_rows = [
+            {'support_type': 'interface', 'rank': '8', 'language': '태국어', 'game_count': '7', 'note': '지어낸 값'},
+            {'support_type': 'strategy', 'rank': '인디', 'language': '영어+중국어+한국어', 'game_count': '3',
+             'priority': '최소 필수'},
+        ]
+        merged = merge_rows(LANGUAGES, llm_rows, ['support_type', 'language'],
+                            extra_rows={'support_type': ['strategy']})
+        self.assertEqual([(row['support_type'], row['language']) for row in merged],
+                         [('interface', '영어'), ('strategy', '영어+중국어+한국어')])
+        self.assertEqual(merge_rows(LANGUAGES, llm_rows, ['support_type', 'language']), LANGUAGES)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,85 +2,61 @@
 """
 SNF 대시보드 데이터 검증 및 CSV 생성 스크립트
 원본 CSV 데이터를 분석하여 정확한 통계 생성
+
+    python verify_and_generate.py                                   # github_data/raw 기준
+    python verify_and_generate.py --festival 2025-06                # 축제 기록 저장소 기준
+    python verify_and_generate.py --festival 2025-06 --festival 2025-10   # 축제 간 비교 (CSV 생성 안 함)
 """
 
+import argparse
 import csv
 import os
-from collections import Counter
+import sys
+
+# scripts/snf_stats.py 공유 (generate_insights.py와 같은 계산 사용)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "scripts"))
+import snf_dataset
+import snf_stats
+from festival_store import FestivalStore
 
-BASE_DIR = r"c:\Users\miyeun\2025년 6월 SNF 조사"
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 RAW_DIR = os.path.join(BASE_DIR, "github_data", "raw")
 OUTPUT_DIR = os.path.join(BASE_DIR, "github_data")
+STORE_PATH = os.path.join(BASE_DIR, "github_data", "history.sqlite")
+FESTIVAL = None  # 지정하면 RAW_DIR 대신 축제 기록 저장소에서 로드
 
 # ============================================================
 # 1. 원본 데이터 로드
 # ============================================================
 
+_dataset = None
+
+
+def load_raw_tables():
+    """원본 CSV 8개를 한 번만 읽어 Table로 보관 (generate_insights.py와 같은 로더)"""
+    global _dataset
+    if _dataset is None:
+        if FESTIVAL:
+            with FestivalStore(STORE_PATH) as store:
+                _dataset = store.load_dataset(FESTIVAL)
+        else:
+            _dataset = snf_dataset.load_dataset(RAW_DIR)
+    return _dataset
+
+
 def load_top10_evaluation():
     """TOP10 게임 종합 평가 로드"""
-    file_path = os.path.join(RAW_DIR, "TOP10 게임 종합 평가 215dadb56b2f80ccac70c9987aa5ea5c.csv")
-    games = []
-    with open(file_path, 'r', encoding='utf-8-sig') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            if row.get('랭킹') == '*참고':
-                continue
-            
-            before = row.get('참여 전 찜 수(GDCo) ', '0').replace(',', '').strip()
-            after = row.get('참여 후 찜 수(GDCo)', '0').replace(',', '').strip()
-            
-            before_num = int(before) if before else 0
-            after_num = int(after) if after else 0
-            increase = after_num - before_num
-            pct = (increase / before_num * 100) if before_num > 0 else 0
-            
-            games.append({
-                'rank': int(row.get('랭킹', 0)),
-                'url': row.get('게임명', ''),
-                'review_status': row.get('리뷰 상황', ''),
-                'review_count': row.get('리뷰 수', ''),
-                'review_lang': row.get('리뷰 언어 등록 유저 국적 (좌측부터 비중 높음)', ''),
-                'wishlist_before': before_num,
-                'wishlist_after': after_num,
-                'wishlist_increase': increase,
-                'wishlist_pct': pct
-            })
-    return games
+    return snf_stats.normalize_top10_evaluation(load_raw_tables()['top10_evaluation'])
 
 
 def load_top50_games():
     """TOP50 게임 로드"""
-    file_path = os.path.join(RAW_DIR, "가장 많이 플레이한 TOP50 게임 215dadb56b2f807da72ccd2272f6d889.csv")
-    games = []
-    with open(file_path, 'r', encoding='utf-8-sig') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            games.append({
-                'rank': int(row.get('순위', 0)),
-                'url': row.get('게임명', ''),
-                'demo': row.get('DEMO페이지 접속(6/17기준)(', ''),
-                'multiplayer': row.get('멀티 플레이', ''),
-                'genre': row.get('장르', ''),
-                'release': row.get('정식 출시일', ''),
-                'chart_count': row.get('차트인 횟수', '')
-            })
-    return games
+    return snf_stats.normalize_top50_games(load_raw_tables()['top50_games'])
 
 
 def load_chart_data():
     """3종 차트 데이터 로드"""
-    file_path = os.path.join(RAW_DIR, "전체 장르 - 각 게임별 SNF기간 3종 차트인 횟수 215dadb56b2f80cd97edca2349184566.csv")
-    entries = []
-    with open(file_path, 'r', encoding='utf-8-sig') as f:  # utf-8-sig로 BOM 처리
-        reader = csv.DictReader(f)
-        for row in reader:
-            entries.append({
-                'game': row.get('게임명', ''),
-                'date': row.get('날짜', ''),
-                'rank': int(row.get('랭킹', 0)) if row.get('랭킹', '').isdigit() else 0,
-                'chart_type': row.get('차트 구분', '')
-            })
-    return entries
+    return snf_stats.normalize_chart_entries(load_raw_tables()['chart_integration'])
 
 
 # ============================================================
@@ -89,69 +65,7 @@ def load_chart_data():
 
 def calculate_stats():
     """모든 통계 계산"""
-    top10_eval = load_top10_evaluation()
-    top50_games = load_top50_games()
-    chart_data = load_chart_data()
-    
-    # TOP 10 상세 (TOP 50에서 상위 10개)
-    top10_from_50 = [g for g in top50_games if g['rank'] <= 10]
-    
-    stats = {}
-    
-    # TOP 10 통계
-    stats['top10_multi'] = len([g for g in top10_from_50 if g['multiplayer'] == '멀티플레이'])
-    stats['top10_single'] = len([g for g in top10_from_50 if g['multiplayer'] == '싱글 플레이'])
-    stats['top10_demo'] = len([g for g in top10_from_50 if g['demo'] == '가능'])
-    stats['top10_no_demo'] = len([g for g in top10_from_50 if g['demo'] == '불가능'])
-    
-    # TOP 10 리뷰 통계
-    positive_reviews = [g for g in top10_eval if '긍정' in g['review_status']]
-    stats['top10_positive_review'] = len(positive_reviews)
-    
-    # TOP 10 간체 중국어
-    chinese_games = [g for g in top10_eval if '간체' in g.get('review_lang', '')]
-    stats['top10_chinese'] = len(chinese_games)
-    
-    # TOP 10 찜 수 통계
-    stats['top10_total_wishlist_increase'] = sum(g['wishlist_increase'] for g in top10_eval)
-    stats['top10_avg_wishlist_increase'] = stats['top10_total_wishlist_increase'] // 10
-    
-    # TOP 10 차트인 횟수 평균
-    chart_counts = []
-    for g in top10_from_50:
-        if g['chart_count'] and g['chart_count'].isdigit():
-            chart_counts.append(int(g['chart_count']))
-    stats['top10_avg_chart_count'] = sum(chart_counts) / len(chart_counts) if chart_counts else 0
-    
-    # TOP 50 통계
-    stats['top50_multi'] = len([g for g in top50_games if g['multiplayer'] == '멀티플레이'])
-    stats['top50_demo'] = len([g for g in top50_games if g['demo'] == '가능'])
-    stats['top50_total'] = len(top50_games)
-    
-    # 장르 분포
-    genres = Counter([g['genre'] for g in top50_games])
-    stats['genres'] = genres.most_common(10)
-    
-    # 차트 데이터 통계
-    stats['chart_total_entries'] = len(chart_data)
-    chart_types = Counter([e['chart_type'] for e in chart_data])
-    stats['chart_types'] = dict(chart_types)
-    
-    # 게임별 차트인 횟수
-    game_chart_counts = Counter([e['game'] for e in chart_data])
-    stats['top_chart_games'] = game_chart_counts.most_common(10)
-    
-    # 각 차트별 1위 기록
-    for game_name, count in game_chart_counts.most_common(5):
-        game_entries = [e for e in chart_data if e['game'] == game_name]
-        first_places = {}
-        for ct in ['인기 체험판', '인기 출시 예정 게임', '떠오르는 출시 예정 게임']:
-            first_count = len([e for e in game_entries if e['chart_type'] == ct and e['rank'] == 1])
-            if first_count > 0:
-                first_places[ct] = first_count
-        stats[f'first_places_{game_name}'] = first_places
-    
-    return stats
+    return snf_stats.compute_stats(load_top10_evaluation(), load_top50_games(), load_chart_data())
 
 
 # ============================================================
@@ -205,6 +119,8 @@ def print_verification():
 
 def generate_csv_files(stats):
     """정확한 통계 기반 CSV 파일 생성"""
+    for folder in ("01_executive", "03_charts"):
+        os.makedirs(os.path.join(OUTPUT_DIR, folder), exist_ok=True)
     
     # 1. Executive Summary KPI Cards
     kpi_csv = os.path.join(OUTPUT_DIR, "01_executive", "02_kpi_cards.csv")
@@ -276,7 +192,54 @@ def generate_csv_files(stats):
 # 실행
 # ============================================================
 
+def compare_festivals(festivals):
+    """여러 축제의 핵심 통계를 나란히 출력"""
+    global FESTIVAL, _dataset
+    rows = [
+        ("TOP 10 멀티플레이", 'top10_multi', "{}개"),
+        ("TOP 10 체험판", 'top10_demo', "{}개"),
+        ("TOP 10 긍정 리뷰", 'top10_positive_review', "{}개"),
+        ("총 찜 수 증가", 'top10_total_wishlist_increase', "{:,}"),
+        ("평균 차트인 횟수", 'top10_avg_chart_count', "{:.1f}회"),
+        ("TOP 50 멀티플레이", 'top50_multi', "{}개"),
+        ("TOP 50 체험판", 'top50_demo', "{}개"),
+        ("총 차트 노출", 'chart_total_entries', "{}회"),
+    ]
+    all_stats = {}
+    for festival in festivals:
+        FESTIVAL, _dataset = festival, None
+        all_stats[festival] = calculate_stats()
+
+    print("=" * 60)
+    print("📊 SNF 축제 간 비교")
+    print("=" * 60)
+    print(f"{'':<18}" + "".join(f"{f:>14}" for f in festivals))
+    for label, key, fmt in rows:
+        print(f"{label:<18}" + "".join(f"{fmt.format(all_stats[f][key]):>14}" for f in festivals))
+    print("\n[최다 차트인 게임]")
+    for festival in festivals:
+        top = all_stats[festival]['top_chart_games'][:1]
+        print(f"  {festival}: {f'{top[0][0]} ({top[0][1]}회)' if top else '-'}")
+    return all_stats
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="SNF 대시보드 데이터 검증 및 CSV 생성")
+    parser.add_argument("--raw-dir", default=RAW_DIR, help="노션 CSV 폴더")
+    parser.add_argument("--output-dir", default=OUTPUT_DIR, help="CSV 저장 위치")
+    parser.add_argument("--festival", action="append", default=[],
+                        help="축제 기록 저장소의 축제 이름 (두 개 이상이면 비교만 출력)")
+    parser.add_argument("--store", default=STORE_PATH, help="축제 기록 저장소 위치")
+    return parser.parse_args(argv)
+
+
 if __name__ == "__main__":
+    args = parse_args()
+    RAW_DIR, OUTPUT_DIR, STORE_PATH = args.raw_dir, args.output_dir, args.store
+    if len(args.festival) > 1:
+        compare_festivals(args.festival)
+        sys.exit(0)
+    FESTIVAL = args.festival[0] if args.festival else None
     stats = print_verification()
     print("\n" + "=" * 60)
     print("CSV 파일 생성 중...")